@@ -5,12 +5,20 @@ import google.cloud.bigquery.dbapi
 import turu.core.cursor
 import turu.core.mock
 import turu.core.tag
-from typing_extensions import Never, deprecated, override
+from typing_extensions import Never, Unpack, deprecated, override
 
 Parameter = Union[Mapping[str, Any], Sequence[Any]]
 
 
+def quote_identifier(name: str) -> str:
+    """Quote `name` as a BigQuery identifier, `` `name` ``."""
+
+    return "`" + name.replace("\\", "\\\\").replace("`", "\\`") + "`"
+
+
 class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]):
+    _quote_identifier = staticmethod(quote_identifier)
+
     def __init__(
         self,
         cursor: google.cloud.bigquery.dbapi.Cursor,
@@ -19,6 +27,7 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
     ):
         self._raw_cursor = cursor
         self._row_type: Optional[Type[turu.core.cursor.GenericRowType]] = row_type
+        self._map_options: turu.core.cursor.ResolvedMapOptions = {}
 
     @property
     def rowcount(self) -> int:
@@ -49,6 +58,11 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
         self._raw_cursor.arraysize
         raise NotImplementedError()
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     def close(self) -> None:
         self._raw_cursor.close()
@@ -62,6 +76,7 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
     ) -> "Cursor[Tuple[Any]]":
         self._raw_cursor.execute(operation, parameters)
         self._row_type = None
+        self._map_options = {}
 
         return cast(Cursor, self)
 
@@ -74,6 +89,7 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
     ) -> "Cursor[Tuple[Any]]":
         self._raw_cursor.executemany(operation, seq_of_parameters)
         self._row_type = None
+        self._map_options = {}
 
         return cast(Cursor, self)
 
@@ -84,9 +100,13 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
         operation: str,
         parameters: "Optional[Parameter]" = None,
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "Cursor[turu.core.cursor.GenericNewRowType]":
         self._raw_cursor.execute(operation, parameters)
         self._row_type = cast(Type[turu.core.cursor.GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            options, self._raw_cursor.description
+        )
 
         return cast(Cursor, self)
 
@@ -97,9 +117,13 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
         operation: str,
         seq_of_parameters: Union[Sequence[Mapping[str, Any]], Sequence[Any]],
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "Cursor[turu.core.cursor.GenericNewRowType]":
         self._raw_cursor.executemany(operation, seq_of_parameters)
         self._row_type = cast(Type[turu.core.cursor.GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            options, self._raw_cursor.description
+        )
 
         return cast(Cursor, self)
 
@@ -128,7 +152,7 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
             return None
 
         elif self._row_type is not None:
-            return _map_row(self._row_type, row)
+            return _map_row(self._row_type, row, **self._map_options)
 
         else:
             return tuple(row)  # type: ignore[return-value]
@@ -137,16 +161,21 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
     def fetchmany(
         self, size: Optional[int] = None
     ) -> List[turu.core.cursor.GenericRowType]:
-        return [
-            _map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchmany(
-                size if size is not None else self.arraysize
-            )
-        ]
+        return _map_rows(
+            self._row_type,
+            self._raw_cursor.fetchmany(size if size is not None else self.arraysize),
+            **self._map_options,
+        )
 
     @override
     def fetchall(self) -> List[turu.core.cursor.GenericRowType]:
-        return [_map_row(self._row_type, row) for row in self._raw_cursor.fetchall()]
+        return _map_rows(
+            self._row_type, self._raw_cursor.fetchall(), **self._map_options
+        )
+
+    @override
+    def _fetchmany_raw(self, size: int) -> List[Any]:
+        return self._raw_cursor.fetchmany(size)
 
     @override
     def __next__(self) -> turu.core.cursor.GenericRowType:
@@ -156,7 +185,7 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
             raise StopIteration()
 
         if self._row_type is not None:
-            return _map_row(self._row_type, next_row)
+            return _map_row(self._row_type, next_row, **self._map_options)
 
         else:
             return tuple(next_row)  # type: ignore[return-value]
@@ -165,8 +194,20 @@ class Cursor(turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameter]
 def _map_row(
     row_type: Optional[Type[turu.core.cursor.GenericNewRowType]],
     row: Any,
+    **options: Unpack[turu.core.cursor.ResolvedMapOptions],
 ) -> turu.core.cursor.GenericNewRowType:
     if row_type is None:
         return tuple(row)  # type: ignore[return-value]
     else:
-        return turu.core.cursor.map_row(row_type, row)
+        return turu.core.cursor.map_row(row_type, row, **options)
+
+
+def _map_rows(
+    row_type: Optional[Type[turu.core.cursor.GenericNewRowType]],
+    rows: Sequence[Any],
+    **options: Unpack[turu.core.cursor.ResolvedMapOptions],
+) -> List[turu.core.cursor.GenericNewRowType]:
+    if row_type is None:
+        return [tuple(row) for row in rows]  # type: ignore[misc]
+    else:
+        return turu.core.cursor.map_rows(row_type, rows, **options)
@@ -0,0 +1,156 @@
+import datetime
+import types
+import typing
+from dataclasses import is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, cast
+
+from turu.core._columnar import resolve_columns
+from turu.core.features import USE_PYDANTIC, PydanticModel
+
+
+class ArrowBatchBuilder:
+    """Build `pyarrow.RecordBatch`es column-wise from chunks of rows.
+
+    The column names come from the rows or `description`,
+    and the column types from the annotations of `row_type` when the raw values fit them.
+    The other column types are inferred from the first chunk with non-null values,
+    and kept for the following chunks.
+    """
+
+    def __init__(
+        self,
+        description: Optional[Sequence[Sequence[Any]]],
+        row_type: Optional[Type[Any]] = None,
+    ) -> None:
+        import pyarrow  # type: ignore[import]
+
+        self._pyarrow = pyarrow
+        self._description = description
+        self._annotated_types = (
+            _get_arrow_types(row_type) if row_type is not None else {}
+        )
+        self._names: Optional[Tuple[str, ...]] = None
+        self._types: List[Any] = []
+        self._to_values: Optional[Callable[[Any], Sequence[Any]]] = None
+
+    def build(self, rows: Sequence[Any]) -> Any:
+        """Convert a non-empty chunk of rows to a `pyarrow.RecordBatch`."""
+
+        pyarrow = self._pyarrow
+
+        if self._names is None:
+            self._names, self._to_values = resolve_columns(rows[0], self._description)
+            self._types = [self._annotated_types.get(name) for name in self._names]
+
+        if self._to_values is not None:
+            rows = list(map(self._to_values, rows))
+
+        arrays = []
+        for index, values in enumerate(zip(*rows)):
+            try:
+                column = pyarrow.array(values, type=self._types[index])
+
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # NOTE: The raw values do not always follow the annotations of row_type.
+                column = pyarrow.array(values)
+
+            if column.type != pyarrow.null():
+                self._types[index] = column.type
+
+            arrays.append(column)
+
+        return pyarrow.RecordBatch.from_arrays(arrays, names=list(self._names))
+
+    def to_table(self, batches: Sequence[Any]) -> Any:
+        """Concatenate the batches built by this builder into a `pyarrow.Table`."""
+
+        pyarrow = self._pyarrow
+
+        if not batches:
+            return self._empty_table()
+
+        if all(batch.schema == batches[0].schema for batch in batches):
+            return pyarrow.Table.from_batches(batches)
+
+        # NOTE: Columns inferred as null in the leading chunks are promoted here.
+        tables = [pyarrow.Table.from_batches([batch]) for batch in batches]
+        if _get_major_version(pyarrow) < 14:
+            # NOTE: `promote_options` replaced `promote` in pyarrow 14.
+            return pyarrow.concat_tables(tables, promote=True)
+
+        return pyarrow.concat_tables(tables, promote_options="default")
+
+    def _empty_table(self) -> Any:
+        pyarrow = self._pyarrow
+
+        if self._description is None:
+            return pyarrow.table({})
+
+        return pyarrow.schema(
+            [
+                (name, self._annotated_types.get(name) or pyarrow.null())
+                for name in (column[0] for column in self._description)
+            ]
+        ).empty_table()
+
+
+def _get_arrow_types(row_type: Type[Any]) -> Dict[str, Any]:
+    """Map the fields of `row_type` to Arrow types, skipping unknown annotations."""
+
+    import pyarrow  # type: ignore[import]
+
+    if USE_PYDANTIC and issubclass(row_type, PydanticModel):
+        annotations = {
+            name: field.annotation
+            for name, field in cast(PydanticModel, row_type).model_fields.items()
+        }
+
+    elif is_dataclass(row_type) or (
+        issubclass(row_type, tuple) and hasattr(row_type, "_fields")
+    ):
+        try:
+            annotations = typing.get_type_hints(row_type)
+
+        except (NameError, TypeError):
+            return {}
+
+    else:
+        return {}
+
+    scalar_types = {
+        bool: pyarrow.bool_(),
+        int: pyarrow.int64(),
+        float: pyarrow.float64(),
+        str: pyarrow.string(),
+        bytes: pyarrow.binary(),
+        datetime.date: pyarrow.date32(),
+        datetime.time: pyarrow.time64("us"),
+    }
+
+    arrow_types: Dict[str, Any] = {}
+    for name, annotation in annotations.items():
+        annotation = _unwrap_optional(annotation)
+        if annotation in scalar_types:
+            arrow_types[name] = scalar_types[annotation]
+
+    return arrow_types
+
+
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) in _UNION_TYPES:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+
+    return annotation
+
+
+def _get_major_version(pyarrow: Any) -> int:
+    try:
+        return int(pyarrow.__version__.split(".")[0])
+
+    except ValueError:
+        return 0
@@ -0,0 +1,127 @@
+import array
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from turu.core._row_mapper import get_field_names
+from turu.core.exception import TuruRowTypeNotSupportedError
+from turu.core.features import USE_NUMPY
+
+Column = Union["array.array[Any]", List[Any]]
+
+
+class ColumnsBuilder:
+    """Build a struct-of-arrays from chunks of rows.
+
+    Integer and float columns are stored in typed `array.array`s,
+    and converted to NumPy arrays without copying when NumPy is installed.
+    Other columns, and numeric columns with `NULL`s, are stored in lists.
+    """
+
+    def __init__(self, description: Optional[Sequence[Sequence[Any]]]) -> None:
+        self._description = description
+        self._names: Optional[Tuple[str, ...]] = None
+        self._columns: List[Column] = []
+        self._to_values: Optional[Callable[[Any], Sequence[Any]]] = None
+
+    def extend(self, rows: Sequence[Any]) -> None:
+        """Append a chunk of rows to the columns."""
+
+        if not rows:
+            return
+
+        if self._names is None:
+            self._names, self._to_values = resolve_columns(rows[0], self._description)
+
+        if self._to_values is not None:
+            rows = list(map(self._to_values, rows))
+
+        if not self._columns:
+            self._columns = [_new_column(value) for value in rows[0]]
+
+        for index, values in enumerate(zip(*rows)):
+            self._columns[index] = _extend_column(self._columns[index], values)
+
+    def build(self) -> Dict[str, Any]:
+        """Return the columns by column name."""
+
+        if self._names is None:
+            if self._description is None:
+                return {}
+
+            return {column[0]: [] for column in self._description}
+
+        return {
+            name: _finish_column(column)
+            for name, column in zip(self._names, self._columns)
+        }
+
+
+def resolve_columns(
+    row: Any, description: Optional[Sequence[Sequence[Any]]]
+) -> Tuple[Tuple[str, ...], Optional[Callable[[Any], Sequence[Any]]]]:
+    """Resolve the column names of the rows like `row`,
+    and the function to get the column values of a row if it is not a sequence.
+
+    Mapped rows are read by the field names of their type,
+    and raw rows are named by `description`.
+    """
+
+    try:
+        names = get_field_names(type(row))
+
+    except TuruRowTypeNotSupportedError:
+        if description is not None:
+            return tuple(column[0] for column in description), None
+
+        return tuple(str(index) for index in range(len(row))), None
+
+    if isinstance(row, tuple):
+        return names, None
+
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+
+        return names, lambda row: (getter(row),)
+
+    return names, attrgetter(*names)
+
+
+def _new_column(value: Any) -> Column:
+    if isinstance(value, bool):
+        return []
+
+    elif isinstance(value, int):
+        return array.array("q")
+
+    elif isinstance(value, float):
+        return array.array("d")
+
+    return []
+
+
+def _extend_column(column: Column, values: Sequence[Any]) -> Column:
+    if isinstance(column, list):
+        column.extend(values)
+
+        return column
+
+    size = len(column)
+    try:
+        column.extend(values)
+
+        return column
+
+    except (TypeError, OverflowError):
+        # NOTE: array.extend appends item by item, so drop the partially appended items.
+        del column[size:]
+
+        return column.tolist() + list(values)
+
+
+def _finish_column(column: Column) -> Any:
+    if USE_NUMPY and isinstance(column, array.array):
+        import numpy  # type: ignore[import]
+
+        return numpy.frombuffer(column, dtype=column.typecode)
+
+    return column
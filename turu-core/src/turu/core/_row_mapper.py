@@ -0,0 +1,506 @@
+import keyword
+import weakref
+from dataclasses import fields, is_dataclass
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
+
+from turu.core.exception import (
+    TuruRowTypeMismatchError,
+    TuruRowTypeNotSupportedError,
+)
+from turu.core.features import USE_PYDANTIC, PydanticModel
+
+MapRow = Callable[[Type[Any], Any], Any]
+MapRows = Callable[[Type[Any], Sequence[Any]], List[Any]]
+
+
+class RowMapper(NamedTuple):
+    """Compiled mappers of a row type.
+
+    The row type is passed on each call instead of being captured,
+    so that a cached mapper never keeps its row type alive.
+    """
+
+    map_row: MapRow
+    """Build an instance of the row type from a raw row."""
+
+    map_rows: MapRows
+    """Build instances of the row type from raw rows."""
+
+
+Fields = Tuple[Tuple[str, int], ...]
+"""Pairs of a field name and the index of its column in a raw row."""
+
+
+_ROW_MAPPERS: "weakref.WeakKeyDictionary[type, Dict[Tuple[Any, ...], RowMapper]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_row_mapper(
+    row_type: Type[Any],
+    *,
+    validate: bool = True,
+    columns: Optional[Tuple[str, ...]] = None,
+    lazy: bool = False,
+) -> RowMapper:
+    """Return the mapper of `row_type`, compiling it on first use.
+
+    When `columns` is given, the fields are matched to the columns by name,
+    and the mapper is cached per columns.
+    When `lazy` is `True`, the mapper returns `LazyRow` proxies of `row_type`.
+
+    The cache is keyed weakly on `row_type`,
+    so mappers of row types defined in a local scope are evicted with them.
+    """
+
+    try:
+        mappers = _ROW_MAPPERS[row_type]
+
+    except KeyError:
+        mappers = _ROW_MAPPERS[row_type] = {}
+
+    key = (validate, columns, lazy)
+    try:
+        return mappers[key]
+
+    except KeyError:
+        if lazy:
+            mapper = _compile_lazy_mapper(
+                row_type,
+                columns,
+                get_row_mapper(row_type, validate=validate, columns=columns),
+            )
+
+        else:
+            mapper = _compile_row_mapper(row_type, validate=validate, columns=columns)
+
+        mappers[key] = mapper
+
+        return mapper
+
+
+class LazyRow:
+    """A proxy of a row type over a raw row.
+
+    The fields are read from the raw row without copying,
+    and the row type is built only when `materialize()` is called or a field is written.
+    Until then, the fields are the raw column values without validation.
+    """
+
+    __slots__ = ("_row_type", "_row", "_materialized")
+
+    _map_row: MapRow
+
+    def __init__(self, row_type: Type[Any], row: Any) -> None:
+        self._row_type = row_type
+        self._row = row
+        self._materialized: Any = None
+
+    def materialize(self) -> Any:
+        """Build the instance of the row type."""
+
+        if self._materialized is None:
+            self._materialized = self._map_row(self._row_type, self._row)
+
+        return self._materialized
+
+    def __repr__(self) -> str:
+        return f"LazyRow({self.materialize()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyRow):
+            other = other.materialize()
+
+        return self.materialize() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def get_field_names(row_type: Type[Any]) -> Tuple[str, ...]:
+    """Return the field names of `row_type` in the order that its columns are mapped."""
+
+    if is_dataclass(row_type):
+        return tuple(row_type.__dataclass_fields__.keys())
+
+    elif issubclass(row_type, tuple) and hasattr(row_type, "_fields"):
+        return tuple(row_type._fields)
+
+    elif USE_PYDANTIC and issubclass(row_type, PydanticModel):
+        return tuple(cast(PydanticModel, row_type).model_fields.keys())
+
+    raise TuruRowTypeNotSupportedError(row_type)
+
+
+def _compile_row_mapper(
+    row_type: Type[Any], *, validate: bool, columns: Optional[Tuple[str, ...]]
+) -> RowMapper:
+    if is_dataclass(row_type):
+        keys = tuple(row_type.__dataclass_fields__.keys())
+        fields = _match_fields(keys, columns)
+        positional = columns is None
+        map_row, map_rows = _compile_keyword_mapper(keys, fields, positional)
+
+        if _is_positional_dataclass(row_type) and len(fields) == len(keys):
+            map_rows = _compile_columnwise_mapper(fields, positional, map_rows)
+
+        return RowMapper(map_row, map_rows)
+
+    elif issubclass(row_type, tuple):
+        if columns is None or not hasattr(row_type, "_fields"):
+            return RowMapper(_map_tuple, _map_tuples)
+
+        keys = tuple(row_type._fields)
+
+        return RowMapper(
+            *_compile_keyword_mapper(keys, _match_fields(keys, columns), False)
+        )
+
+    elif USE_PYDANTIC and issubclass(row_type, PydanticModel):
+        keys = tuple(cast(PydanticModel, row_type).model_fields.keys())
+        fields = _match_fields(keys, columns)
+        positional = columns is None
+
+        if not validate:
+            return RowMapper(
+                *_compile_pydantic_construct_mapper(row_type, keys, fields, positional)
+            )
+
+        map_row, map_rows = _compile_keyword_mapper(keys, fields, positional)
+
+        if row_type.__init__ is PydanticModel.__init__:
+            map_rows = _compile_pydantic_batch_mapper(
+                keys, fields, positional, map_rows
+            )
+
+        return RowMapper(map_row, map_rows)
+
+    return RowMapper(_map_mismatch, _map_mismatches)
+
+
+def _match_fields(keys: Tuple[str, ...], columns: Optional[Tuple[str, ...]]) -> Fields:
+    """Resolve the column index of each field.
+
+    Without `columns`, the fields are matched by position.
+    Otherwise each field is matched to the first column of the same name,
+    falling back to a case-insensitive match. Unused columns are skipped,
+    and fields without a column are left to their defaults.
+    """
+
+    if columns is None:
+        return tuple((key, index) for index, key in enumerate(keys))
+
+    indices: Dict[str, int] = {}
+    folded_indices: Dict[str, int] = {}
+    for index, column in enumerate(columns):
+        indices.setdefault(column, index)
+        folded_indices.setdefault(column.casefold(), index)
+
+    fields: List[Tuple[str, int]] = []
+    for key in keys:
+        if key in indices:
+            fields.append((key, indices[key]))
+
+        elif key.casefold() in folded_indices:
+            fields.append((key, folded_indices[key.casefold()]))
+
+    return tuple(fields)
+
+
+def _compile_lazy_mapper(
+    row_type: Type[Any], columns: Optional[Tuple[str, ...]], eager: RowMapper
+) -> RowMapper:
+    """Generate a `LazyRow` subclass with a property for each field of `row_type`.
+
+    Row types without named fields are mapped eagerly.
+    """
+
+    try:
+        keys = get_field_names(row_type)
+
+    except TuruRowTypeNotSupportedError:
+        return eager
+
+    if not all(
+        key.isidentifier()
+        and not keyword.iskeyword(key)
+        and not key.startswith("_")
+        and not hasattr(LazyRow, key)
+        for key in keys
+    ):
+        return eager
+
+    indices = dict(_match_fields(keys, columns))
+    source = ""
+    for key in keys:
+        if key in indices:
+            source += (
+                f"def get_{key}(self):\n"
+                "    materialized = self._materialized\n"
+                "    if materialized is None:\n"
+                f"        return self._row[{indices[key]}]\n"
+                f"    return materialized.{key}\n"
+                "\n"
+            )
+
+        else:
+            source += f"def get_{key}(self):\n    return self.materialize().{key}\n\n"
+
+        source += (
+            f"def set_{key}(self, value):\n    self.materialize().{key} = value\n\n"
+        )
+
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+
+    proxy_type = type(
+        f"Lazy{row_type.__name__}",
+        (LazyRow,),
+        {
+            "__slots__": (),
+            "_map_row": staticmethod(eager.map_row),
+            **{
+                key: property(namespace[f"get_{key}"], namespace[f"set_{key}"])
+                for key in keys
+            },
+        },
+    )
+
+    size = len(keys) if columns is None else 0
+
+    def map_row(cls: Type[Any], row: Any) -> Any:
+        if len(row) < size:
+            return eager.map_row(cls, row)
+
+        return proxy_type(cls, row)
+
+    def map_rows(cls: Type[Any], rows: Sequence[Any]) -> List[Any]:
+        if rows and min(map(len, rows)) < size:
+            return eager.map_rows(cls, rows)
+
+        return [proxy_type(cls, row) for row in rows]
+
+    return RowMapper(map_row, map_rows)
+
+
+def _render_arguments(fields: Fields) -> str:
+    if all(key.isidentifier() and not keyword.iskeyword(key) for key, _ in fields):
+        return ", ".join(f"{key}=row[{index}]" for key, index in fields)
+
+    return f"**{{{_render_items(fields)}}}"
+
+
+def _render_items(fields: Fields) -> str:
+    return ", ".join(f"{key!r}: row[{index}]" for key, index in fields)
+
+
+def _compile_keyword_mapper(
+    keys: Tuple[str, ...], fields: Fields, positional: bool, factory: str = "cls"
+) -> Tuple[MapRow, MapRows]:
+    """Generate `factory(key0=row[index0], key1=row[index1], ...)` for the given fields.
+
+    When the fields are matched by position, rows shorter than the fields
+    are mapped like `zip`, leaving the missing fields to their defaults.
+    """
+
+    arguments = _render_arguments(fields)
+    if positional:
+        source = (
+            "def map_row(cls, row):\n"
+            f"    if len(row) < {len(keys)}:\n"
+            f"        return {factory}(**dict(zip(keys, row)))\n"
+            f"    return {factory}({arguments})\n"
+            "\n"
+            "def map_rows(cls, rows):\n"
+            f"    if rows and min(map(len, rows)) < {len(keys)}:\n"
+            f"        return [{factory}(**dict(zip(keys, row))) for row in rows]\n"
+            f"    return [{factory}({arguments}) for row in rows]\n"
+        )
+
+    else:
+        source = (
+            "def map_row(cls, row):\n"
+            f"    return {factory}({arguments})\n"
+            "\n"
+            "def map_rows(cls, rows):\n"
+            f"    return [{factory}({arguments}) for row in rows]\n"
+        )
+
+    namespace: Dict[str, Any] = {"keys": keys}
+    exec(source, namespace)
+
+    return namespace["map_row"], namespace["map_rows"]
+
+
+def _compile_columnwise_mapper(
+    fields: Fields, positional: bool, fallback: MapRows
+) -> MapRows:
+    """Transpose the rows once and call the constructor with columns in field order."""
+
+    size = len(fields)
+    indices = [index for _, index in fields]
+
+    def map_rows(cls: Type[Any], rows: Sequence[Any]) -> List[Any]:
+        if not rows:
+            return []
+
+        if positional:
+            if min(map(len, rows)) < size:
+                return fallback(cls, rows)
+
+            return list(map(cls, *islice(zip(*rows), size)))
+
+        columns = list(zip(*rows))
+
+        return list(map(cls, *[columns[index] for index in indices]))
+
+    return map_rows
+
+
+def _compile_pydantic_batch_mapper(
+    keys: Tuple[str, ...], fields: Fields, positional: bool, fallback: MapRows
+) -> MapRows:
+    """Validate all rows in one call of a cached `TypeAdapter(List[row_type])`.
+
+    When the batch fails to validate, the rows are mapped one by one again
+    so that the error is the same as the one raised by the per-row path.
+    """
+
+    from pydantic import ValidationError  # type: ignore[import]
+
+    source = "def to_dicts(rows):\n"
+    if positional:
+        source += (
+            f"    if min(map(len, rows)) < {len(keys)}:\n"
+            "        return [dict(zip(keys, row)) for row in rows]\n"
+        )
+    source += f"    return [{{{_render_items(fields)}}} for row in rows]\n"
+
+    namespace: Dict[str, Any] = {"keys": keys}
+    exec(source, namespace)
+    to_dicts = namespace["to_dicts"]
+
+    def map_rows(cls: Type[Any], rows: Sequence[Any]) -> List[Any]:
+        if not rows:
+            return []
+
+        try:
+            return _get_pydantic_list_adapter(cls).validate_python(to_dicts(rows))
+
+        except ValidationError:
+            return fallback(cls, rows)
+
+    return map_rows
+
+
+def _compile_pydantic_construct_mapper(
+    row_type: Type[Any], keys: Tuple[str, ...], fields: Fields, positional: bool
+) -> Tuple[MapRow, MapRows]:
+    """Build pydantic models from trusted rows without validation.
+
+    This is equivalent to `model_construct`, but sets the instance attributes directly
+    for plain models, because `model_construct` itself is slower than validation.
+    """
+
+    if (
+        row_type.__pydantic_root_model__
+        or row_type.__pydantic_post_init__
+        or row_type.model_config.get("extra") == "allow"
+        or len(fields) < len(keys)
+    ):
+        return _compile_keyword_mapper(keys, fields, positional, "cls.model_construct")
+
+    source = "def map_row(cls, row):\n"
+    if positional:
+        source += (
+            f"    if len(row) < {len(keys)}:\n"
+            "        return cls.model_construct(**dict(zip(keys, row)))\n"
+        )
+    source += (
+        "    model = cls.__new__(cls)\n"
+        f"    object_setattr(model, '__dict__', {{{_render_items(fields)}}})\n"
+        "    object_setattr(model, '__pydantic_fields_set__', set(keys))\n"
+        "    object_setattr(model, '__pydantic_extra__', None)\n"
+        "    object_setattr(model, '__pydantic_private__', None)\n"
+        "    return model\n"
+        "\n"
+        "def map_rows(cls, rows):\n"
+        "    return [map_row(cls, row) for row in rows]\n"
+    )
+
+    namespace: Dict[str, Any] = {"keys": keys, "object_setattr": object.__setattr__}
+    exec(source, namespace)
+
+    return namespace["map_row"], namespace["map_rows"]
+
+
+_PYDANTIC_LIST_ADAPTER = "__turu_list_adapter__"
+
+
+def _get_pydantic_list_adapter(row_type: Type[Any]) -> Any:
+    """Return the cached `TypeAdapter(list[row_type])`.
+
+    A `TypeAdapter` references its model, so a weakly keyed cache would keep it alive.
+    Instead, the adapter is stored on the model itself,
+    and the cycle between them is collected with the model.
+    `list[row_type]` is used because `typing.List[row_type]` is cached by `typing`.
+    """
+
+    adapter = row_type.__dict__.get(_PYDANTIC_LIST_ADAPTER)
+    if adapter is None:
+        from pydantic import TypeAdapter  # type: ignore[import]
+
+        adapter = TypeAdapter(list[row_type])  # type: ignore[valid-type]
+        type.__setattr__(row_type, _PYDANTIC_LIST_ADAPTER, adapter)
+
+    return adapter
+
+
+def _is_positional_dataclass(row_type: Type[Any]) -> bool:
+    """Whether the fields of `row_type` are exactly its positional `__init__` parameters.
+
+    A dataclass with its own `__init__` may take its arguments in any order,
+    so it is only mapped by field name.
+    """
+
+    dataclass_fields = fields(row_type)
+
+    return (
+        row_type.__dataclass_params__.init
+        and len(dataclass_fields) > 0
+        and len(dataclass_fields) == len(row_type.__dataclass_fields__)
+        and all(
+            field.init and not getattr(field, "kw_only", False)
+            for field in dataclass_fields
+        )
+    )
+
+
+def _map_tuple(cls: Type[Any], row: Any) -> Any:
+    return cls._make(row)
+
+
+def _map_tuples(cls: Type[Any], rows: Sequence[Any]) -> List[Any]:
+    return list(map(cls._make, rows))
+
+
+def _map_mismatch(cls: Type[Any], row: Any) -> Any:
+    raise TuruRowTypeMismatchError(cls, row.__class__)
+
+
+def _map_mismatches(cls: Type[Any], rows: Sequence[Any]) -> List[Any]:
+    if not rows:
+        return []
+
+    raise TuruRowTypeMismatchError(cls, rows[0].__class__)
@@ -4,7 +4,7 @@ from typing import Any, Optional, Sequence, Tuple, Type
 import turu.core.async_cursor
 from turu.core.protocols.async_connection import AsyncConnectionProtocol
 from turu.core.protocols.async_cursor import Parameters
-from typing_extensions import Never, Self
+from typing_extensions import Never, Self, Unpack
 
 
 class AsyncConnection(AsyncConnectionProtocol):
@@ -81,6 +81,7 @@ class AsyncConnection(AsyncConnectionProtocol):
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[turu.core.async_cursor.MapOptions],
     ) -> turu.core.async_cursor.AsyncCursor[
         turu.core.async_cursor.GenericNewRowType, Parameters
     ]:
@@ -94,12 +95,15 @@ class AsyncConnection(AsyncConnectionProtocol):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
 
-        return await (await self.cursor()).execute_map(row_type, operation, parameters)
+        return await (await self.cursor()).execute_map(
+            row_type, operation, parameters, **options
+        )
 
     async def executemany_map(
         self,
@@ -107,6 +111,7 @@ class AsyncConnection(AsyncConnectionProtocol):
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[turu.core.async_cursor.MapOptions],
     ) -> turu.core.async_cursor.AsyncCursor[
         turu.core.async_cursor.GenericNewRowType, Parameters
     ]:
@@ -119,11 +124,41 @@ class AsyncConnection(AsyncConnectionProtocol):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             seq_of_parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
 
         return await (await self.cursor()).executemany_map(
-            row_type, operation, seq_of_parameters
+            row_type, operation, seq_of_parameters, **options
+        )
+
+    async def select_map(
+        self,
+        row_type: Type[turu.core.async_cursor.GenericNewRowType],
+        from_clause: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[turu.core.async_cursor.MapOptions],
+    ) -> turu.core.async_cursor.AsyncCursor[
+        turu.core.async_cursor.GenericNewRowType, Parameters
+    ]:
+        """Select the fields of `row_type` and map each row to `row_type`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is simply a convenient shortcut to `.cursor().select_map()`.
+
+        Parameters:
+            row_type: The type of the row that will be returned.
+            from_clause: The rest of the query after `FROM`, such as `users WHERE id = ?`.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
+
+        Returns:
+            A cursor that holds a reference to an operation.
+        """
+
+        return await (await self.cursor()).select_map(
+            row_type, from_clause, parameters, **options
         )
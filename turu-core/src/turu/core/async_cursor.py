@@ -1,5 +1,10 @@
 from abc import abstractmethod
 from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
     Generic,
     List,
     Optional,
@@ -9,14 +14,27 @@ from typing import (
 )
 
 import turu.core.tag
+from turu.core._arrow import ArrowBatchBuilder
+from turu.core._columnar import ColumnsBuilder
+from turu.core.cursor import DEFAULT_FETCH_SIZE, quote_identifier, render_select
 from turu.core.cursor import GenericNewRowType as GenericNewRowType
 from turu.core.cursor import GenericRowType as GenericRowType
+from turu.core.cursor import MapOptions as MapOptions
 from turu.core.protocols.async_cursor import AsyncCursorProtocol
 from turu.core.protocols.async_cursor import Parameters as Parameters
-from typing_extensions import Never, Self, override
+from typing_extensions import Never, Self, Unpack, override
+
+if TYPE_CHECKING:
+    from turu.core.features import PyArrowRecordBatch, PyArrowTable
 
 
 class AsyncCursor(Generic[GenericRowType, Parameters], AsyncCursorProtocol[Parameters]):
+    _row_type: Optional[Type[Any]] = None
+    """The row type of the last operation, which is set by the adapters."""
+
+    _quote_identifier: Callable[[str], str] = staticmethod(quote_identifier)
+    """Quotes the field names in `.select_map()`, which is overridden by the dialects."""
+
     @property
     @abstractmethod
     def rowcount(self) -> int: ...
@@ -49,6 +67,7 @@ class AsyncCursor(Generic[GenericRowType, Parameters], AsyncCursorProtocol[Param
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[MapOptions],
     ) -> "AsyncCursor[GenericNewRowType, Parameters]":
         """
         Execute a database operation (query or command) and map each row to a `row_type`.
@@ -57,6 +76,7 @@ class AsyncCursor(Generic[GenericRowType, Parameters], AsyncCursorProtocol[Param
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
@@ -70,6 +90,7 @@ class AsyncCursor(Generic[GenericRowType, Parameters], AsyncCursorProtocol[Param
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[MapOptions],
     ) -> "AsyncCursor[GenericNewRowType, Parameters]":
         """Execute a database operation (query or command) against all parameter sequences or mappings.
 
@@ -77,12 +98,44 @@ class AsyncCursor(Generic[GenericRowType, Parameters], AsyncCursorProtocol[Param
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             seq_of_parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
         ...
 
+    async def select_map(
+        self,
+        row_type: Type[GenericNewRowType],
+        from_clause: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[MapOptions],
+    ) -> "AsyncCursor[GenericNewRowType, Parameters]":
+        """Select the fields of `row_type` and map each row to `row_type`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is a shortcut to `.execute_map()` with the columns derived from `row_type`,
+        so that only the columns that are mapped are scanned and transferred.
+
+        Parameters:
+            row_type: The type of the row that will be returned.
+            from_clause: The rest of the query after `FROM`, such as `users WHERE id = ?`.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
+
+        Returns:
+            A cursor that holds a reference to an operation.
+        """
+
+        return await self.execute_map(
+            row_type,
+            render_select(row_type, from_clause, self._quote_identifier),
+            parameters,
+            **options,
+        )
+
     async def execute_with_tag(
         self,
         tag: Type[turu.core.tag.Tag],
@@ -124,6 +177,104 @@ class AsyncCursor(Generic[GenericRowType, Parameters], AsyncCursorProtocol[Param
     @abstractmethod
     async def fetchall(self) -> List[GenericRowType]: ...
 
+    @property
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        """The columns of the last operation as defined in [PEP 249](https://peps.python.org/pep-0249/).
+
+        This is `None` when no operation has returned rows, or the interface does not provide it.
+        """
+
+        return None
+
+    async def aiter_batches(
+        self, size: Optional[int] = None
+    ) -> AsyncIterator[List[GenericRowType]]:
+        """Iterate over the (remaining) rows in batches of at most `size` mapped rows.
+
+        This is a shortcut to a loop of `.fetchmany()`,
+        which streams a large result set in constant memory.
+
+        Parameters:
+            size: The number of rows per batch.
+                If this parameter is not used, `.arraysize` or a larger default is used.
+        """
+
+        if size is None:
+            size = max(self.arraysize, DEFAULT_FETCH_SIZE)
+
+        while rows := await self.fetchmany(size):
+            yield rows
+
+    async def fetch_columns(self, size: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch all (remaining) rows as a mapping from column name to column values.
+
+        The rows are fetched in chunks of `size` and appended column by column.
+        Integer and float columns are typed `array.array`s,
+        or NumPy arrays when NumPy is installed,
+        and the other columns are lists.
+
+        Parameters:
+            size: The number of rows to fetch per chunk.
+                If this parameter is not used, `.arraysize` or a larger default is used.
+        """
+
+        if size is None:
+            size = max(self.arraysize, DEFAULT_FETCH_SIZE)
+
+        builder = ColumnsBuilder(self.description)
+        while rows := await self._fetchmany_raw(size):
+            builder.extend(rows)
+
+        return builder.build()
+
+    async def fetch_arrow_all(self, size: Optional[int] = None) -> "PyArrowTable":
+        """Fetch all (remaining) rows as a `pyarrow.Table`.
+
+        The rows are fetched in chunks of `size` and converted column-wise,
+        without building the mapped rows. This requires pyarrow.
+
+        Parameters:
+            size: The number of rows to fetch per chunk.
+                If this parameter is not used, `.arraysize` or a larger default is used.
+        """
+
+        if size is None:
+            size = max(self.arraysize, DEFAULT_FETCH_SIZE)
+
+        builder = ArrowBatchBuilder(self.description, self._row_type)
+        batches = []
+        while rows := await self._fetchmany_raw(size):
+            batches.append(builder.build(rows))
+
+        return builder.to_table(batches)
+
+    async def fetch_arrow_batches(
+        self, size: Optional[int] = None
+    ) -> AsyncIterator["PyArrowRecordBatch"]:
+        """Fetch the (remaining) rows as `pyarrow.RecordBatch`es of at most `size` rows.
+
+        This requires pyarrow.
+
+        Parameters:
+            size: The number of rows per batch.
+                If this parameter is not used, `.arraysize` or a larger default is used.
+        """
+
+        if size is None:
+            size = max(self.arraysize, DEFAULT_FETCH_SIZE)
+
+        builder = ArrowBatchBuilder(self.description, self._row_type)
+        while rows := await self._fetchmany_raw(size):
+            yield builder.build(rows)
+
+    async def _fetchmany_raw(self, size: int) -> List[Any]:
+        """Fetch the next rows without mapping them to the row type.
+
+        Adapters override this to skip the mapping for columnar fetches.
+        """
+
+        return await self.fetchmany(size)
+
     @override
     def __aiter__(self) -> Self:
         return self
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from typing import Any, Optional, Sequence, Tuple, Type
 
-from typing_extensions import Never, Self, override
+from typing_extensions import Never, Self, Unpack, override
 
 import turu.core.cursor
 from turu.core.protocols.connection import ConnectionProtocol
@@ -86,6 +86,7 @@ class Connection(ConnectionProtocol):
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> turu.core.cursor.Cursor[turu.core.cursor.GenericNewRowType, Parameters]:
         """
         Execute a database operation (query or command) and map each row to a `row_type`.
@@ -97,12 +98,13 @@ class Connection(ConnectionProtocol):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
 
-        return self.cursor().execute_map(row_type, operation, parameters)
+        return self.cursor().execute_map(row_type, operation, parameters, **options)
 
     def executemany_map(
         self,
@@ -110,6 +112,7 @@ class Connection(ConnectionProtocol):
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> turu.core.cursor.Cursor[turu.core.cursor.GenericNewRowType, Parameters]:
         """Execute a database operation (query or command) against all parameter sequences or mappings.
 
@@ -120,12 +123,40 @@ class Connection(ConnectionProtocol):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             seq_of_parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
 
-        return self.cursor().executemany_map(row_type, operation, seq_of_parameters)
+        return self.cursor().executemany_map(
+            row_type, operation, seq_of_parameters, **options
+        )
+
+    def select_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        from_clause: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> turu.core.cursor.Cursor[turu.core.cursor.GenericNewRowType, Parameters]:
+        """Select the fields of `row_type` and map each row to `row_type`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is simply a convenient shortcut to `.cursor().select_map()`.
+
+        Parameters:
+            row_type: The type of the row that will be returned.
+            from_clause: The rest of the query after `FROM`, such as `users WHERE id = ?`.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
+
+        Returns:
+            A cursor that holds a reference to an operation.
+        """
+
+        return self.cursor().select_map(row_type, from_clause, parameters, **options)
 
     def __enter__(self) -> Self:
         return self
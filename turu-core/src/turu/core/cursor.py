@@ -1,34 +1,145 @@
+import weakref
 from abc import abstractmethod
-from dataclasses import is_dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
     Generic,
+    Iterator,
     List,
     Optional,
     Sequence,
     Tuple,
     Type,
+    TypedDict,
     TypeVar,
     Union,
-    cast,
 )
 
-from turu.core.exception import TuruRowTypeMismatchError
-from turu.core.features import USE_PYDANTIC, PydanticModel
+from turu.core._arrow import ArrowBatchBuilder
+from turu.core._columnar import ColumnsBuilder
+from turu.core._row_mapper import LazyRow as LazyRow
+from turu.core._row_mapper import get_field_names, get_row_mapper
+from turu.core.features import PydanticModel
 from turu.core.protocols.cursor import CursorProtocol, Parameters
 from turu.core.protocols.dataclass import Dataclass
-from typing_extensions import Never, Self, override
+from typing_extensions import Never, Self, Unpack, override
 
 RowType = Union[Tuple[Any], Dataclass, PydanticModel]
 GenericRowType = TypeVar("GenericRowType", bound=RowType)
 GenericNewRowType = TypeVar("GenericNewRowType", bound=RowType)
 
+DEFAULT_FETCH_SIZE = 1000
+"""The default number of rows per chunk of the chunked fetches."""
+
 if TYPE_CHECKING:
     import turu.core.tag
+    from turu.core.features import PyArrowRecordBatch, PyArrowTable
+
+
+class MapOptions(TypedDict, total=False):
+    """Options for mapping rows to `row_type` in `execute_map` and `executemany_map`."""
+
+    validate: bool
+    """Whether to validate the rows of a pydantic model. (Default is `True`)
+
+    When `False`, the rows are built like `model_construct` without validation.
+    Use this only for queries whose result schema is under your control.
+    """
+
+    by_name: bool
+    """Whether to match the fields of `row_type` to the columns by name. (Default is `False`)
+
+    When `True`, the column names are read from `cursor.description` once per execution,
+    so that the select list does not need to follow the field order.
+    Unused columns are skipped, and fields without a column are left to their defaults.
+    """
+
+    lazy: bool
+    """Whether to return `LazyRow` proxies instead of `row_type`. (Default is `False`)
+
+    The proxies read the fields from the raw rows without copying,
+    and build `row_type` only when `materialize()` is called or a field is written.
+    Until then, the fields are the raw column values without validation.
+    """
+
+
+class ResolvedMapOptions(TypedDict, total=False):
+    """Keyword arguments of `map_row` and `map_rows` resolved from `MapOptions`."""
+
+    validate: bool
+
+    columns: Tuple[str, ...]
+
+    lazy: bool
+
+
+def resolve_map_options(
+    options: MapOptions, description: Optional[Sequence[Sequence[Any]]]
+) -> ResolvedMapOptions:
+    """Resolve `MapOptions` against the `description` of an executed cursor."""
+
+    resolved: ResolvedMapOptions = {}
+
+    if "validate" in options:
+        resolved["validate"] = options["validate"]
+
+    if options.get("by_name") and description is not None:
+        resolved["columns"] = tuple(column[0] for column in description)
+
+    if "lazy" in options:
+        resolved["lazy"] = options["lazy"]
+
+    return resolved
+
+
+_SELECT_LISTS: "weakref.WeakKeyDictionary[type, Dict[Callable[[str], str], str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def quote_identifier(name: str) -> str:
+    """Quote `name` as a standard SQL identifier, `"name"`."""
+
+    return '"' + name.replace('"', '""') + '"'
+
+
+def render_select(
+    row_type: Type[RowType],
+    from_clause: str,
+    quote_identifier: Callable[[str], str] = quote_identifier,
+) -> str:
+    """Render `SELECT <fields of row_type> FROM <from_clause>`.
+
+    The fields are quoted with `quote_identifier`, so that reserved words and
+    mixed case names are selected as they are, and the select list of each
+    `row_type` is rendered once per `quote_identifier` and cached.
+    The select list follows the field order, so that the rows map by position.
+    """
+
+    select_lists = _SELECT_LISTS.get(row_type)
+    if select_lists is None:
+        select_lists = _SELECT_LISTS[row_type] = {}
+
+    try:
+        select_list = select_lists[quote_identifier]
+
+    except KeyError:
+        select_list = select_lists[quote_identifier] = ", ".join(
+            map(quote_identifier, get_field_names(row_type))
+        )
+
+    return f"SELECT {select_list} FROM {from_clause}"
 
 
 class Cursor(Generic[GenericRowType, Parameters], CursorProtocol[Parameters]):
+    _row_type: Optional[Type[Any]] = None
+    """The row type of the last operation, which is set by the adapters."""
+
+    _quote_identifier: Callable[[str], str] = staticmethod(quote_identifier)
+    """Quotes the field names in `.select_map()`, which is overridden by the dialects."""
+
     @property
     @abstractmethod
     def rowcount(self) -> int: ...
@@ -61,6 +172,7 @@ class Cursor(Generic[GenericRowType, Parameters], CursorProtocol[Parameters]):
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[MapOptions],
     ) -> "Cursor[GenericNewRowType, Parameters]":
         """
         Execute a database operation (query or command) and map each row to a `row_type`.
@@ -69,6 +181,7 @@ class Cursor(Generic[GenericRowType, Parameters], CursorProtocol[Parameters]):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
@@ -82,6 +195,7 @@ class Cursor(Generic[GenericRowType, Parameters], CursorProtocol[Parameters]):
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[MapOptions],
     ) -> "Cursor[GenericNewRowType, Parameters]":
         """Execute a database operation (query or command) against all parameter sequences or mappings.
 
@@ -89,12 +203,44 @@ class Cursor(Generic[GenericRowType, Parameters], CursorProtocol[Parameters]):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             seq_of_parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
         ...
 
+    def select_map(
+        self,
+        row_type: Type[GenericNewRowType],
+        from_clause: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[MapOptions],
+    ) -> "Cursor[GenericNewRowType, Parameters]":
+        """Select the fields of `row_type` and map each row to `row_type`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is a shortcut to `.execute_map()` with the columns derived from `row_type`,
+        so that only the columns that are mapped are scanned and transferred.
+
+        Parameters:
+            row_type: The type of the row that will be returned.
+            from_clause: The rest of the query after `FROM`, such as `users WHERE id = ?`.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for mapping rows to `row_type`.
+
+        Returns:
+            A cursor that holds a reference to an operation.
+        """
+
+        return self.execute_map(
+            row_type,
+            render_select(row_type, from_clause, self._quote_identifier),
+            parameters,
+            **options,
+        )
+
     def execute_with_tag(
         self,
         tag: Type["turu.core.tag.Tag"],
@@ -136,6 +282,104 @@ class Cursor(Generic[GenericRowType, Parameters], CursorProtocol[Parameters]):
     @abstractmethod
     def fetchall(self) -> List[GenericRowType]: ...
 
+    @property
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        """The columns of the last operation as defined in [PEP 249](https://peps.python.org/pep-0249/).
+
+        This is `None` when no operation has returned rows, or the interface does not provide it.
+        """
+
+        return None
+
+    def iter_batches(
+        self, size: Optional[int] = None
+    ) -> Iterator[List[GenericRowType]]:
+        """Iterate over the (remaining) rows in batches of at most `size` mapped rows.
+
+        This is a shortcut to a loop of `.fetchmany()`,
+        which streams a large result set in constant memory.
+
+        Parameters:
+            size: The number of rows per batch.
+                If this parameter is not used, `.arraysize` or a larger default is used.
+        """
+
+        if size is None:
+            size = max(self.arraysize, DEFAULT_FETCH_SIZE)
+
+        while rows := self.fetchmany(size):
+            yield rows
+
+    def fetch_columns(self, size: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch all (remaining) rows as a mapping from column name to column values.
+
+        The rows are fetched in chunks of `size` and appended column by column.
+        Integer and float columns are typed `array.array`s,
+        or NumPy arrays when NumPy is installed,
+        and the other columns are lists.
+
+        Parameters:
+            size: The number of rows to fetch per chunk.
+                If this parameter is not used, `.arraysize` or a larger default is used.
+        """
+
+        if size is None:
+            size = max(self.arraysize, DEFAULT_FETCH_SIZE)
+
+        builder = ColumnsBuilder(self.description)
+        while rows := self._fetchmany_raw(size):
+            builder.extend(rows)
+
+        return builder.build()
+
+    def fetch_arrow_all(self, size: Optional[int] = None) -> "PyArrowTable":
+        """Fetch all (remaining) rows as a `pyarrow.Table`.
+
+        The rows are fetched in chunks of `size` and converted column-wise,
+        without building the mapped rows. This requires pyarrow.
+
+        Parameters:
+            size: The number of rows to fetch per chunk.
+                If this parameter is not used, `.arraysize` or a larger default is used.
+        """
+
+        if size is None:
+            size = max(self.arraysize, DEFAULT_FETCH_SIZE)
+
+        builder = ArrowBatchBuilder(self.description, self._row_type)
+        batches = []
+        while rows := self._fetchmany_raw(size):
+            batches.append(builder.build(rows))
+
+        return builder.to_table(batches)
+
+    def fetch_arrow_batches(
+        self, size: Optional[int] = None
+    ) -> Iterator["PyArrowRecordBatch"]:
+        """Fetch the (remaining) rows as `pyarrow.RecordBatch`es of at most `size` rows.
+
+        This requires pyarrow.
+
+        Parameters:
+            size: The number of rows per batch.
+                If this parameter is not used, `.arraysize` or a larger default is used.
+        """
+
+        if size is None:
+            size = max(self.arraysize, DEFAULT_FETCH_SIZE)
+
+        builder = ArrowBatchBuilder(self.description, self._row_type)
+        while rows := self._fetchmany_raw(size):
+            yield builder.build(rows)
+
+    def _fetchmany_raw(self, size: int) -> List[Any]:
+        """Fetch the next rows without mapping them to the row type.
+
+        Adapters override this to skip the mapping for columnar fetches.
+        """
+
+        return self.fetchmany(size)
+
     @override
     def __iter__(self) -> Self:
         return self
@@ -155,29 +399,48 @@ class Cursor(Generic[GenericRowType, Parameters], CursorProtocol[Parameters]):
 GenericCursor = TypeVar("GenericCursor", bound=Cursor)
 
 
-def map_row(row_type: Optional[Type[GenericRowType]], row: Any) -> GenericRowType:
+def map_row(
+    row_type: Optional[Type[GenericRowType]],
+    row: Any,
+    *,
+    validate: bool = True,
+    columns: Optional[Tuple[str, ...]] = None,
+    lazy: bool = False,
+) -> GenericRowType:
+    """Map a raw row to `row_type`.
+
+    The mapping strategy of each `row_type` is resolved once and cached,
+    so that only the generated constructor runs per row.
+    When `columns` is given, the fields are matched to the columns by name.
+    When `lazy` is `True`, a `LazyRow` proxy of `row_type` is returned.
+    """
+
     if row_type is None:
         return row
 
-    if is_dataclass(row_type):
-        return row_type(
-            **{
-                key: data
-                for key, data in zip(row_type.__dataclass_fields__.keys(), row)
-            }
-        )  # type: ignore
-
-    elif issubclass(row_type, tuple):
-        return row_type._make(row)  # type: ignore
-
-    elif USE_PYDANTIC and issubclass(row_type, PydanticModel):
-        return row_type(
-            **{
-                key: data
-                for key, data in zip(
-                    cast(PydanticModel, row_type).model_fields.keys(), row
-                )
-            }
-        )  # type: ignore
-
-    raise TuruRowTypeMismatchError(row_type, row.__class__)
+    return get_row_mapper(
+        row_type, validate=validate, columns=columns, lazy=lazy
+    ).map_row(row_type, row)
+
+
+def map_rows(
+    row_type: Optional[Type[GenericRowType]],
+    rows: Sequence[Any],
+    *,
+    validate: bool = True,
+    columns: Optional[Tuple[str, ...]] = None,
+    lazy: bool = False,
+) -> List[GenericRowType]:
+    """Map raw rows to `row_type` in one call.
+
+    This is the batch version of `map_row` for `fetchmany` and `fetchall`.
+    Every type check and attribute lookup is done once for the whole batch,
+    and dataclasses are built column-wise when their fields allow it.
+    """
+
+    if row_type is None:
+        return list(rows)
+
+    return get_row_mapper(
+        row_type, validate=validate, columns=columns, lazy=lazy
+    ).map_rows(row_type, rows)
@@ -1,3 +1,6 @@
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
 from typing_extensions import TypeAlias
 
 
@@ -15,3 +18,33 @@ except ImportError:
     USE_PYDANTIC = False
 
     PydanticModel: TypeAlias = _NotSupportFeature  # type: ignore
+
+
+# NOTE: numpy and pyarrow are heavy to import and only needed by the columnar fetches,
+#       so they are detected without importing, and imported on first use.
+USE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+USE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+if TYPE_CHECKING:
+    import pyarrow  # type: ignore[import]
+
+    PyArrowTable: TypeAlias = pyarrow.Table  # type: ignore
+    PyArrowRecordBatch: TypeAlias = pyarrow.RecordBatch  # type: ignore
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("PyArrowTable", "PyArrowRecordBatch"):
+        if USE_PYARROW:
+            import pyarrow  # type: ignore[import]
+
+            feature = pyarrow.Table if name == "PyArrowTable" else pyarrow.RecordBatch
+
+        else:
+            feature = _NotSupportFeature
+
+        globals()[name] = feature
+
+        return feature
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
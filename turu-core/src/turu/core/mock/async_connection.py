@@ -11,7 +11,7 @@ from typing import (
 )
 
 import turu.core.async_connection
-from turu.core.cursor import GenericRowType, map_row
+from turu.core.cursor import GenericRowType, map_rows
 from turu.core.mock.connection import CSVOptions
 from turu.core.mock.store import TuruMockStore
 from turu.core.tag import Tag
@@ -101,7 +101,7 @@ class MockAsyncConnection(turu.core.async_connection.AsyncConnection):
             if options.get("header", True):
                 next(reader)
 
-            response = [map_row(row_type, row) for row in reader]
+            response = map_rows(row_type, list(reader))
 
         self.inject_response(row_type, response)
 
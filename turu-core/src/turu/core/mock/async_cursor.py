@@ -4,6 +4,7 @@ from turu.core.async_cursor import (
     AsyncCursor,
     GenericNewRowType,
     GenericRowType,
+    MapOptions,
     Parameters,
 )
 from turu.core.mock.exception import (
@@ -11,7 +12,7 @@ from turu.core.mock.exception import (
 )
 from turu.core.mock.store import TuruMockStore
 from turu.core.tag import Tag
-from typing_extensions import Never, Self, override
+from typing_extensions import Never, Self, Unpack, override
 
 
 class MockAsyncCursor(AsyncCursor[GenericRowType, Parameters]):
@@ -41,6 +42,11 @@ class MockAsyncCursor(AsyncCursor[GenericRowType, Parameters]):
     def arraysize(self, size: int) -> None:
         self._arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return None
+
     @override
     async def close(self) -> None:
         pass
@@ -64,6 +70,7 @@ class MockAsyncCursor(AsyncCursor[GenericRowType, Parameters]):
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[MapOptions],
     ) -> "MockAsyncCursor[GenericNewRowType, Parameters]":
         return self._make_new_mock_cursor(row_type)
 
@@ -74,6 +81,7 @@ class MockAsyncCursor(AsyncCursor[GenericRowType, Parameters]):
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[MapOptions],
     ) -> "MockAsyncCursor[GenericNewRowType, Parameters]":
         return self._make_new_mock_cursor(row_type)
 
@@ -121,6 +129,10 @@ class MockAsyncCursor(AsyncCursor[GenericRowType, Parameters]):
 
         return list(self._rows_iter)
 
+    @override
+    async def _fetchmany_raw(self, size: int) -> List[Any]:
+        return await self.fetchmany(size)
+
     @override
     def __aiter__(self) -> Self:
         if self._rows_iter is None:
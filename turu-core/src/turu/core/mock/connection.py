@@ -12,7 +12,7 @@ from typing import (
 )
 
 import turu.core.connection
-from turu.core.cursor import GenericRowType, map_row
+from turu.core.cursor import GenericRowType, map_rows
 from turu.core.mock.store import TuruMockStore
 from turu.core.tag import Tag
 from typing_extensions import Never, NotRequired, Self, Unpack
@@ -105,7 +105,7 @@ class MockConnection(turu.core.connection.Connection):
             if options.get("header", True):
                 next(reader)
 
-            response = [map_row(row_type, row) for row in reader]
+            response = map_rows(row_type, list(reader))
 
         self.inject_response(row_type, response)
 
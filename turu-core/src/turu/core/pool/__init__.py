@@ -0,0 +1,12 @@
+from turu.core.pool.async_connection_pool import (
+    AsyncConnectionPool as AsyncConnectionPool,
+)
+from turu.core.pool.async_pooled_cursor import AsyncPooledCursor as AsyncPooledCursor
+from turu.core.pool.connection_pool import ConnectionPool as ConnectionPool
+from turu.core.pool.exception import TuruPoolClosedError as TuruPoolClosedError
+from turu.core.pool.exception import TuruPoolError as TuruPoolError
+from turu.core.pool.exception import TuruPoolTimeoutError as TuruPoolTimeoutError
+from turu.core.pool.exception import (
+    TuruPoolUnknownConnectionError as TuruPoolUnknownConnectionError,
+)
+from turu.core.pool.pooled_cursor import PooledCursor as PooledCursor
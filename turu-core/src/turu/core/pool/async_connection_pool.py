@@ -0,0 +1,615 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import turu.core.async_connection
+import turu.core.async_cursor
+import turu.core.cursor
+from turu.core.pool.async_pooled_cursor import AsyncPooledCursor
+from turu.core.pool.connection_pool import PING_OPERATION, PoolEntry
+from turu.core.pool.exception import (
+    TuruPoolClosedError,
+    TuruPoolTimeoutError,
+    TuruPoolUnknownConnectionError,
+)
+from turu.core.protocols.cursor import Parameters
+from typing_extensions import Self, Unpack
+
+GenericAsyncConnection = TypeVar(
+    "GenericAsyncConnection", bound=turu.core.async_connection.AsyncConnection
+)
+
+
+class AsyncConnectionPool(Generic[GenericAsyncConnection]):
+    """An asyncio pool of connections of any turu adapter.
+
+    ```python
+    async with turu.core.pool.AsyncConnectionPool(
+        lambda: turu.postgres.connect_async("dbname=test"), max_size=10
+    ) as pool:
+        async with pool.connection() as connection:
+            cursor = await connection.execute_map(Row, "SELECT * FROM users")
+            rows = await cursor.fetchall()
+    ```
+
+    The tasks waiting for a connection are served in the FIFO order,
+    and a released connection is rolled back and handed to the first of them directly.
+    The idle connections are checked in the background every `health_check_interval`,
+    where the expired and broken ones are closed and `min_size` connections are reopened.
+
+    Parameters:
+        connect: The factory of a connection, such as `turu.postgres.connect_async` with its arguments bound.
+        min_size: The number of connections opened by `.open()` and kept open.
+        max_size: The maximum number of connections open at a time.
+        timeout: The default seconds to wait for a connection, or `None` to wait forever.
+        idle_timeout: The seconds after which an idle connection is closed, or `None`.
+        max_lifetime: The seconds after which a connection is closed and replaced, or `None`.
+        health_check_interval: The seconds between the checks of the idle connections,
+            or `None` to check them only on `.check()`.
+        pre_ping: Whether to check a connection with `SELECT 1` before handing it out,
+            and to replace it if the check fails.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[GenericAsyncConnection]],
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        timeout: Optional[float] = 30.0,
+        idle_timeout: Optional[float] = 600.0,
+        max_lifetime: Optional[float] = 3600.0,
+        health_check_interval: Optional[float] = 60.0,
+        pre_ping: bool = False,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive: {max_size}")
+
+        if not 0 <= min_size <= max_size:
+            raise ValueError(f"min_size must be in [0, {max_size}]: {min_size}")
+
+        self._connect = connect
+        self._min_size = min_size
+        self._max_size = max_size
+        self._timeout = timeout
+        self._idle_timeout = idle_timeout
+        self._max_lifetime = max_lifetime
+        self._health_check_interval = health_check_interval
+        self._pre_ping = pre_ping
+
+        self._idle: Deque[PoolEntry[GenericAsyncConnection]] = deque()
+        self._in_use: Dict[int, PoolEntry[GenericAsyncConnection]] = {}
+        self._waiters: Deque[
+            "asyncio.Future[Optional[PoolEntry[GenericAsyncConnection]]]"
+        ] = deque()
+        self._size = 0
+        self._opened = False
+        self._closed = False
+        self._health_check_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def size(self) -> int:
+        """The number of connections open, including the ones in use."""
+
+        return self._size
+
+    @property
+    def idle_size(self) -> int:
+        """The number of idle connections."""
+
+        return len(self._idle)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def open(self) -> None:
+        """Open `min_size` connections and start the health checks.
+
+        This is called by `async with pool` and the first `.acquire()`.
+        """
+
+        if self._opened:
+            return
+
+        if self._closed:
+            raise TuruPoolClosedError()
+
+        self._opened = True
+        await self._fill()
+
+        if self._health_check_interval is not None:
+            self._health_check_task = asyncio.get_running_loop().create_task(
+                self._run_health_checks(self._health_check_interval)
+            )
+
+    async def acquire(self, timeout: Optional[float] = None) -> GenericAsyncConnection:
+        """Check out a connection, waiting for one to be released if the pool is full.
+
+        The connection must be returned by `.release()`.
+        Prefer `.connection()`, which does it automatically.
+
+        Parameters:
+            timeout: The seconds to wait, which defaults to the timeout of the pool.
+
+        Raises:
+            TuruPoolTimeoutError: No connection became available in time.
+            TuruPoolClosedError: The pool is closed.
+        """
+
+        return await self._acquire(timeout, None)
+
+    async def _acquire(
+        self, timeout: Optional[float], affinity: Any
+    ) -> GenericAsyncConnection:
+        await self.open()
+
+        if timeout is None:
+            timeout = self._timeout
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            entry = await self._checkout(timeout, deadline, affinity)
+
+            if entry is None:
+                try:
+                    entry = PoolEntry(await self._connect())
+
+                except BaseException:
+                    self._free_slot()
+                    raise
+
+            elif self._pre_ping and not await self._ping(entry.connection):
+                self._free_slot()
+                await self._close_all([entry])
+                await self._refill()
+                continue
+
+            self._in_use[id(entry.connection)] = entry
+
+            return entry.connection
+
+    async def release(self, connection: GenericAsyncConnection) -> None:
+        """Return a connection checked out by `.acquire()` to the pool.
+
+        The connection is rolled back first, and it is closed instead if the rollback fails.
+        """
+
+        entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            raise TuruPoolUnknownConnectionError()
+
+        reset = await self._reset(connection)
+
+        now = time.monotonic()
+        if not reset or self._closed or entry.is_expired(now, None, self._max_lifetime):
+            self._free_slot()
+            await self._close_all([entry])
+            await self._refill()
+
+        else:
+            entry.released_at = now
+            self._put(entry)
+
+    async def discard(self, connection: GenericAsyncConnection) -> None:
+        """Close a connection checked out by `.acquire()` instead of returning it,
+        such as after an unrecoverable error.
+        """
+
+        entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            raise TuruPoolUnknownConnectionError()
+
+        self._free_slot()
+        await self._close_all([entry])
+        await self._refill()
+
+    def connection(
+        self, timeout: Optional[float] = None
+    ) -> AsyncContextManager[GenericAsyncConnection]:
+        """Check out a connection for the `async with` block.
+
+        The connection is rolled back when it is returned after the block,
+        and it is closed instead if the rollback fails.
+
+        Parameters:
+            timeout: The seconds to wait, which defaults to the timeout of the pool.
+        """
+
+        return self._lend(lambda: self.acquire(timeout))
+
+    async def check(self) -> None:
+        """Close the expired and broken idle connections,
+        and reopen connections up to `min_size`.
+
+        The connections are pinged one at a time, and the others stay available meanwhile.
+        """
+
+        now = time.monotonic()
+        for entry in list(self._idle):
+            # NOTE: The connection may have been handed out while another one was pinged.
+            if entry not in self._idle:
+                continue
+
+            self._idle.remove(entry)
+            if entry.is_expired(
+                now,
+                self._idle_timeout if self._size > self._min_size else None,
+                self._max_lifetime,
+            ) or not await self._ping(entry.connection):
+                self._free_slot()
+                await self._close_all([entry])
+
+            else:
+                self._put(entry)
+
+        await self._fill()
+
+    async def close(self) -> None:
+        """Close the idle connections, and the ones in use when they are released.
+
+        The tasks waiting for a connection raise `TuruPoolClosedError`.
+        """
+
+        if self._closed:
+            return
+
+        self._closed = True
+
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+
+            except asyncio.CancelledError:
+                pass
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(TuruPoolClosedError())
+
+        idle = list(self._idle)
+        self._idle.clear()
+        self._size -= len(idle)
+
+        await self._close_all(idle)
+
+    async def execute(
+        self, operation: str, parameters: Optional[Parameters] = None, /
+    ) -> AsyncPooledCursor[Tuple[Any], Parameters]:
+        """Prepare and execute a database operation (query or command)
+        on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().execute()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return await self._checkout_cursor(
+            lambda connection: connection.execute(operation, parameters)
+        )
+
+    async def executemany(
+        self, operation: str, seq_of_parameters: Sequence[Parameters], /
+    ) -> AsyncPooledCursor[Tuple[Any], Parameters]:
+        """Execute a database operation against all parameter sequences or mappings
+        on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().executemany()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return await self._checkout_cursor(
+            lambda connection: connection.executemany(operation, seq_of_parameters)
+        )
+
+    async def execute_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> AsyncPooledCursor[turu.core.cursor.GenericNewRowType, Parameters]:
+        """Execute a database operation and map each row to a `row_type`
+        on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().execute_map()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return await self._checkout_cursor(
+            lambda connection: connection.execute_map(
+                row_type, operation, parameters, **options
+            )
+        )
+
+    async def executemany_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        seq_of_parameters: Sequence[Parameters],
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> AsyncPooledCursor[turu.core.cursor.GenericNewRowType, Parameters]:
+        """Execute a database operation against all parameter sequences or mappings
+        and map each row to a `row_type` on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().executemany_map()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return await self._checkout_cursor(
+            lambda connection: connection.executemany_map(
+                row_type, operation, seq_of_parameters, **options
+            )
+        )
+
+    async def select_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        from_clause: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> AsyncPooledCursor[turu.core.cursor.GenericNewRowType, Parameters]:
+        """Select the fields of `row_type` and map each row to `row_type`
+        on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().select_map()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return await self._checkout_cursor(
+            lambda connection: connection.select_map(
+                row_type, from_clause, parameters, **options
+            )
+        )
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _checkout(
+        self, timeout: Optional[float], deadline: Optional[float], affinity: Any
+    ) -> Optional[PoolEntry[GenericAsyncConnection]]:
+        """Take an idle connection, or reserve a slot to open a new one as `None`.
+
+        When the pool is full, wait behind the other tasks
+        until a connection or a slot is handed over.
+        """
+
+        if self._closed:
+            raise TuruPoolClosedError()
+
+        if not self._waiters:
+            expired = self._collect_expired(time.monotonic())
+            if expired:
+                await self._close_all(expired)
+                await self._refill()
+
+            if self._closed:
+                raise TuruPoolClosedError()
+
+        if not self._waiters:
+            if self._idle:
+                return self._take_idle(affinity)
+
+            if self._size < self._max_size:
+                self._size += 1
+
+                return None
+
+        waiter: "asyncio.Future[Optional[PoolEntry[GenericAsyncConnection]]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait(
+                {waiter},
+                timeout=None if deadline is None else deadline - time.monotonic(),
+            )
+
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+        if not waiter.done():
+            self._abandon(waiter)
+            raise TuruPoolTimeoutError(timeout or 0.0)
+
+        return waiter.result()
+
+    @asynccontextmanager
+    async def _lend(
+        self, acquire: Callable[[], Awaitable[GenericAsyncConnection]]
+    ) -> AsyncIterator[GenericAsyncConnection]:
+        connection = await acquire()
+        try:
+            yield connection
+
+        finally:
+            await self.release(connection)
+
+    def _take_idle(self, affinity: Any) -> PoolEntry[GenericAsyncConnection]:
+        """Take the idle connection to hand out, which is the most recently used one.
+
+        Subclasses override this to prefer the connections matching `affinity`.
+        """
+
+        return self._idle.pop()
+
+    def _put(self, entry: PoolEntry[GenericAsyncConnection]) -> None:
+        """Hand an idle connection to the first waiting task, or keep it idle."""
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(entry)
+
+                return
+
+        self._idle.append(entry)
+
+    def _free_slot(self) -> None:
+        """Forget a closed connection, and let the first waiting task open a new one."""
+
+        self._size -= 1
+        if self._closed:
+            return
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._size += 1
+                waiter.set_result(None)
+
+                return
+
+    def _abandon(
+        self, waiter: "asyncio.Future[Optional[PoolEntry[GenericAsyncConnection]]]"
+    ) -> None:
+        """Stop waiting, passing on the connection or the slot handed over if any."""
+
+        if not waiter.done():
+            self._waiters.remove(waiter)
+            waiter.cancel()
+
+        elif waiter.exception() is None:
+            entry = waiter.result()
+            if entry is None:
+                self._free_slot()
+
+            else:
+                self._put(entry)
+
+    def _collect_expired(self, now: float) -> List[PoolEntry[GenericAsyncConnection]]:
+        """Remove the expired idle connections to be closed and replaced by `._refill()`.
+
+        The connections idle for too long are only removed past `min_size`,
+        since they would be replaced right away.
+        """
+
+        expired: List[PoolEntry[GenericAsyncConnection]] = []
+        for entry in list(self._idle):
+            idle_timeout = self._idle_timeout if self._size > self._min_size else None
+            if entry.is_expired(now, idle_timeout, self._max_lifetime):
+                self._idle.remove(entry)
+                self._size -= 1
+                expired.append(entry)
+
+        return expired
+
+    async def _fill(self) -> None:
+        while not self._closed and self._size < self._min_size:
+            self._size += 1
+            try:
+                entry = PoolEntry(await self._connect())
+
+            except BaseException:
+                self._free_slot()
+                raise
+
+            self._put(entry)
+
+    async def _refill(self) -> None:
+        """Reopen connections up to `min_size` after some were closed.
+
+        A failure to connect is left to the next checkout, which opens a connection itself.
+        """
+
+        try:
+            await self._fill()
+
+        except Exception:
+            pass
+
+    async def _run_health_checks(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.check()
+
+            except Exception:
+                # The broken connections are closed anyway,
+                # and reopening them is retried on the next check.
+                pass
+
+    async def _ping(self, connection: GenericAsyncConnection) -> bool:
+        try:
+            cursor = await connection.cursor()
+            try:
+                await cursor.execute(PING_OPERATION)
+                await cursor.fetchall()
+
+            finally:
+                await cursor.close()
+
+        except Exception:
+            return False
+
+        return True
+
+    async def _reset(self, connection: GenericAsyncConnection) -> bool:
+        """Roll back the transaction left open on `connection`, and return whether it succeeded.
+
+        Connections without transaction support raise `NotImplementedError`,
+        which leaves nothing to reset.
+        """
+
+        try:
+            await connection.rollback()
+
+        except NotImplementedError:
+            return True
+
+        except Exception:
+            return False
+
+        return True
+
+    @staticmethod
+    async def _close_all(entries: List[PoolEntry[GenericAsyncConnection]]) -> None:
+        for entry in entries:
+            try:
+                await entry.connection.close()
+
+            except Exception:
+                pass
+
+    async def _checkout_cursor(
+        self,
+        execute: Callable[
+            [GenericAsyncConnection], Awaitable[turu.core.async_cursor.AsyncCursor]
+        ],
+    ) -> AsyncPooledCursor:
+        connection = await self.acquire()
+        try:
+            return AsyncPooledCursor(self, connection, await execute(connection))
+
+        except BaseException:
+            await self.release(connection)
+            raise
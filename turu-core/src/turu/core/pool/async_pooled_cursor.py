@@ -0,0 +1,147 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    cast,
+)
+
+import turu.core.async_cursor
+import turu.core.cursor
+from turu.core.protocols.cursor import Parameters
+from typing_extensions import Unpack
+
+if TYPE_CHECKING:
+    from turu.core.async_connection import AsyncConnection
+    from turu.core.pool.async_connection_pool import AsyncConnectionPool
+
+
+class AsyncPooledCursor(
+    turu.core.async_cursor.AsyncCursor[turu.core.cursor.GenericRowType, Parameters]
+):
+    """A cursor of a connection checked out of an `AsyncConnectionPool`.
+
+    The connection is returned to the pool when the cursor is closed,
+    so use the cursor as a context manager or close it after fetching.
+    """
+
+    def __init__(
+        self,
+        pool: "AsyncConnectionPool",
+        connection: "AsyncConnection",
+        cursor: turu.core.async_cursor.AsyncCursor[
+            turu.core.cursor.GenericRowType, Parameters
+        ],
+    ):
+        self._pool = pool
+        self._connection: Optional["AsyncConnection"] = connection
+        self.__pooled_target_cursor: turu.core.async_cursor.AsyncCursor = cursor
+
+    @property
+    def rowcount(self) -> int:
+        return self.__pooled_target_cursor.rowcount
+
+    @property
+    def arraysize(self) -> int:
+        return self.__pooled_target_cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, size: int) -> None:
+        self.__pooled_target_cursor.arraysize = size
+
+    @property
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self.__pooled_target_cursor.description
+
+    @property
+    def _row_type(self) -> Optional[Type[Any]]:  # type: ignore[override]
+        return self.__pooled_target_cursor._row_type
+
+    @property
+    def _quote_identifier(self) -> Callable[[str], str]:  # type: ignore[override]
+        return self.__pooled_target_cursor._quote_identifier
+
+    async def close(self) -> None:
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+        try:
+            await self.__pooled_target_cursor.close()
+
+        finally:
+            await self._pool.release(connection)
+
+    async def execute(
+        self, operation: str, parameters: Optional[Parameters] = None, /
+    ) -> "AsyncPooledCursor[turu.core.cursor.GenericRowType, Parameters]":
+        self.__pooled_target_cursor = await self.__pooled_target_cursor.execute(
+            operation, parameters
+        )
+
+        return self
+
+    async def executemany(
+        self, operation: str, seq_of_parameters: "Sequence[Parameters]", /
+    ) -> "AsyncPooledCursor[turu.core.cursor.GenericRowType, Parameters]":
+        self.__pooled_target_cursor = await self.__pooled_target_cursor.executemany(
+            operation, seq_of_parameters
+        )
+
+        return self
+
+    async def execute_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> "AsyncPooledCursor[turu.core.cursor.GenericNewRowType, Parameters]":
+        self.__pooled_target_cursor = await self.__pooled_target_cursor.execute_map(
+            row_type, operation, parameters, **options
+        )
+
+        return cast(AsyncPooledCursor, self)
+
+    async def executemany_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        seq_of_parameters: Sequence[Parameters],
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> "AsyncPooledCursor[turu.core.cursor.GenericNewRowType, Parameters]":
+        self.__pooled_target_cursor = await self.__pooled_target_cursor.executemany_map(
+            row_type, operation, seq_of_parameters, **options
+        )
+
+        return cast(AsyncPooledCursor, self)
+
+    async def fetchone(self) -> Optional[turu.core.cursor.GenericRowType]:
+        return await self.__pooled_target_cursor.fetchone()
+
+    async def fetchmany(
+        self, size: Optional[int] = None
+    ) -> List[turu.core.cursor.GenericRowType]:
+        return await self.__pooled_target_cursor.fetchmany(size)
+
+    async def fetchall(self) -> List[turu.core.cursor.GenericRowType]:
+        return await self.__pooled_target_cursor.fetchall()
+
+    async def _fetchmany_raw(self, size: int) -> List[Any]:
+        return await self.__pooled_target_cursor._fetchmany_raw(size)
+
+    def __aiter__(
+        self,
+    ) -> "AsyncPooledCursor[turu.core.cursor.GenericRowType, Parameters]":
+        return self
+
+    async def __anext__(self) -> turu.core.cursor.GenericRowType:
+        return await self.__pooled_target_cursor.__anext__()
+
+    def __getattr__(self, name):
+        return getattr(self.__pooled_target_cursor, name)
@@ -0,0 +1,509 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import turu.core.connection
+import turu.core.cursor
+from turu.core.pool.exception import (
+    TuruPoolClosedError,
+    TuruPoolTimeoutError,
+    TuruPoolUnknownConnectionError,
+)
+from turu.core.pool.pooled_cursor import PooledCursor
+from turu.core.protocols.cursor import Parameters
+from typing_extensions import Self, Unpack
+
+GenericConnection = TypeVar("GenericConnection", bound=turu.core.connection.Connection)
+GenericPooledConnection = TypeVar("GenericPooledConnection")
+
+PING_OPERATION = "SELECT 1"
+"""The operation to check the health of a connection before handing it out."""
+
+
+class PoolEntry(Generic[GenericPooledConnection]):
+    """A connection opened by a pool, with the times to expire it."""
+
+    __slots__ = ("connection", "created_at", "released_at")
+
+    def __init__(self, connection: GenericPooledConnection) -> None:
+        self.connection = connection
+        self.created_at = self.released_at = time.monotonic()
+
+    def is_expired(
+        self, now: float, idle_timeout: Optional[float], max_lifetime: Optional[float]
+    ) -> bool:
+        return (max_lifetime is not None and now - self.created_at >= max_lifetime) or (
+            idle_timeout is not None and now - self.released_at >= idle_timeout
+        )
+
+
+class ConnectionPool(Generic[GenericConnection]):
+    """A thread-safe pool of connections of any turu adapter.
+
+    ```python
+    pool = turu.core.pool.ConnectionPool(
+        lambda: turu.mysql.connect(host="localhost"), max_size=10
+    )
+
+    with pool.connection() as connection:
+        rows = connection.execute_map(Row, "SELECT * FROM users").fetchall()
+    ```
+
+    The idle connections are reused in the LIFO order,
+    and are closed when they are idle or open for too long.
+    The connections are rolled back when they are returned,
+    so that no transaction is carried over to the next user.
+
+    Parameters:
+        connect: The factory of a connection, such as `turu.mysql.connect` with its arguments bound.
+        min_size: The number of connections opened up front and kept open.
+        max_size: The maximum number of connections open at a time.
+        timeout: The default seconds to wait for a connection, or `None` to wait forever.
+        idle_timeout: The seconds after which an idle connection is closed, or `None`.
+        max_lifetime: The seconds after which a connection is closed, or `None`.
+        pre_ping: Whether to check a connection with `SELECT 1` before handing it out,
+            and to replace it if the check fails.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], GenericConnection],
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        timeout: Optional[float] = 30.0,
+        idle_timeout: Optional[float] = 600.0,
+        max_lifetime: Optional[float] = 3600.0,
+        pre_ping: bool = False,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive: {max_size}")
+
+        if not 0 <= min_size <= max_size:
+            raise ValueError(f"min_size must be in [0, {max_size}]: {min_size}")
+
+        self._connect = connect
+        self._min_size = min_size
+        self._max_size = max_size
+        self._timeout = timeout
+        self._idle_timeout = idle_timeout
+        self._max_lifetime = max_lifetime
+        self._pre_ping = pre_ping
+
+        self._condition = threading.Condition()
+        self._idle: Deque[PoolEntry[GenericConnection]] = deque()
+        self._in_use: Dict[int, PoolEntry[GenericConnection]] = {}
+        self._size = 0
+        self._closed = False
+
+        for _ in range(min_size):
+            self._idle.append(PoolEntry(connect()))
+            self._size += 1
+
+    @property
+    def size(self) -> int:
+        """The number of connections open, including the ones in use."""
+
+        return self._size
+
+    @property
+    def idle_size(self) -> int:
+        """The number of idle connections."""
+
+        return len(self._idle)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def acquire(self, timeout: Optional[float] = None) -> GenericConnection:
+        """Check out a connection, waiting for one to be released if the pool is full.
+
+        The connection must be returned by `.release()`.
+        Prefer `.connection()`, which does it automatically.
+
+        Parameters:
+            timeout: The seconds to wait, which defaults to the timeout of the pool.
+
+        Raises:
+            TuruPoolTimeoutError: No connection became available in time.
+            TuruPoolClosedError: The pool is closed.
+        """
+
+        return self._acquire(timeout, None)
+
+    def _acquire(self, timeout: Optional[float], affinity: Any) -> GenericConnection:
+        if timeout is None:
+            timeout = self._timeout
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            entry, expired = self._checkout(timeout, deadline, affinity)
+            if expired:
+                self._close_all(expired)
+                self._fill()
+
+            if entry is None:
+                try:
+                    entry = PoolEntry(self._connect())
+
+                except BaseException:
+                    self._forget()
+                    raise
+
+            elif self._pre_ping and not self._ping(entry.connection):
+                self._close_all([entry])
+                self._forget()
+                self._fill()
+                continue
+
+            with self._condition:
+                self._in_use[id(entry.connection)] = entry
+
+            return entry.connection
+
+    def release(self, connection: GenericConnection) -> None:
+        """Return a connection checked out by `.acquire()` to the pool.
+
+        The connection is rolled back first, and it is closed instead if the rollback fails.
+        """
+
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+            if entry is None:
+                raise TuruPoolUnknownConnectionError()
+
+        if not self._reset(connection):
+            self._close_all([entry])
+            self._forget()
+            self._fill()
+            return
+
+        with self._condition:
+            now = time.monotonic()
+            if self._closed or entry.is_expired(now, None, self._max_lifetime):
+                self._size -= 1
+                expired = [entry]
+
+            else:
+                entry.released_at = now
+                self._idle.append(entry)
+                expired = self._collect_expired(now)
+
+            self._condition.notify()
+
+        if expired:
+            self._close_all(expired)
+            self._fill()
+
+    def discard(self, connection: GenericConnection) -> None:
+        """Close a connection checked out by `.acquire()` instead of returning it,
+        such as after an unrecoverable error.
+        """
+
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+            if entry is None:
+                raise TuruPoolUnknownConnectionError()
+
+            self._size -= 1
+            self._condition.notify()
+
+        self._close_all([entry])
+        self._fill()
+
+    def connection(
+        self, timeout: Optional[float] = None
+    ) -> ContextManager[GenericConnection]:
+        """Check out a connection for the `with` block.
+
+        The connection is rolled back when it is returned after the block,
+        and it is closed instead if the rollback fails.
+
+        Parameters:
+            timeout: The seconds to wait, which defaults to the timeout of the pool.
+        """
+
+        return self._lend(lambda: self.acquire(timeout))
+
+    def close(self) -> None:
+        """Close the idle connections, and the ones in use when they are released."""
+
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        self._close_all(idle)
+
+    def execute(
+        self, operation: str, parameters: Optional[Parameters] = None, /
+    ) -> PooledCursor[Tuple[Any], Parameters]:
+        """Prepare and execute a database operation (query or command)
+        on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().execute()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return self._checkout_cursor(
+            lambda connection: connection.execute(operation, parameters)
+        )
+
+    def executemany(
+        self, operation: str, seq_of_parameters: Sequence[Parameters], /
+    ) -> PooledCursor[Tuple[Any], Parameters]:
+        """Execute a database operation against all parameter sequences or mappings
+        on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().executemany()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return self._checkout_cursor(
+            lambda connection: connection.executemany(operation, seq_of_parameters)
+        )
+
+    def execute_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> PooledCursor[turu.core.cursor.GenericNewRowType, Parameters]:
+        """Execute a database operation and map each row to a `row_type`
+        on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().execute_map()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return self._checkout_cursor(
+            lambda connection: connection.execute_map(
+                row_type, operation, parameters, **options
+            )
+        )
+
+    def executemany_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        seq_of_parameters: Sequence[Parameters],
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> PooledCursor[turu.core.cursor.GenericNewRowType, Parameters]:
+        """Execute a database operation against all parameter sequences or mappings
+        and map each row to a `row_type` on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().executemany_map()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return self._checkout_cursor(
+            lambda connection: connection.executemany_map(
+                row_type, operation, seq_of_parameters, **options
+            )
+        )
+
+    def select_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        from_clause: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> PooledCursor[turu.core.cursor.GenericNewRowType, Parameters]:
+        """Select the fields of `row_type` and map each row to `row_type`
+        on a connection checked out of the pool.
+
+        This is a shortcut to `.connection().select_map()`,
+        and the connection is returned to the pool when the cursor is closed.
+        """
+
+        return self._checkout_cursor(
+            lambda connection: connection.select_map(
+                row_type, from_clause, parameters, **options
+            )
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _checkout(
+        self, timeout: Optional[float], deadline: Optional[float], affinity: Any
+    ) -> Tuple[
+        Optional[PoolEntry[GenericConnection]], List[PoolEntry[GenericConnection]]
+    ]:
+        """Take an idle connection, or reserve a slot to open a new one as `None`.
+
+        The expired idle connections are returned to be closed out of the lock.
+        """
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise TuruPoolClosedError()
+
+                expired = self._collect_expired(time.monotonic())
+                if self._idle:
+                    return self._take_idle(affinity), expired
+
+                if self._size < self._max_size:
+                    self._size += 1
+
+                    return None, expired
+
+                # No connections are idle here, so none have expired either.
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TuruPoolTimeoutError(timeout or 0.0)
+
+                self._condition.wait(remaining)
+
+    @contextmanager
+    def _lend(
+        self, acquire: Callable[[], GenericConnection]
+    ) -> Iterator[GenericConnection]:
+        connection = acquire()
+        try:
+            yield connection
+
+        finally:
+            self.release(connection)
+
+    def _take_idle(self, affinity: Any) -> PoolEntry[GenericConnection]:
+        """Take the idle connection to hand out, which is the most recently used one.
+
+        Subclasses override this to prefer the connections matching `affinity`.
+        """
+
+        return self._idle.pop()
+
+    def _collect_expired(self, now: float) -> List[PoolEntry[GenericConnection]]:
+        """Remove the expired idle connections to be closed and replaced by `._fill()`.
+
+        The connections idle for too long are only removed past `min_size`,
+        since they would be replaced right away.
+        """
+
+        expired: List[PoolEntry[GenericConnection]] = []
+        for entry in list(self._idle):
+            idle_timeout = self._idle_timeout if self._size > self._min_size else None
+            if entry.is_expired(now, idle_timeout, self._max_lifetime):
+                self._idle.remove(entry)
+                self._size -= 1
+                expired.append(entry)
+
+        return expired
+
+    def _fill(self) -> None:
+        """Open idle connections until `min_size` connections are open.
+
+        A failure to connect is left to the next checkout, which opens a connection itself.
+        """
+
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self._min_size:
+                    return
+
+                self._size += 1
+
+            try:
+                entry = PoolEntry(self._connect())
+
+            except Exception:
+                self._forget()
+                return
+
+            with self._condition:
+                if not self._closed:
+                    self._idle.append(entry)
+                    self._condition.notify()
+                    continue
+
+                self._size -= 1
+
+            self._close_all([entry])
+            return
+
+    def _reset(self, connection: GenericConnection) -> bool:
+        """Roll back the transaction left open on `connection`, and return whether it succeeded.
+
+        Connections without transaction support raise `NotImplementedError`,
+        which leaves nothing to reset.
+        """
+
+        try:
+            connection.rollback()
+
+        except NotImplementedError:
+            return True
+
+        except Exception:
+            return False
+
+        return True
+
+    def _forget(self) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _ping(self, connection: GenericConnection) -> bool:
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(PING_OPERATION)
+                cursor.fetchall()
+
+            finally:
+                cursor.close()
+
+        except Exception:
+            return False
+
+        return True
+
+    @staticmethod
+    def _close_all(entries: List[PoolEntry[GenericConnection]]) -> None:
+        for entry in entries:
+            try:
+                entry.connection.close()
+
+            except Exception:
+                pass
+
+    def _checkout_cursor(
+        self, execute: Callable[[GenericConnection], turu.core.cursor.Cursor]
+    ) -> PooledCursor:
+        connection = self.acquire()
+        try:
+            return PooledCursor(self, connection, execute(connection))
+
+        except BaseException:
+            self.release(connection)
+            raise
@@ -0,0 +1,26 @@
+from turu.core.exception import TuruError
+
+
+class TuruPoolError(TuruError):
+    pass
+
+
+class TuruPoolTimeoutError(TuruPoolError):
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+
+    @property
+    def message(self) -> str:
+        return f"No connection became available within {self.timeout} seconds."
+
+
+class TuruPoolClosedError(TuruPoolError):
+    @property
+    def message(self) -> str:
+        return "The connection pool is closed."
+
+
+class TuruPoolUnknownConnectionError(TuruPoolError):
+    @property
+    def message(self) -> str:
+        return "The connection was not acquired from this pool."
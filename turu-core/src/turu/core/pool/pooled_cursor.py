@@ -0,0 +1,142 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    cast,
+)
+
+import turu.core.cursor
+from turu.core.protocols.cursor import Parameters
+from typing_extensions import Unpack
+
+if TYPE_CHECKING:
+    from turu.core.connection import Connection
+    from turu.core.pool.connection_pool import ConnectionPool
+
+
+class PooledCursor(
+    turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameters]
+):
+    """A cursor of a connection checked out of a `ConnectionPool`.
+
+    The connection is returned to the pool when the cursor is closed,
+    so use the cursor as a context manager or close it after fetching.
+    """
+
+    def __init__(
+        self,
+        pool: "ConnectionPool",
+        connection: "Connection",
+        cursor: turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameters],
+    ):
+        self._pool = pool
+        self._connection: Optional["Connection"] = connection
+        self.__pooled_target_cursor: turu.core.cursor.Cursor = cursor
+
+    @property
+    def rowcount(self) -> int:
+        return self.__pooled_target_cursor.rowcount
+
+    @property
+    def arraysize(self) -> int:
+        return self.__pooled_target_cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, size: int) -> None:
+        self.__pooled_target_cursor.arraysize = size
+
+    @property
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self.__pooled_target_cursor.description
+
+    @property
+    def _row_type(self) -> Optional[Type[Any]]:  # type: ignore[override]
+        return self.__pooled_target_cursor._row_type
+
+    @property
+    def _quote_identifier(self) -> Callable[[str], str]:  # type: ignore[override]
+        return self.__pooled_target_cursor._quote_identifier
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+        try:
+            self.__pooled_target_cursor.close()
+
+        finally:
+            self._pool.release(connection)
+
+    def execute(
+        self, operation: str, parameters: Optional[Parameters] = None, /
+    ) -> "PooledCursor[turu.core.cursor.GenericRowType, Parameters]":
+        self.__pooled_target_cursor = self.__pooled_target_cursor.execute(
+            operation, parameters
+        )
+
+        return self
+
+    def executemany(
+        self, operation: str, seq_of_parameters: "Sequence[Parameters]", /
+    ) -> "PooledCursor[turu.core.cursor.GenericRowType, Parameters]":
+        self.__pooled_target_cursor = self.__pooled_target_cursor.executemany(
+            operation, seq_of_parameters
+        )
+
+        return self
+
+    def execute_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> "PooledCursor[turu.core.cursor.GenericNewRowType, Parameters]":
+        self.__pooled_target_cursor = self.__pooled_target_cursor.execute_map(
+            row_type, operation, parameters, **options
+        )
+
+        return cast(PooledCursor, self)
+
+    def executemany_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        seq_of_parameters: Sequence[Parameters],
+        /,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> "PooledCursor[turu.core.cursor.GenericNewRowType, Parameters]":
+        self.__pooled_target_cursor = self.__pooled_target_cursor.executemany_map(
+            row_type, operation, seq_of_parameters, **options
+        )
+
+        return cast(PooledCursor, self)
+
+    def fetchone(self) -> Optional[turu.core.cursor.GenericRowType]:
+        return self.__pooled_target_cursor.fetchone()
+
+    def fetchmany(
+        self, size: Optional[int] = None
+    ) -> List[turu.core.cursor.GenericRowType]:
+        return self.__pooled_target_cursor.fetchmany(size)
+
+    def fetchall(self) -> List[turu.core.cursor.GenericRowType]:
+        return self.__pooled_target_cursor.fetchall()
+
+    def _fetchmany_raw(self, size: int) -> List[Any]:
+        return self.__pooled_target_cursor._fetchmany_raw(size)
+
+    def __iter__(self) -> "PooledCursor[turu.core.cursor.GenericRowType, Parameters]":
+        return self
+
+    def __next__(self) -> turu.core.cursor.GenericRowType:
+        return next(self.__pooled_target_cursor)
+
+    def __getattr__(self, name):
+        return getattr(self.__pooled_target_cursor, name)
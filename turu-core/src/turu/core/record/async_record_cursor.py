@@ -1,4 +1,6 @@
 from typing import (
+    Any,
+    Callable,
     List,
     Optional,
     Sequence,
@@ -10,6 +12,7 @@ import turu.core.async_cursor
 import turu.core.cursor
 from turu.core.protocols.cursor import Parameters
 from turu.core.record.recorder_protcol import RecorderProtcol
+from typing_extensions import Unpack
 
 
 class AsyncRecordCursor(
@@ -37,6 +40,14 @@ class AsyncRecordCursor(
     def arraysize(self, size: int) -> None:
         self.__record_taregt_cursor.arraysize = size
 
+    @property
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self.__record_taregt_cursor.description
+
+    @property
+    def _quote_identifier(self) -> Callable[[str], str]:  # type: ignore[override]
+        return self.__record_taregt_cursor._quote_identifier
+
     async def close(self) -> None:
         await self.__record_taregt_cursor.close()
         self._recorder.close()
@@ -65,9 +76,10 @@ class AsyncRecordCursor(
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "AsyncRecordCursor[turu.core.cursor.GenericNewRowType, Parameters]":
         self.__record_taregt_cursor = await self.__record_taregt_cursor.execute_map(
-            row_type, operation, parameters
+            row_type, operation, parameters, **options
         )
 
         return cast(AsyncRecordCursor, self)
@@ -78,9 +90,10 @@ class AsyncRecordCursor(
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "AsyncRecordCursor[turu.core.cursor.GenericNewRowType, Parameters]":
         self.__record_taregt_cursor = await self.__record_taregt_cursor.executemany_map(
-            row_type, operation, seq_of_parameters
+            row_type, operation, seq_of_parameters, **options
         )
 
         return cast(AsyncRecordCursor, self)
@@ -79,6 +79,9 @@ class CsvRecorder(RecorderProtcol):
             pass
 
         for row in rows:  # type: ignore
+            if isinstance(row, turu.core.cursor.LazyRow):
+                row = row.materialize()
+
             datatype = get_datatype(row)
 
             if self._writed_rowsize == 0:
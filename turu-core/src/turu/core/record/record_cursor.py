@@ -1,4 +1,6 @@
 from typing import (
+    Any,
+    Callable,
     List,
     Optional,
     Sequence,
@@ -9,6 +11,7 @@ from typing import (
 import turu.core.cursor
 from turu.core.protocols.cursor import Parameters
 from turu.core.record.recorder_protcol import RecorderProtcol
+from typing_extensions import Unpack
 
 
 class RecordCursor(
@@ -34,6 +37,14 @@ class RecordCursor(
     def arraysize(self, size: int) -> None:
         self.__record_taregt_cursor.arraysize = size
 
+    @property
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self.__record_taregt_cursor.description
+
+    @property
+    def _quote_identifier(self) -> Callable[[str], str]:  # type: ignore[override]
+        return self.__record_taregt_cursor._quote_identifier
+
     def close(self) -> None:
         self.__record_taregt_cursor.close()
         self._recorder.close()
@@ -62,9 +73,10 @@ class RecordCursor(
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "RecordCursor[turu.core.cursor.GenericNewRowType, Parameters]":
         self.__record_taregt_cursor = self.__record_taregt_cursor.execute_map(
-            row_type, operation, parameters
+            row_type, operation, parameters, **options
         )
 
         return cast(RecordCursor, self)
@@ -75,9 +87,10 @@ class RecordCursor(
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "RecordCursor[turu.core.cursor.GenericNewRowType, Parameters]":
         self.__record_taregt_cursor = self.__record_taregt_cursor.executemany_map(
-            row_type, operation, seq_of_parameters
+            row_type, operation, seq_of_parameters, **options
         )
 
         return cast(RecordCursor, self)
@@ -0,0 +1,107 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+import turu.core.mock
+from turu.core.features import USE_PYARROW
+
+if USE_PYARROW:
+    import pyarrow  # type: ignore[import]
+
+    from turu.core._arrow import ArrowBatchBuilder
+
+pytestmark = pytest.mark.skipif(not USE_PYARROW, reason="pyarrow is not found")
+
+
+@dataclass
+class Row:
+    id: int
+    name: Optional[str]
+
+
+class TestArrowBatchBuilder:
+    def test_build_raw_rows(self):
+        builder = ArrowBatchBuilder([("id",), ("name",)])
+
+        batch = builder.build([(1, "a"), (2, "b")])
+
+        assert batch.schema.names == ["id", "name"]
+        assert batch.to_pydict() == {"id": [1, 2], "name": ["a", "b"]}
+
+    def test_build_annotated_types(self):
+        builder = ArrowBatchBuilder([("id",), ("name",)], Row)
+
+        batch = builder.build([(1, None)])
+
+        assert batch.schema.field("id").type == pyarrow.int64()
+        assert batch.schema.field("name").type == pyarrow.string()
+
+    def test_build_unfit_annotated_types(self):
+        builder = ArrowBatchBuilder([("id",), ("name",)], Row)
+
+        batch = builder.build([("1", 2)])
+
+        assert batch.schema.field("id").type == pyarrow.string()
+        assert batch.schema.field("name").type == pyarrow.int64()
+
+    def test_to_table_promotes_null_columns(self):
+        builder = ArrowBatchBuilder([("id",)])
+
+        table = builder.to_table([builder.build([(None,)]), builder.build([(1,)])])
+
+        assert table.schema.field("id").type == pyarrow.int64()
+        assert table.to_pydict() == {"id": [None, 1]}
+
+    def test_to_table_promotes_null_columns_before_pyarrow_14(self):
+        builder = ArrowBatchBuilder([("id",)])
+        batches = [builder.build([(None,)]), builder.build([(1,)])]
+        calls = []
+
+        def concat_tables(tables, **kwargs):
+            calls.append(kwargs)
+            return pyarrow.concat_tables(tables, promote_options="default")
+
+        builder._pyarrow = SimpleNamespace(
+            __version__="13.0.0", Table=pyarrow.Table, concat_tables=concat_tables
+        )
+
+        assert builder.to_table(batches).to_pydict() == {"id": [None, 1]}
+        assert calls == [{"promote": True}]
+
+    def test_to_table_without_batches(self):
+        builder = ArrowBatchBuilder([("id",), ("name",)], Row)
+
+        table = builder.to_table([])
+
+        assert table.num_rows == 0
+        assert table.schema.names == ["id", "name"]
+
+
+class TestFetchArrow:
+    def test_fetch_arrow_all(self, mock_connection: turu.core.mock.MockConnection):
+        mock_connection.inject_response(Row, [Row(1, "a"), Row(2, "b")])
+
+        with mock_connection.execute_map(Row, "select 1, 'a'") as cursor:
+            table = cursor.fetch_arrow_all(size=1)
+
+        assert table.to_pydict() == {"id": [1, 2], "name": ["a", "b"]}
+
+    def test_fetch_arrow_batches(self, mock_connection: turu.core.mock.MockConnection):
+        mock_connection.inject_response(Row, [Row(1, "a"), Row(2, "b")])
+
+        with mock_connection.execute_map(Row, "select 1, 'a'") as cursor:
+            batches = list(cursor.fetch_arrow_batches(size=1))
+
+        assert [batch.num_rows for batch in batches] == [1, 1]
+
+
+def test_import_does_not_load_pyarrow():
+    code = (
+        "import sys, turu.core.cursor, turu.core.async_cursor;"
+        "assert 'pyarrow' not in sys.modules and 'numpy' not in sys.modules"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
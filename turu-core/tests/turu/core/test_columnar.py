@@ -0,0 +1,83 @@
+import array
+from dataclasses import dataclass
+
+import pytest
+import turu.core.mock
+from turu.core._columnar import ColumnsBuilder
+from turu.core.features import USE_NUMPY
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+
+
+def to_list(column):
+    return list(column)
+
+
+class TestColumnsBuilder:
+    def test_build_typed_columns(self):
+        builder = ColumnsBuilder([("id",), ("score",), ("name",)])
+        builder.extend([(1, 1.5, "a"), (2, 2.5, "b")])
+        builder.extend([(3, 3.5, "c")])
+
+        columns = builder.build()
+
+        assert list(columns) == ["id", "score", "name"]
+        assert to_list(columns["id"]) == [1, 2, 3]
+        assert to_list(columns["score"]) == [1.5, 2.5, 3.5]
+        assert columns["name"] == ["a", "b", "c"]
+
+    @pytest.mark.skipif(USE_NUMPY, reason="numpy is installed")
+    def test_build_array_columns(self):
+        builder = ColumnsBuilder([("id",)])
+        builder.extend([(1,), (2,)])
+
+        assert builder.build()["id"] == array.array("q", [1, 2])
+
+    @pytest.mark.skipif(not USE_NUMPY, reason="numpy is not found")
+    def test_build_numpy_columns(self):
+        import numpy  # type: ignore[import]
+
+        builder = ColumnsBuilder([("id",)])
+        builder.extend([(1,), (2,)])
+
+        assert isinstance(builder.build()["id"], numpy.ndarray)
+
+    def test_build_nullable_column(self):
+        builder = ColumnsBuilder([("id",)])
+        builder.extend([(1,), (2,)])
+        builder.extend([(3,), (None,)])
+
+        assert builder.build()["id"] == [1, 2, 3, None]
+
+    def test_build_without_rows(self):
+        assert ColumnsBuilder([("id",), ("name",)]).build() == {"id": [], "name": []}
+
+    def test_build_without_description(self):
+        builder = ColumnsBuilder(None)
+        builder.extend([(1, "a")])
+
+        assert to_list(builder.build()["0"]) == [1]
+
+    def test_build_mapped_rows(self):
+        builder = ColumnsBuilder(None)
+        builder.extend([Row(1, "a"), Row(2, "b")])
+
+        columns = builder.build()
+
+        assert to_list(columns["id"]) == [1, 2]
+        assert columns["name"] == ["a", "b"]
+
+
+class TestFetchColumns:
+    def test_fetch_columns(self, mock_connection: turu.core.mock.MockConnection):
+        mock_connection.inject_response(Row, [Row(1, "a"), Row(2, "b")])
+
+        with mock_connection.execute_map(Row, "select 1, 'a'") as cursor:
+            columns = cursor.fetch_columns(size=1)
+
+        assert to_list(columns["id"]) == [1, 2]
+        assert columns["name"] == ["a", "b"]
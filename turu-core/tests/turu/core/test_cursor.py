@@ -0,0 +1,393 @@
+import gc
+import weakref
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import pytest
+from turu.core._row_mapper import _ROW_MAPPERS
+from turu.core.cursor import (
+    LazyRow,
+    map_row,
+    map_rows,
+    quote_identifier,
+    render_select,
+    resolve_map_options,
+)
+from turu.core.exception import (
+    TuruRowTypeMismatchError,
+    TuruRowTypeNotSupportedError,
+)
+from turu.core.features import USE_PYDANTIC
+
+
+class RowNamedTuple(NamedTuple):
+    id: int
+    name: str
+
+
+@dataclass
+class RowDataclass:
+    id: int
+    name: str = "default"
+
+
+class TestMapRow:
+    def test_map_row_none(self):
+        assert map_row(None, (1, "a")) == (1, "a")
+
+    def test_map_row_named_tuple(self):
+        assert map_row(RowNamedTuple, (1, "a")) == RowNamedTuple(1, "a")
+
+    def test_map_row_dataclass(self):
+        assert map_row(RowDataclass, (1, "a")) == RowDataclass(1, "a")
+
+    def test_map_row_dataclass_with_extra_columns(self):
+        assert map_row(RowDataclass, (1, "a", "b")) == RowDataclass(1, "a")
+
+    def test_map_row_dataclass_with_missing_columns(self):
+        assert map_row(RowDataclass, (1,)) == RowDataclass(1)
+
+    def test_map_row_dataclass_keyword_field(self):
+        @dataclass
+        class Row:
+            id: int
+            kind: str = field(default="kind")
+
+        assert map_row(Row, [1, "a"]) == Row(1, "a")
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_row_pydantic(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+            name: str
+
+        assert map_row(Row, ("1", "a")) == Row(id=1, name="a")
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_row_pydantic_without_validation(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+            name: str = "default"
+
+        row = map_row(Row, ("1", "a"), validate=False)
+
+        assert row.id == "1"
+        assert row == Row.model_construct(id="1", name="a")
+        assert map_row(Row, (1,), validate=False) == Row(id=1)
+
+    def test_map_row_dataclass_by_name(self):
+        assert map_row(
+            RowDataclass, ("a", 1, "x"), columns=("name", "id", "extra")
+        ) == RowDataclass(1, "a")
+
+    def test_map_row_dataclass_by_name_with_missing_columns(self):
+        assert map_row(RowDataclass, (1,), columns=("id",)) == RowDataclass(1)
+
+    def test_map_row_named_tuple_by_name_case_insensitive(self):
+        assert map_row(RowNamedTuple, ("a", 1), columns=("NAME", "ID")) == (
+            RowNamedTuple(1, "a")
+        )
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_row_pydantic_by_name_without_validation(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+            name: str
+
+        assert map_row(Row, ("a", 1), validate=False, columns=("name", "id")) == Row(
+            id=1, name="a"
+        )
+
+    def test_map_row_not_supported(self):
+        class Row:
+            pass
+
+        with pytest.raises(TuruRowTypeMismatchError):
+            map_row(Row, (1,))
+
+    def test_map_row_mapper_cache(self):
+        map_row(RowDataclass, (1, "a"))
+
+        assert RowDataclass in _ROW_MAPPERS
+
+    def test_map_row_mapper_cache_eviction(self):
+        @dataclass
+        class Row:
+            id: int
+
+        map_row(Row, (1,))
+        assert Row in _ROW_MAPPERS
+
+        row_type_ref = weakref.ref(Row)
+        del Row
+        gc.collect()
+
+        assert row_type_ref() is None
+
+
+class TestMapRows:
+    def test_map_rows_none(self):
+        assert map_rows(None, [(1, "a"), (2, "b")]) == [(1, "a"), (2, "b")]
+
+    def test_map_rows_empty(self):
+        assert map_rows(RowDataclass, []) == []
+
+    def test_map_rows_named_tuple(self):
+        assert map_rows(RowNamedTuple, [(1, "a"), (2, "b")]) == [
+            RowNamedTuple(1, "a"),
+            RowNamedTuple(2, "b"),
+        ]
+
+    def test_map_rows_dataclass(self):
+        assert map_rows(RowDataclass, [(1, "a"), (2, "b")]) == [
+            RowDataclass(1, "a"),
+            RowDataclass(2, "b"),
+        ]
+
+    def test_map_rows_dataclass_with_extra_columns(self):
+        assert map_rows(RowDataclass, [(1, "a", "x"), (2, "b", "y")]) == [
+            RowDataclass(1, "a"),
+            RowDataclass(2, "b"),
+        ]
+
+    def test_map_rows_dataclass_with_missing_columns(self):
+        assert map_rows(RowDataclass, [(1, "a"), (2,)]) == [
+            RowDataclass(1, "a"),
+            RowDataclass(2),
+        ]
+
+    def test_map_rows_dataclass_without_init_field(self):
+        @dataclass
+        class Row:
+            id: int
+            name: str = field(default="name", init=False)
+
+        assert map_rows(Row, [(1,), (2,)]) == [Row(1), Row(2)]
+
+    def test_map_rows_dataclass_with_custom_init(self):
+        @dataclass(init=False)
+        class Row:
+            a: int
+            b: int
+
+            def __init__(self, b: int, a: int):
+                self.a = a
+                self.b = b
+
+        assert map_rows(Row, [(1, 2), (3, 4)]) == [Row(a=1, b=2), Row(a=3, b=4)]
+        assert map_rows(Row, [(1, 2)]) == [map_row(Row, (1, 2))]
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_rows_pydantic(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+            name: str
+
+        assert map_rows(Row, [("1", "a"), (2, "b")]) == [
+            Row(id=1, name="a"),
+            Row(id=2, name="b"),
+        ]
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_rows_pydantic_adapter_cache_eviction(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+
+        assert map_rows(Row, [(1,), (2,)]) == [Row(id=1), Row(id=2)]
+
+        row_type_ref = weakref.ref(Row)
+        del Row
+        gc.collect()
+
+        assert row_type_ref() is None
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_rows_pydantic_validation_error(self):
+        from pydantic import BaseModel, ValidationError  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+
+        with pytest.raises(ValidationError):
+            map_rows(Row, [(1,), ("a",)])
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_rows_pydantic_with_custom_init(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+
+            def __init__(self, **data):
+                data["id"] += 1
+                super().__init__(**data)
+
+        assert map_rows(Row, [(1,), (2,)]) == [Row(id=1), Row(id=2)]
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_rows_pydantic_without_validation(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+            name: str
+
+        assert map_rows(Row, [(1, "a"), (2, "b")], validate=False) == [
+            Row(id=1, name="a"),
+            Row(id=2, name="b"),
+        ]
+
+    def test_map_rows_dataclass_without_validation(self):
+        assert map_rows(RowDataclass, [(1, "a")], validate=False) == [
+            RowDataclass(1, "a")
+        ]
+
+    def test_map_rows_dataclass_by_name(self):
+        assert map_rows(RowDataclass, [("a", 1), ("b", 2)], columns=("name", "id")) == [
+            RowDataclass(1, "a"),
+            RowDataclass(2, "b"),
+        ]
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_map_rows_pydantic_by_name(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+            name: str
+
+        assert map_rows(Row, [("x", "a", "1")], columns=("extra", "name", "id")) == [
+            Row(id=1, name="a")
+        ]
+
+    def test_map_rows_not_supported(self):
+        class Row:
+            pass
+
+        with pytest.raises(TuruRowTypeMismatchError):
+            map_rows(Row, [(1,)])
+
+
+class TestLazyRow:
+    def test_lazy_row_read(self):
+        row = map_row(RowDataclass, (1, "a"), lazy=True)
+
+        assert isinstance(row, LazyRow)
+        assert (row.id, row.name) == (1, "a")
+        assert row._materialized is None
+
+    def test_lazy_row_materialize(self):
+        row = map_row(RowDataclass, (1, "a"), lazy=True)
+
+        assert row.materialize() == RowDataclass(1, "a")
+        assert row == RowDataclass(1, "a")
+
+    def test_lazy_row_write(self):
+        row = map_row(RowDataclass, (1, "a"), lazy=True)
+        row.name = "b"
+
+        assert row.name == "b"
+        assert row.materialize() == RowDataclass(1, "b")
+
+    def test_lazy_row_not_writable_attribute(self):
+        row = map_row(RowDataclass, (1, "a"), lazy=True)
+
+        with pytest.raises(AttributeError):
+            row.unknown = 1  # type: ignore[attr-defined]
+
+    def test_lazy_row_by_name_with_missing_columns(self):
+        row = map_row(RowDataclass, ("x", 1), columns=("extra", "id"), lazy=True)
+
+        assert row.id == 1
+        assert row.name == "default"
+
+    def test_lazy_rows_with_missing_columns(self):
+        assert map_rows(RowDataclass, [(1,)], lazy=True) == [RowDataclass(1)]
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_lazy_rows_pydantic(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+
+        rows = map_rows(Row, [("1",), ("2",)], lazy=True)
+
+        assert [row.id for row in rows] == ["1", "2"]
+        assert [row.materialize() for row in rows] == [Row(id=1), Row(id=2)]
+
+    def test_lazy_row_not_named_tuple(self):
+        class Row(tuple):
+            @classmethod
+            def _make(cls, row):
+                return cls(row)
+
+        assert map_row(Row, (1, 2), lazy=True) == Row((1, 2))
+
+
+class TestResolveMapOptions:
+    def test_resolve_map_options_empty(self):
+        assert resolve_map_options({}, [("id",), ("name",)]) == {}
+
+    def test_resolve_map_options_by_name(self):
+        assert resolve_map_options(
+            {"validate": False, "by_name": True}, [("id", None), ("name", None)]
+        ) == {"validate": False, "columns": ("id", "name")}
+
+    def test_resolve_map_options_lazy(self):
+        assert resolve_map_options({"lazy": True}, None) == {"lazy": True}
+
+    def test_resolve_map_options_by_name_without_description(self):
+        assert resolve_map_options({"by_name": True}, None) == {}
+
+
+class TestRenderSelect:
+    def test_render_select_named_tuple(self):
+        assert render_select(RowNamedTuple, "users") == 'SELECT "id", "name" FROM users'
+
+    def test_render_select_dataclass(self):
+        assert (
+            render_select(RowDataclass, "users WHERE id = ?")
+            == 'SELECT "id", "name" FROM users WHERE id = ?'
+        )
+
+    @pytest.mark.skipif(not USE_PYDANTIC, reason="pydantic is not found")
+    def test_render_select_pydantic(self):
+        from pydantic import BaseModel  # type: ignore[import]
+
+        class Row(BaseModel):
+            id: int
+            name: str
+
+        assert render_select(Row, "users") == 'SELECT "id", "name" FROM users'
+
+    def test_render_select_quote_identifier(self):
+        class Row(NamedTuple):
+            order: int
+            userName: str
+
+        assert render_select(Row, "t") == 'SELECT "order", "userName" FROM t'
+        assert (
+            render_select(Row, "t", lambda name: f"`{name}`")
+            == "SELECT `order`, `userName` FROM t"
+        )
+
+    def test_quote_identifier_escape(self):
+        assert quote_identifier('a"b') == '"a""b"'
+
+    def test_render_select_not_supported(self):
+        class Row:
+            pass
+
+        with pytest.raises(TuruRowTypeNotSupportedError):
+            render_select(Row, "users")  # type: ignore[arg-type]
@@ -306,3 +306,14 @@ class TestTuruMock:
         with pytest.raises(TuruMockResponseTypeMismatchError):
             with mock_connection.cursor() as cursor:
                 cursor.executemany_with_tag(tag.Update[Table], "UPDATE table", [])
+
+    def test_iter_batches(self, mock_connection: turu.core.mock.MockConnection):
+        mock_connection.inject_response(
+            RowDataclass, [RowDataclass(1), RowDataclass(2), RowDataclass(3)]
+        )
+
+        with mock_connection.execute_map(RowDataclass, "select 1") as cursor:
+            assert list(cursor.iter_batches(2)) == [
+                [RowDataclass(1), RowDataclass(2)],
+                [RowDataclass(3)],
+            ]
@@ -0,0 +1,223 @@
+import threading
+from typing import List, NamedTuple, Optional
+
+import pytest
+import turu.core.mock
+from turu.core.mock.store import TuruMockStore
+from turu.core.pool import (
+    ConnectionPool,
+    TuruPoolClosedError,
+    TuruPoolTimeoutError,
+    TuruPoolUnknownConnectionError,
+)
+
+from tests.conftest import MockConnection
+
+
+class Row(NamedTuple):
+    id: int
+
+
+class RollbackConnection(MockConnection):
+    def __init__(self, store: TuruMockStore) -> None:
+        super().__init__(store)
+        self.rollbacks = 0
+        self.rollback_error: Optional[Exception] = None
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        if self.rollback_error is not None:
+            raise self.rollback_error
+
+
+class ConnectionFactory:
+    def __init__(self) -> None:
+        self.store = TuruMockStore()
+        self.connections: List[RollbackConnection] = []
+
+    def __call__(self) -> RollbackConnection:
+        connection = RollbackConnection(self.store)
+        self.connections.append(connection)
+
+        return connection
+
+
+@pytest.fixture
+def connect() -> ConnectionFactory:
+    return ConnectionFactory()
+
+
+class TestConnectionPool:
+    def test_connection_is_reused(self, connect: ConnectionFactory):
+        with ConnectionPool(connect, max_size=2) as pool:
+            with pool.connection() as connection1:
+                pass
+
+            with pool.connection() as connection2:
+                pass
+
+            assert connection1 is connection2
+            assert len(connect.connections) == 1
+            assert pool.size == 1
+            assert pool.idle_size == 1
+
+    def test_min_size(self, connect: ConnectionFactory):
+        with ConnectionPool(connect, min_size=2, max_size=3) as pool:
+            assert len(connect.connections) == 2
+            assert pool.idle_size == 2
+
+    def test_invalid_size(self, connect: ConnectionFactory):
+        with pytest.raises(ValueError):
+            ConnectionPool(connect, max_size=0)
+
+        with pytest.raises(ValueError):
+            ConnectionPool(connect, min_size=2, max_size=1)
+
+    def test_acquire_timeout(self, connect: ConnectionFactory):
+        with ConnectionPool(connect, max_size=1) as pool:
+            connection = pool.acquire()
+
+            with pytest.raises(TuruPoolTimeoutError):
+                pool.acquire(timeout=0.01)
+
+            pool.release(connection)
+
+            assert pool.acquire(timeout=0.01) is connection
+
+    def test_acquire_waits_for_release(self, connect: ConnectionFactory):
+        with ConnectionPool(connect, max_size=1) as pool:
+            connection = pool.acquire()
+            timer = threading.Timer(0.05, pool.release, (connection,))
+            timer.start()
+
+            try:
+                assert pool.acquire(timeout=5.0) is connection
+
+            finally:
+                timer.join()
+
+    def test_release_unknown_connection(self, connect: ConnectionFactory):
+        with ConnectionPool(connect) as pool:
+            with pytest.raises(TuruPoolUnknownConnectionError):
+                pool.release(connect())
+
+    def test_max_lifetime(self, connect: ConnectionFactory):
+        with ConnectionPool(connect, max_lifetime=0.0) as pool:
+            with pool.connection() as connection1:
+                pass
+
+            with pool.connection() as connection2:
+                pass
+
+            assert connection1 is not connection2
+            assert pool.size == 0
+
+    def test_idle_timeout(self, connect: ConnectionFactory):
+        with ConnectionPool(connect, idle_timeout=0.0) as pool:
+            with pool.connection() as connection1:
+                pass
+
+            with pool.connection() as connection2:
+                pass
+
+            assert connection1 is not connection2
+
+    def test_pre_ping(self, connect: ConnectionFactory):
+        with ConnectionPool(connect, pre_ping=True) as pool:
+            with pool.connection() as connection1:
+                pass
+
+            connect.store.inject_response(None, RuntimeError("connection lost"))
+
+            with pool.connection() as connection2:
+                pass
+
+            assert connection1 is not connection2
+            assert pool.size == 1
+
+    def test_connection_with_error(self, connect: ConnectionFactory):
+        with ConnectionPool(connect) as pool:
+            with pytest.raises(RuntimeError):
+                with pool.connection():
+                    raise RuntimeError()
+
+            assert pool.idle_size == 1
+
+    def test_execute_map(self, connect: ConnectionFactory):
+        expected = [Row(1), Row(2)]
+        connect.store.inject_response(Row, expected)
+
+        with ConnectionPool(connect) as pool:
+            with pool.execute_map(Row, "SELECT 1") as cursor:
+                assert pool.idle_size == 0
+                assert cursor.fetchall() == expected
+
+            assert pool.idle_size == 1
+
+    def test_execute_map_with_error(self, connect: ConnectionFactory):
+        with ConnectionPool(connect) as pool:
+            with pytest.raises(turu.core.mock.exception.TuruMockStoreDataNotFoundError):
+                pool.execute_map(Row, "SELECT 1")
+
+            assert pool.idle_size == 1
+
+    def test_release_rolls_back(self, connect: ConnectionFactory):
+        with ConnectionPool(connect) as pool:
+            with pool.connection() as connection:
+                pass
+
+            assert connect.connections[0].rollbacks == 1
+            assert pool.acquire() is connection
+
+    def test_release_with_rollback_error(self, connect: ConnectionFactory):
+        with ConnectionPool(connect) as pool:
+            connection = pool.acquire()
+            connect.connections[0].rollback_error = RuntimeError("connection lost")
+            pool.release(connection)
+
+            assert pool.size == 0
+            assert pool.idle_size == 0
+            assert pool.acquire() is not connection
+
+    def test_release_with_unsupported_rollback(self, connect: ConnectionFactory):
+        with ConnectionPool(connect) as pool:
+            connection = pool.acquire()
+            connect.connections[0].rollback_error = NotImplementedError()
+            pool.release(connection)
+
+            assert pool.size == 1
+            assert pool.idle_size == 1
+            assert pool.acquire() is connection
+
+    def test_execute_map_with_error_rolls_back(self, connect: ConnectionFactory):
+        with ConnectionPool(connect) as pool:
+            with pytest.raises(turu.core.mock.exception.TuruMockStoreDataNotFoundError):
+                pool.execute_map(Row, "SELECT 1")
+
+            assert connect.connections[0].rollbacks == 1
+            assert pool.idle_size == 1
+
+    def test_expired_connections_are_refilled(self, connect: ConnectionFactory):
+        with ConnectionPool(connect, min_size=2, max_lifetime=60.0) as pool:
+            for entry in pool._idle:
+                entry.created_at -= 60.0
+
+            with pool.connection():
+                assert pool.size == 2
+                assert pool.idle_size == 1
+
+            assert len(connect.connections) == 4
+            assert pool.size == 2
+            assert pool.idle_size == 2
+
+    def test_close(self, connect: ConnectionFactory):
+        pool = ConnectionPool(connect)
+        connection = pool.acquire()
+        pool.close()
+
+        with pytest.raises(TuruPoolClosedError):
+            pool.acquire()
+
+        pool.release(connection)
+
+        assert pool.size == 0
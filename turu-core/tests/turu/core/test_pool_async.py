@@ -0,0 +1,281 @@
+import asyncio
+from typing import List, NamedTuple, Optional
+
+import pytest
+import turu.core.mock
+from turu.core.mock.store import TuruMockStore
+from turu.core.pool import (
+    AsyncConnectionPool,
+    TuruPoolClosedError,
+    TuruPoolTimeoutError,
+)
+
+from tests.conftest import MockAsyncConnection
+
+
+class Row(NamedTuple):
+    id: int
+
+
+class RollbackAsyncConnection(MockAsyncConnection):
+    def __init__(self, store: TuruMockStore) -> None:
+        super().__init__(store)
+        self.rollbacks = 0
+        self.rollback_error: Optional[Exception] = None
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+        if self.rollback_error is not None:
+            raise self.rollback_error
+
+
+class AsyncConnectionFactory:
+    def __init__(self) -> None:
+        self.store = TuruMockStore()
+        self.connections: List[RollbackAsyncConnection] = []
+
+    async def __call__(self) -> RollbackAsyncConnection:
+        connection = RollbackAsyncConnection(self.store)
+        self.connections.append(connection)
+
+        return connection
+
+
+@pytest.fixture
+def connect() -> AsyncConnectionFactory:
+    return AsyncConnectionFactory()
+
+
+class TestAsyncConnectionPool:
+    @pytest.mark.asyncio
+    async def test_connection_is_reused(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(connect, health_check_interval=None) as pool:
+            async with pool.connection() as connection1:
+                pass
+
+            async with pool.connection() as connection2:
+                pass
+
+            assert connection1 is connection2
+            assert len(connect.connections) == 1
+            assert pool.idle_size == 1
+
+    @pytest.mark.asyncio
+    async def test_min_size(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(
+            connect, min_size=2, health_check_interval=None
+        ) as pool:
+            assert len(connect.connections) == 2
+            assert pool.idle_size == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(
+            connect, max_size=1, health_check_interval=None
+        ) as pool:
+            connection = await pool.acquire()
+
+            with pytest.raises(TuruPoolTimeoutError):
+                await pool.acquire(timeout=0.01)
+
+            await pool.release(connection)
+
+            assert await pool.acquire(timeout=0.01) is connection
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_fifo(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(
+            connect, max_size=1, health_check_interval=None
+        ) as pool:
+            order: List[int] = []
+
+            async def use(i: int) -> None:
+                async with pool.connection():
+                    order.append(i)
+                    await asyncio.sleep(0)
+
+            connection = await pool.acquire()
+            tasks = [asyncio.create_task(use(i)) for i in range(5)]
+            await asyncio.sleep(0)
+            await pool.release(connection)
+            await asyncio.gather(*tasks)
+
+            assert order == list(range(5))
+            assert len(connect.connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(
+            connect, max_size=1, health_check_interval=None
+        ) as pool:
+            connection = await pool.acquire()
+            task = asyncio.create_task(pool.acquire())
+            await asyncio.sleep(0)
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            await pool.release(connection)
+
+            assert pool.idle_size == 1
+
+    @pytest.mark.asyncio
+    async def test_max_lifetime(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(
+            connect, max_lifetime=0.0, health_check_interval=None
+        ) as pool:
+            async with pool.connection() as connection1:
+                pass
+
+            async with pool.connection() as connection2:
+                pass
+
+            assert connection1 is not connection2
+            assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_check(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(
+            connect, min_size=1, health_check_interval=None
+        ) as pool:
+            connect.store.inject_response(None, RuntimeError("connection lost"))
+            await pool.check()
+
+            assert len(connect.connections) == 2
+            assert pool.size == 1
+
+    @pytest.mark.asyncio
+    async def test_check_keeps_other_connections_available(
+        self, connect: AsyncConnectionFactory, monkeypatch: pytest.MonkeyPatch
+    ):
+        ping_gate = asyncio.Event()
+
+        async def ping(connection: RollbackAsyncConnection) -> bool:
+            await ping_gate.wait()
+
+            return True
+
+        async with AsyncConnectionPool(
+            connect, min_size=2, health_check_interval=None
+        ) as pool:
+            monkeypatch.setattr(pool, "_ping", ping)
+            check = asyncio.create_task(pool.check())
+            await asyncio.sleep(0)
+
+            connection = await pool.acquire(timeout=0.1)
+            ping_gate.set()
+            await check
+
+            assert connection is connect.connections[1]
+            assert len(connect.connections) == 2
+            assert pool.idle_size == 1
+
+            await pool.release(connection)
+
+    @pytest.mark.asyncio
+    async def test_health_check_in_background(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(
+            connect, min_size=1, health_check_interval=0.01
+        ) as pool:
+            connect.store.inject_response(None, RuntimeError("connection lost"))
+            await asyncio.sleep(0.1)
+
+            assert len(connect.connections) >= 2
+            assert pool.size == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_map(self, connect: AsyncConnectionFactory):
+        expected = [Row(1), Row(2)]
+        connect.store.inject_response(Row, expected)
+
+        async with AsyncConnectionPool(connect, health_check_interval=None) as pool:
+            async with await pool.execute_map(Row, "SELECT 1") as cursor:
+                assert pool.idle_size == 0
+                assert await cursor.fetchall() == expected
+
+            assert pool.idle_size == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_map_with_error(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(connect, health_check_interval=None) as pool:
+            with pytest.raises(turu.core.mock.exception.TuruMockStoreDataNotFoundError):
+                await pool.execute_map(Row, "SELECT 1")
+
+            assert pool.idle_size == 1
+
+    @pytest.mark.asyncio
+    async def test_release_rolls_back(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(connect, health_check_interval=None) as pool:
+            async with pool.connection() as connection:
+                pass
+
+            assert connect.connections[0].rollbacks == 1
+            assert await pool.acquire() is connection
+
+    @pytest.mark.asyncio
+    async def test_release_with_rollback_error(self, connect: AsyncConnectionFactory):
+        async with AsyncConnectionPool(connect, health_check_interval=None) as pool:
+            connection = await pool.acquire()
+            connect.connections[0].rollback_error = RuntimeError("connection lost")
+            await pool.release(connection)
+
+            assert pool.size == 0
+            assert await pool.acquire() is not connection
+
+    @pytest.mark.asyncio
+    async def test_release_with_unsupported_rollback(
+        self, connect: AsyncConnectionFactory
+    ):
+        async with AsyncConnectionPool(connect, health_check_interval=None) as pool:
+            connection = await pool.acquire()
+            connect.connections[0].rollback_error = NotImplementedError()
+            await pool.release(connection)
+
+            assert pool.size == 1
+            assert pool.idle_size == 1
+            assert await pool.acquire() is connection
+
+    @pytest.mark.asyncio
+    async def test_expired_connections_are_refilled(
+        self, connect: AsyncConnectionFactory
+    ):
+        async with AsyncConnectionPool(
+            connect, min_size=2, max_lifetime=60.0, health_check_interval=None
+        ) as pool:
+            for entry in pool._idle:
+                entry.created_at -= 60.0
+
+            async with pool.connection():
+                assert pool.size == 2
+                assert pool.idle_size == 1
+
+            assert len(connect.connections) == 4
+            assert pool.size == 2
+            assert pool.idle_size == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_map_with_error_rolls_back(
+        self, connect: AsyncConnectionFactory
+    ):
+        async with AsyncConnectionPool(connect, health_check_interval=None) as pool:
+            with pytest.raises(turu.core.mock.exception.TuruMockStoreDataNotFoundError):
+                await pool.execute_map(Row, "SELECT 1")
+
+            assert connect.connections[0].rollbacks == 1
+            assert pool.idle_size == 1
+
+    @pytest.mark.asyncio
+    async def test_close(self, connect: AsyncConnectionFactory):
+        pool = AsyncConnectionPool(connect, max_size=1, health_check_interval=None)
+        connection = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        await pool.close()
+
+        with pytest.raises(TuruPoolClosedError):
+            await waiter
+
+        await pool.release(connection)
+
+        assert pool.size == 0
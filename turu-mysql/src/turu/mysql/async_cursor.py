@@ -12,10 +12,12 @@ import aiomysql
 import turu.core.async_cursor
 import turu.core.mock
 import turu.core.tag
+from turu.core.cursor import MapOptions, ResolvedMapOptions, resolve_map_options
 from turu.core.cursor import map_row as _map_row
-from typing_extensions import LiteralString, Never, override
+from turu.core.cursor import map_rows as _map_rows
+from typing_extensions import LiteralString, Never, Unpack, override
 
-from .cursor import Parameters
+from .cursor import Parameters, quote_identifier
 
 
 class AsyncCursor(
@@ -23,6 +25,8 @@ class AsyncCursor(
         turu.core.async_cursor.GenericRowType, Parameters
     ],
 ):
+    _quote_identifier = staticmethod(quote_identifier)
+
     def __init__(
         self,
         cursor: aiomysql.Cursor,
@@ -31,6 +35,7 @@ class AsyncCursor(
     ):
         self._raw_cursor = cursor
         self._row_type: Optional[Type[turu.core.async_cursor.GenericRowType]] = row_type
+        self._map_options: ResolvedMapOptions = {}
         self._aiter = None
 
     @property
@@ -45,6 +50,11 @@ class AsyncCursor(
     def arraysize(self, size: int) -> None:
         self._raw_cursor.arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     async def close(self) -> None:
         await self._raw_cursor.close()
@@ -55,6 +65,7 @@ class AsyncCursor(
     ) -> "AsyncCursor[Tuple[Any]]":
         await self._raw_cursor.execute(cast(LiteralString, operation), parameters)
         self._row_type = None
+        self._map_options = {}
 
         return cast(AsyncCursor, self)
 
@@ -66,6 +77,7 @@ class AsyncCursor(
             cast(LiteralString, operation), seq_of_parameters
         )
         self._row_type = None
+        self._map_options = {}
 
         return cast(AsyncCursor, self)
 
@@ -76,9 +88,11 @@ class AsyncCursor(
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[MapOptions],
     ) -> "AsyncCursor[turu.core.async_cursor.GenericNewRowType]":
         await self._raw_cursor.execute(cast(LiteralString, operation), parameters)
         self._row_type = cast(Type[turu.core.async_cursor.GenericRowType], row_type)
+        self._map_options = resolve_map_options(options, self._raw_cursor.description)
 
         return cast(AsyncCursor, self)
 
@@ -89,11 +103,13 @@ class AsyncCursor(
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[MapOptions],
     ) -> "AsyncCursor[turu.core.async_cursor.GenericNewRowType]":
         await self._raw_cursor.executemany(
             cast(LiteralString, operation), seq_of_parameters
         )
         self._row_type = cast(Type[turu.core.async_cursor.GenericRowType], row_type)
+        self._map_options = resolve_map_options(options, self._raw_cursor.description)
 
         return cast(AsyncCursor, self)
 
@@ -127,26 +143,29 @@ class AsyncCursor(
         if row is None:
             return None
 
-        return _map_row(self._row_type, row)
+        return _map_row(self._row_type, row, **self._map_options)
 
     @override
     async def fetchmany(
         self, size: Optional[int] = None
     ) -> List[turu.core.async_cursor.GenericRowType]:
-        return [
-            _map_row(self._row_type, row)
-            for row in (
-                await self._raw_cursor.fetchmany(
-                    size if size is not None else self.arraysize
-                )
-            )
-        ]
+        return _map_rows(
+            self._row_type,
+            await self._raw_cursor.fetchmany(
+                size if size is not None else self.arraysize
+            ),
+            **self._map_options,
+        )
 
     @override
     async def fetchall(self) -> List[turu.core.async_cursor.GenericRowType]:
-        return [
-            _map_row(self._row_type, row) for row in await self._raw_cursor.fetchall()
-        ]
+        return _map_rows(
+            self._row_type, await self._raw_cursor.fetchall(), **self._map_options
+        )
+
+    @override
+    async def _fetchmany_raw(self, size: int) -> List[Any]:
+        return await self._raw_cursor.fetchmany(size)
 
     @override
     def __aiter__(self) -> "AsyncCursor[turu.core.async_cursor.GenericRowType]":
@@ -159,4 +178,4 @@ class AsyncCursor(
             self._aiter = self._raw_cursor.__aiter__()
 
         next_row = await self._aiter.__anext__()
-        return _map_row(self._row_type, next_row)
+        return _map_row(self._row_type, next_row, **self._map_options)
@@ -4,14 +4,22 @@ import pymysql.cursors
 import turu.core.cursor
 import turu.core.mock
 import turu.core.tag
-from typing_extensions import LiteralString, Never, override
+from typing_extensions import LiteralString, Never, Unpack, override
 
 Parameters = Union[Sequence[Any], Mapping[str, Any]]
 
 
+def quote_identifier(name: str) -> str:
+    """Quote `name` as a MySQL identifier, `` `name` ``."""
+
+    return "`" + name.replace("`", "``") + "`"
+
+
 class Cursor(
     turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameters],
 ):
+    _quote_identifier = staticmethod(quote_identifier)
+
     def __init__(
         self,
         cursor: pymysql.cursors.Cursor,
@@ -20,6 +28,7 @@ class Cursor(
     ):
         self._raw_cursor = cursor
         self._row_type: Optional[Type[turu.core.cursor.GenericRowType]] = row_type
+        self._map_options: turu.core.cursor.ResolvedMapOptions = {}
         self._iter = None
 
     @property
@@ -34,6 +43,11 @@ class Cursor(
     def arraysize(self, size: int) -> None:
         self._raw_cursor.arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     def close(self) -> None:
         self._raw_cursor.close()
@@ -47,6 +61,7 @@ class Cursor(
     ) -> "Cursor[turu.core.cursor.GenericRowType]":
         self._raw_cursor.execute(cast(LiteralString, operation), parameters)
         self._row_type = None
+        self._map_options = {}
 
         return self
 
@@ -59,6 +74,7 @@ class Cursor(
     ) -> "Cursor[turu.core.cursor.GenericRowType]":
         self._raw_cursor.executemany(cast(LiteralString, operation), seq_of_parameters)
         self._row_type = None
+        self._map_options = {}
 
         return self
 
@@ -69,9 +85,13 @@ class Cursor(
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "Cursor[turu.core.cursor.GenericNewRowType]":
         self._raw_cursor.execute(cast(LiteralString, operation), parameters)
         self._row_type = cast(Type[turu.core.cursor.GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            options, self._raw_cursor.description
+        )
 
         return self  # type: ignore
 
@@ -82,9 +102,13 @@ class Cursor(
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "Cursor[turu.core.cursor.GenericNewRowType]":
         self._raw_cursor.executemany(cast(LiteralString, operation), seq_of_parameters)
         self._row_type = cast(Type[turu.core.cursor.GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            options, self._raw_cursor.description
+        )
 
         return cast(Cursor, self)
 
@@ -113,7 +137,7 @@ class Cursor(
             return None
 
         elif self._row_type is not None:
-            return turu.core.cursor.map_row(self._row_type, row)
+            return turu.core.cursor.map_row(self._row_type, row, **self._map_options)
 
         else:
             return row  # type: ignore
@@ -122,19 +146,21 @@ class Cursor(
     def fetchmany(
         self, size: Optional[int] = None
     ) -> List[turu.core.cursor.GenericRowType]:
-        return [
-            turu.core.cursor.map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchmany(
-                size if size is not None else self.arraysize
-            )
-        ]
+        return turu.core.cursor.map_rows(
+            self._row_type,
+            self._raw_cursor.fetchmany(size if size is not None else self.arraysize),
+            **self._map_options,
+        )
 
     @override
     def fetchall(self) -> List[turu.core.cursor.GenericRowType]:
-        return [
-            turu.core.cursor.map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchall()
-        ]
+        return turu.core.cursor.map_rows(
+            self._row_type, self._raw_cursor.fetchall(), **self._map_options
+        )
+
+    @override
+    def _fetchmany_raw(self, size: int) -> List[Any]:
+        return self._raw_cursor.fetchmany(size)
 
     @override
     def __iter__(self) -> "Cursor[turu.core.cursor.GenericRowType]":
@@ -148,7 +174,9 @@ class Cursor(
 
         next_row = next(self._iter)
         if self._row_type is not None and next_row is not None:
-            return turu.core.cursor.map_row(self._row_type, next_row)
+            return turu.core.cursor.map_row(
+                self._row_type, next_row, **self._map_options
+            )
 
         else:
             return next_row  # type: ignore
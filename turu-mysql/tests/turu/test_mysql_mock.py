@@ -3,6 +3,7 @@ from dataclasses import dataclass
 import pytest
 from pydantic import BaseModel
 from turu.core import tag
+from turu.core.cursor import render_select
 from turu.core.mock.exception import TuruMockResponseTypeMismatchError
 from turu.mysql import MockConnection
 
@@ -199,3 +200,12 @@ class TestTuruMysqlMock:
         with pytest.raises(TuruMockResponseTypeMismatchError):
             with mock_connection.cursor() as cursor:
                 cursor.executemany_with_tag(tag.Update[Table], "UPDATE table", [])
+
+    def test_select_map_quotes_with_backticks(self, mock_connection: MockConnection):
+        class Keyword(BaseModel):
+            order: int
+
+        assert (
+            render_select(Keyword, "t", mock_connection.cursor()._quote_identifier)
+            == "SELECT `order` FROM t"
+        )
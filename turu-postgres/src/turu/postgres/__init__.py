@@ -1,5 +1,7 @@
 import importlib.metadata
 
+from ._prepare import PreparedStatement as PreparedStatement
+from ._prepare import PrepareStats as PrepareStats
 from .async_connection import AsyncConnection as AsyncConnection
 from .async_cursor import AsyncCursor as AsyncCursor
 from .connection import Connection as Connection
@@ -0,0 +1,193 @@
+import codecs
+import io
+from operator import attrgetter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+import psycopg
+import psycopg.abc
+import psycopg.pq
+from psycopg import sql
+from turu.core._row_mapper import get_field_names
+from turu.core.exception import TuruRowTypeNotSupportedError
+from typing_extensions import Literal, LiteralString
+
+CopyColumns = Union[Sequence[str], Type[Any], None]
+
+CopyFormat = Literal["csv", "text", "binary"]
+
+CopyInFormat = Literal["text", "binary"]
+
+
+class CopySink(Protocol):
+    """A file-like object that `copy_out` writes to, such as a file opened in binary mode.
+
+    Text files are written the decoded chunks,
+    and the async cursors await the result of `write` if it is awaitable.
+    """
+
+    def write(self, data: Any, /) -> Union[Any, Awaitable[Any]]: ...
+
+
+def resolve_copy_columns(
+    row: Any, columns: CopyColumns
+) -> Tuple[Optional[Tuple[str, ...]], Optional[Callable[[Any], Sequence[Any]]]]:
+    """Resolve the column list of the rows like `row`,
+    and the function to get the column values of a row if it is not a sequence of them.
+
+    The column list follows the field order of the row type, like `map_row`.
+    Plain sequences without `columns` are copied in the column order of the table.
+    """
+
+    if isinstance(columns, type):
+        names: Optional[Tuple[str, ...]] = get_field_names(columns)
+
+    elif columns is not None:
+        names = tuple(columns)
+
+    else:
+        names = None
+
+    try:
+        field_names = get_field_names(type(row))
+
+    except TuruRowTypeNotSupportedError:
+        return names, None
+
+    if names is None:
+        names = field_names
+
+    if isinstance(row, tuple) and field_names == names:
+        return names, None
+
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+
+        return names, lambda row: (getter(row),)
+
+    return names, attrgetter(*names)
+
+
+def render_table(table: str, names: Optional[Tuple[str, ...]]) -> sql.Composed:
+    """Render `<table> (<names>)` with the identifiers quoted."""
+
+    if names is None:
+        return sql.SQL("{}").format(sql.Identifier(*table.split(".")))
+
+    return sql.SQL("{} ({})").format(
+        sql.Identifier(*table.split(".")),
+        sql.SQL(", ").join(map(sql.Identifier, names)),
+    )
+
+
+def render_describe(table: str, names: Optional[Tuple[str, ...]]) -> sql.Composed:
+    """Render a query that returns no rows, to get the column types of the copy."""
+
+    return sql.SQL("SELECT {} FROM {} LIMIT 0").format(
+        sql.SQL("*")
+        if names is None
+        else sql.SQL(", ").join(map(sql.Identifier, names)),
+        sql.Identifier(*table.split(".")),
+    )
+
+
+def render_copy_in(
+    table: str, names: Optional[Tuple[str, ...]], format: CopyInFormat
+) -> sql.Composed:
+    """Render `COPY <table> (<names>) FROM STDIN`."""
+
+    if format == "text":
+        options = "FORMAT TEXT"
+
+    elif format == "binary":
+        options = "FORMAT BINARY"
+
+    else:
+        raise ValueError(f"unsupported copy format: {format}")
+
+    return sql.SQL("COPY {} FROM STDIN ({})").format(
+        render_table(table, names), sql.SQL(options)
+    )
+
+
+def render_copy_out(query: str, format: CopyFormat, header: bool) -> sql.Composed:
+    """Render `COPY (<query>) TO STDOUT`."""
+
+    if format == "csv":
+        options = "FORMAT CSV, HEADER" if header else "FORMAT CSV"
+
+    elif format == "text":
+        options = "FORMAT TEXT"
+
+    elif format == "binary":
+        options = "FORMAT BINARY"
+
+    else:
+        raise ValueError(f"unsupported copy format: {format}")
+
+    return sql.SQL("COPY ({}) TO STDOUT ({})").format(
+        sql.SQL(cast(LiteralString, query)), sql.SQL(options)
+    )
+
+
+def get_chunk_writer(
+    sink: CopySink, format: CopyFormat, encoding: str
+) -> Callable[[Union[bytes, memoryview]], Any]:
+    """Return the function to write a chunk of `COPY TO` to `sink`.
+
+    Text files are written the chunks decoded incrementally,
+    since a character may be split across two chunks.
+
+    Raises:
+        ValueError: If the binary format is written to a text file.
+    """
+
+    if not isinstance(sink, io.TextIOBase):
+        return sink.write
+
+    if format == "binary":
+        raise ValueError("the binary format cannot be written to a text file")
+
+    decode = codecs.getincrementaldecoder(encoding)().decode
+
+    return lambda chunk: sink.write(decode(chunk))
+
+
+def get_binary_types(
+    context: psycopg.abc.AdaptContext, description: Optional[Sequence[Any]]
+) -> List[int]:
+    """Return the column type OIDs to copy in binary format.
+
+    Raises:
+        ValueError: If a column type cannot be dumped in binary format.
+    """
+
+    if description is None:
+        raise ValueError("the columns of the copy are unknown")
+
+    oids: List[int] = []
+    for column in description:
+        try:
+            context.adapters.get_dumper_by_oid(
+                column.type_code, psycopg.pq.Format.BINARY
+            )
+
+        except psycopg.ProgrammingError as error:
+            raise ValueError(
+                f"column {column.name!r} cannot be copied in binary format"
+            ) from error
+
+        oids.append(column.type_code)
+
+    return oids
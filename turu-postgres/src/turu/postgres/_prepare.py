@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
+
+import psycopg
+from typing_extensions import override
+
+_PREPARE_MANAGER_VERSIONS = ((3, 1), (3, 4))
+"""The psycopg versions, from inclusive to exclusive, whose cache the statistics are counted for.
+
+The statistics hook into psycopg's private `PrepareManager`,
+so newer versions are left alone until they are checked.
+"""
+
+_PREPARE_MANAGER_HOOKS = ("get", "maybe_add_to_cache", "_rotate", "clear", "key")
+"""The members of `PrepareManager` that the statistics rely on."""
+
+
+def _get_psycopg_version() -> Tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in psycopg.__version__.split(".")[:2])
+
+    except ValueError:
+        return ()
+
+
+try:
+    from psycopg._preparing import Prepare, PrepareManager
+
+    _USE_PREPARE_MANAGER = (
+        _PREPARE_MANAGER_VERSIONS[0]
+        <= _get_psycopg_version()
+        < _PREPARE_MANAGER_VERSIONS[1]
+    ) and all(hasattr(PrepareManager, name) for name in _PREPARE_MANAGER_HOOKS)
+
+except ImportError:
+    _USE_PREPARE_MANAGER = False
+
+
+class PreparedStatement(str):
+    """An operation that is prepared on its first execution,
+    instead of after `prepare_threshold` executions, and reused afterwards.
+
+    This is a `str`, so it can be passed to `.execute()` and `.execute_map()` as it is.
+    """
+
+    __slots__ = ()
+
+
+def new_prepared_statement(
+    connection: Union[psycopg.Connection, psycopg.AsyncConnection], operation: str
+) -> PreparedStatement:
+    """Return `operation` as a `PreparedStatement` of `connection`.
+
+    Raises:
+        ValueError: If `connection` does not prepare statements, since `prepare_threshold` is `None`.
+    """
+
+    if connection.prepare_threshold is None:
+        raise ValueError(
+            "prepared statements are disabled by prepare_threshold=None on the connection"
+        )
+
+    return PreparedStatement(operation)
+
+
+def get_prepare_options(cursor: Any, operation: str) -> Dict[str, Any]:
+    """Return the keyword arguments to execute `operation` with on `cursor`.
+
+    Only the client-side cursors take `prepare`, since the server-side cursors declare their query.
+    """
+
+    if isinstance(operation, PreparedStatement) and not isinstance(
+        cursor, (psycopg.ServerCursor, psycopg.AsyncServerCursor)
+    ):
+        return {"prepare": True}
+
+    return {}
+
+
+@dataclass(frozen=True)
+class PrepareStats:
+    """Statistics of the prepared statements cache of a connection."""
+
+    prepared: int = 0
+    """The number of statements prepared and added to the cache."""
+
+    hits: int = 0
+    """The number of executions that used a prepared statement."""
+
+    misses: int = 0
+    """The number of executions that did not use a prepared statement."""
+
+    evictions: int = 0
+    """The number of prepared statements removed from the cache."""
+
+
+if _USE_PREPARE_MANAGER:
+
+    class _StatsPrepareManager(PrepareManager):
+        """psycopg's prepared statements cache, counting its hits, misses and evictions."""
+
+        prepared = 0
+        hits = 0
+        misses = 0
+        evictions = 0
+
+        @override
+        def get(self, query: Any, prepare: Optional[bool] = None) -> Tuple[Any, bytes]:
+            prep, name = super().get(query, prepare)
+            if prepare is False or self.prepare_threshold is None:
+                # NOTE: The cache is not used, so there is nothing to count.
+                return prep, name
+
+            if prep is Prepare.YES:
+                self.hits += 1
+
+            else:
+                self.misses += 1
+
+            return prep, name
+
+        @override
+        def maybe_add_to_cache(self, query: Any, prep: Prepare, name: bytes) -> Any:
+            key = super().maybe_add_to_cache(query, prep, name)
+            if prep is Prepare.SHOULD and self._names.get(self.key(query)) == name:
+                # NOTE: Outside a pipeline, a failed PREPARE raises before this is called.
+                self.prepared += 1
+
+            return key
+
+        @override
+        def _rotate(self) -> Any:
+            size = len(self._names)
+            result = super()._rotate()
+            self.evictions += size - len(self._names)
+
+            return result
+
+        @override
+        def clear(self) -> Any:
+            self.evictions += len(self._names)
+
+            return super().clear()
+
+
+def track_prepare_stats(
+    connection: Union[psycopg.Connection, psycopg.AsyncConnection],
+) -> None:
+    """Count the hits, misses and evictions of the prepared statements cache of `connection`.
+
+    The statistics are not available if psycopg does not manage the cache as expected,
+    or its version is not in `_PREPARE_MANAGER_VERSIONS`.
+    """
+
+    if not _USE_PREPARE_MANAGER:
+        return
+
+    manager = getattr(connection, "_prepared", None)
+    if type(manager) is not PrepareManager:
+        return
+
+    stats_manager = _StatsPrepareManager()
+    stats_manager.__dict__.update(manager.__dict__)
+    connection._prepared = stats_manager  # type: ignore[attr-defined]
+
+
+def get_prepare_stats(
+    connection: Union[psycopg.Connection, psycopg.AsyncConnection],
+) -> PrepareStats:
+    """Return the statistics of the prepared statements cache of `connection`."""
+
+    manager = getattr(connection, "_prepared", None)
+    if not _USE_PREPARE_MANAGER or not isinstance(manager, _StatsPrepareManager):
+        return PrepareStats()
+
+    return PrepareStats(
+        prepared=manager.prepared,
+        hits=manager.hits,
+        misses=manager.misses,
+        evictions=manager.evictions,
+    )
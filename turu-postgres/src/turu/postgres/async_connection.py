@@ -1,21 +1,47 @@
 import os
-from typing import Optional, Type, Union
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncGenerator,
+    Iterable,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
 
 import psycopg
 import psycopg.abc
 import psycopg.rows
 import turu.core.async_connection
+import turu.core.async_cursor
 import turu.core.mock
 import turu.postgres.async_cursor
 import turu.postgres.cursor
-from typing_extensions import Never, Self, override
+from typing_extensions import Never, Self, Unpack, override
 
+from ._copy import CopyColumns, CopyFormat, CopyInFormat, CopySink
+from ._prepare import (
+    PreparedStatement,
+    PrepareStats,
+    get_prepare_stats,
+    new_prepared_statement,
+    track_prepare_stats,
+)
 from .async_cursor import AsyncCursor
+from .cursor import (
+    CursorOptions,
+    ExecuteMapOptions,
+    Parameters,
+    new_raw_cursor,
+    pop_cursor_options,
+)
 
 
 class AsyncConnection(turu.core.async_connection.AsyncConnection):
     def __init__(self, connection: psycopg.AsyncConnection):
         self._raw_connection = connection
+        track_prepare_stats(connection)
 
     @override
     @classmethod
@@ -94,5 +120,183 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         await self._raw_connection.rollback()
 
     @override
-    async def cursor(self) -> AsyncCursor[Never]:
-        return AsyncCursor(self._raw_connection.cursor())
+    async def cursor(self, **options: Unpack[CursorOptions]) -> "AsyncCursor[Never]":
+        """Create a new cursor.
+
+        Parameters:
+            options: Options for the cursor, such as `server_side=True`
+                to stream large results with a server-side cursor.
+        """
+
+        return AsyncCursor(new_raw_cursor(self._raw_connection, options))
+
+    @override
+    async def execute_map(
+        self,
+        row_type: Type[turu.core.async_cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        **options: Unpack[ExecuteMapOptions],
+    ) -> "AsyncCursor[turu.core.async_cursor.GenericNewRowType]":
+        """
+        Execute a database operation (query or command) and map each row to a `row_type`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is simply a convenient shortcut to `.cursor().execute_map()`.
+
+        Parameters:
+            row_type: The type of the row that will be returned.
+            operation: A database operation (query or command).
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            options: Options for the cursor and for mapping rows to `row_type`.
+
+        Returns:
+            A cursor that holds a reference to an operation.
+        """
+
+        cursor_options = pop_cursor_options(options)
+
+        return cast(
+            AsyncCursor,
+            await (await self.cursor(**cursor_options)).execute_map(
+                row_type, operation, parameters, **options
+            ),
+        )
+
+    def prepare(self, operation: str) -> PreparedStatement:
+        """Mark `operation` to be prepared on its first execution and reused afterwards,
+        instead of after `prepare_threshold` executions.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/).
+
+        Parameters:
+            operation: A database operation (query or command).
+
+        Returns:
+            A handle of the operation, which can be passed to `.execute()` and `.execute_map()`.
+
+        Raises:
+            ValueError: If the connection does not prepare statements, since `prepare_threshold` is `None`.
+        """
+
+        return new_prepared_statement(self._raw_connection, operation)
+
+    @property
+    def prepare_stats(self) -> PrepareStats:
+        """The statistics of the prepared statements cache of this connection."""
+
+        return get_prepare_stats(self._raw_connection)
+
+    def pipeline(self) -> AsyncContextManager[psycopg.AsyncPipeline]:
+        """Enter psycopg's pipeline mode, in which statements are sent
+        without waiting for the results of the previous ones.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but saves the round-trips of many small independent statements.
+        The results are synced when the context exits, or by `AsyncPipeline.sync()`.
+
+        `.executemany()` already uses the pipeline mode when libpq supports it.
+
+        Returns:
+            An async context manager of the pipeline.
+        """
+
+        return self._raw_connection.pipeline()
+
+    async def copy_in(
+        self,
+        table: str,
+        rows: Iterable[Any],
+        columns: CopyColumns = None,
+        /,
+        *,
+        format: CopyInFormat = "text",
+    ) -> AsyncCursor[Never]:
+        """Load `rows` into `table` with `COPY ... FROM STDIN`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is simply a convenient shortcut to `.cursor().copy_in()`.
+
+        Parameters:
+            table: The name of the table, which may be qualified by the schema.
+            rows: The rows to load, which are row objects or sequences of the column values.
+            columns: The column names or the row type to derive them from.
+            format: The format of the copy, which is `"text"` or `"binary"`.
+
+        Returns:
+            A cursor whose `.rowcount` is the number of the loaded rows.
+        """
+
+        return await (await self.cursor()).copy_in(table, rows, columns, format=format)
+
+    async def copy_out(
+        self,
+        query: str,
+        sink: CopySink,
+        /,
+        parameters: Optional[Parameters] = None,
+        *,
+        format: CopyFormat = "csv",
+        header: bool = True,
+    ) -> AsyncCursor[Never]:
+        """Export the result of `query` to `sink` with `COPY (...) TO STDOUT`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is simply a convenient shortcut to `.cursor().copy_out()`.
+
+        Parameters:
+            query: The query to export.
+            sink: The file-like object to write the chunks to.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the query.
+            format: The format of the export, which is `"csv"`, `"text"` or `"binary"`.
+                The `"binary"` format needs a sink opened in binary mode.
+            header: Whether to write the header line in the `"csv"` format.
+
+        Returns:
+            A cursor whose `.rowcount` is the number of the exported rows.
+        """
+
+        return await (await self.cursor()).copy_out(
+            query, sink, parameters, format=format, header=header
+        )
+
+    async def stream_map(
+        self,
+        row_type: Type[turu.core.async_cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        *,
+        size: int = 1,
+        **options: Unpack[turu.core.async_cursor.MapOptions],
+    ) -> AsyncGenerator[turu.core.async_cursor.GenericNewRowType, None]:
+        """Execute a query and map each row to a `row_type` while the rows arrive.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is simply a convenient shortcut to `.cursor().stream_map()`,
+        which closes the cursor at the end.
+
+        Parameters:
+            row_type: The type of the row that will be returned.
+            operation: A database query.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            size: The number of rows to receive from the server at a time, which requires libpq 17 if larger than 1.
+            options: Options for mapping rows to `row_type`.
+
+        Returns:
+            An iterator of the mapped rows.
+        """
+
+        cursor = await self.cursor()
+        rows = cast(
+            AsyncGenerator[turu.core.async_cursor.GenericNewRowType, None],
+            cursor.stream_map(row_type, operation, parameters, size=size, **options),
+        )
+        try:
+            async for row in rows:
+                yield row
+
+        finally:
+            await rows.aclose()
+            await cursor.close()
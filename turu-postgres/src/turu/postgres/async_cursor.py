@@ -1,5 +1,13 @@
+import contextlib
+import inspect
 from typing import (
+    TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -12,10 +20,26 @@ import psycopg
 import turu.core.async_cursor
 import turu.core.mock
 import turu.core.tag
-from turu.core.cursor import map_row as _map_row
-from typing_extensions import LiteralString, Never, override
+from turu.core.cursor import MapOptions, map_rows, resolve_map_options
+from typing_extensions import LiteralString, Never, Unpack, override
 
-from .cursor import Parameters
+from ._copy import (
+    CopyColumns,
+    CopyFormat,
+    CopyInFormat,
+    CopySink,
+    get_binary_types,
+    get_chunk_writer,
+    render_copy_in,
+    render_copy_out,
+    render_describe,
+    resolve_copy_columns,
+)
+from ._prepare import get_prepare_options
+from .cursor import Parameters, get_row_factory
+
+if TYPE_CHECKING:
+    from turu.core.features import PyArrowRecordBatch, PyArrowTable
 
 
 class AsyncCursor(
@@ -30,8 +54,13 @@ class AsyncCursor(
         row_type: Optional[Type[turu.core.async_cursor.GenericRowType]] = None,
     ):
         self._raw_cursor = cursor
+        self._raw_row_factory = cursor.row_factory
         self._row_type: Optional[Type[turu.core.async_cursor.GenericRowType]] = row_type
+        self._map_options: MapOptions = {}
+        self._chain_results = False
         self._aiter = None
+        if row_type is not None:
+            cursor.row_factory = get_row_factory(row_type, {})
 
     @property
     def rowcount(self) -> int:
@@ -45,6 +74,11 @@ class AsyncCursor(
     def arraysize(self, size: int) -> None:
         self._raw_cursor.arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     async def close(self) -> None:
         await self._raw_cursor.close()
@@ -53,8 +87,14 @@ class AsyncCursor(
     async def execute(
         self, operation: str, parameters: Optional[Parameters] = None, /
     ) -> "AsyncCursor[Tuple[Any]]":
-        await self._raw_cursor.execute(cast(LiteralString, operation), parameters)
+        self._raw_cursor.row_factory = self._raw_row_factory
+        await self._raw_cursor.execute(
+            cast(LiteralString, operation),
+            parameters,
+            **get_prepare_options(self._raw_cursor, operation),
+        )
         self._row_type = None
+        self._chain_results = False
 
         return cast(AsyncCursor, self)
 
@@ -62,10 +102,12 @@ class AsyncCursor(
     async def executemany(
         self, operation: str, seq_of_parameters: Sequence[Parameters], /
     ) -> "AsyncCursor[Tuple[Any]]":
+        self._raw_cursor.row_factory = self._raw_row_factory
         await self._raw_cursor.executemany(
             cast(LiteralString, operation), seq_of_parameters
         )
         self._row_type = None
+        self._chain_results = False
 
         return cast(AsyncCursor, self)
 
@@ -76,9 +118,17 @@ class AsyncCursor(
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[MapOptions],
     ) -> "AsyncCursor[turu.core.async_cursor.GenericNewRowType]":
-        await self._raw_cursor.execute(cast(LiteralString, operation), parameters)
+        self._raw_cursor.row_factory = get_row_factory(row_type, options)
+        await self._raw_cursor.execute(
+            cast(LiteralString, operation),
+            parameters,
+            **get_prepare_options(self._raw_cursor, operation),
+        )
         self._row_type = cast(Type[turu.core.async_cursor.GenericRowType], row_type)
+        self._map_options = options
+        self._chain_results = False
 
         return cast(AsyncCursor, self)
 
@@ -89,11 +139,16 @@ class AsyncCursor(
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[MapOptions],
     ) -> "AsyncCursor[turu.core.async_cursor.GenericNewRowType]":
+        self._raw_cursor.row_factory = get_row_factory(row_type, options)
         await self._raw_cursor.executemany(
-            cast(LiteralString, operation), seq_of_parameters
+            cast(LiteralString, operation), seq_of_parameters, returning=True
         )
         self._row_type = cast(Type[turu.core.async_cursor.GenericRowType], row_type)
+        self._map_options = options
+        # NOTE: psycopg keeps the RETURNING rows of each parameter set as a separate result.
+        self._chain_results = True
 
         return cast(AsyncCursor, self)
 
@@ -121,32 +176,275 @@ class AsyncCursor(
             await self.executemany(operation, seq_of_parameters),
         )
 
+    async def copy_in(
+        self,
+        table: str,
+        rows: Iterable[Any],
+        columns: CopyColumns = None,
+        /,
+        *,
+        format: CopyInFormat = "text",
+    ) -> "AsyncCursor[Never]":
+        """Load `rows` into `table` with `COPY ... FROM STDIN`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is much faster than `.executemany()` with `INSERT` for bulk loads.
+        The rows are streamed, so `rows` can be a generator.
+
+        The column list follows the field order of the dataclass, NamedTuple or pydantic rows,
+        like `.execute_map()`.
+
+        The binary format skips the text conversion on the server, but is strict:
+        the values are dumped with the binary format of the column types,
+        so every value must have the Python type of its column,
+        such as `Decimal` for `numeric` and `float` for `float8`.
+        Otherwise the copy fails partway through, where the text format would load them.
+
+        Parameters:
+            table: The name of the table, which may be qualified by the schema.
+            rows: The rows to load, which are row objects or sequences of the column values.
+            columns: The column names or the row type to derive them from.
+                If this parameter is not used, the fields of the rows are used,
+                or all the columns of the table for the sequences.
+            format: The format of the copy, which is `"text"` or `"binary"`.
+
+        Returns:
+            A cursor whose `.rowcount` is the number of the loaded rows.
+        """
+
+        self._raw_cursor.row_factory = self._raw_row_factory
+        self._row_type = None
+        self._chain_results = False
+
+        rows_iter = iter(rows)
+        first_row = next(rows_iter, None)
+        if first_row is None:
+            return cast(AsyncCursor, self)
+
+        names, to_values = resolve_copy_columns(first_row, columns)
+        first_values = to_values(first_row) if to_values is not None else first_row
+
+        operation = render_copy_in(table, names, format)
+
+        types: Optional[List[int]] = None
+        if format == "binary":
+            await self._raw_cursor.execute(render_describe(table, names))
+            types = get_binary_types(self._raw_cursor, self._raw_cursor.description)
+
+        async with self._raw_cursor.copy(operation) as copy:
+            if types is not None:
+                copy.set_types(types)
+
+            await copy.write_row(first_values)
+            if to_values is None:
+                for row in rows_iter:
+                    await copy.write_row(row)
+
+            else:
+                for row in rows_iter:
+                    await copy.write_row(to_values(row))
+
+        return cast(AsyncCursor, self)
+
+    async def copy_out(
+        self,
+        query: str,
+        sink: CopySink,
+        /,
+        parameters: Optional[Parameters] = None,
+        *,
+        format: CopyFormat = "csv",
+        header: bool = True,
+    ) -> "AsyncCursor[Never]":
+        """Export the result of `query` to `sink` with `COPY (...) TO STDOUT`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but streams the chunks of the server straight into `sink`,
+        without fetching or mapping the rows.
+
+        Parameters:
+            query: The query to export.
+            sink: The file-like object to write the chunks to.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the query.
+            format: The format of the export, which is `"csv"`, `"text"` or `"binary"`.
+                The `"binary"` format needs a sink opened in binary mode.
+            header: Whether to write the header line in the `"csv"` format.
+
+        Returns:
+            A cursor whose `.rowcount` is the number of the exported rows.
+        """
+
+        self._raw_cursor.row_factory = self._raw_row_factory
+        self._row_type = None
+        self._chain_results = False
+
+        write = get_chunk_writer(
+            sink, format, self._raw_cursor.connection.info.encoding
+        )
+
+        async with self._raw_cursor.copy(
+            render_copy_out(query, format, header), parameters
+        ) as copy:
+            async for chunk in copy:
+                if inspect.isawaitable(result := write(chunk)):
+                    await result
+
+        return cast(AsyncCursor, self)
+
+    async def stream_map(
+        self,
+        row_type: Type[turu.core.async_cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        *,
+        size: int = 1,
+        **options: Unpack[MapOptions],
+    ) -> AsyncGenerator[turu.core.async_cursor.GenericNewRowType, None]:
+        """Execute a query and map each row to a `row_type` while the rows arrive.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is built on psycopg's `stream()`, so the first rows are yielded
+        before the query finishes, and the memory is bounded.
+        Closing the iterator early cancels the query on the server.
+
+        Parameters:
+            row_type: The type of the row that will be returned.
+            operation: A database query.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            size: The number of rows to receive from the server at a time, which requires libpq 17 if larger than 1.
+            options: Options for mapping rows to `row_type`.
+
+        Returns:
+            An iterator of the mapped rows.
+        """
+
+        self._raw_cursor.row_factory = get_row_factory(row_type, options)
+        self._row_type = None
+        self._chain_results = False
+
+        # NOTE: `size` is only supported by psycopg 3.2 or later.
+        kwargs = {"size": size} if size != 1 else {}
+
+        stream = cast(
+            AsyncGenerator[Any, None],
+            self._raw_cursor.stream(
+                cast(LiteralString, operation), parameters, **kwargs
+            ),
+        )
+        try:
+            async for row in stream:
+                yield row
+
+        finally:
+            await stream.aclose()
+
     @override
     async def fetchone(self) -> Optional[turu.core.async_cursor.GenericRowType]:
         row = await self._raw_cursor.fetchone()
-        if row is None:
-            return None
+        while row is None and self._nextset():
+            row = await self._raw_cursor.fetchone()
 
-        return _map_row(self._row_type, row)
+        return row
 
     @override
     async def fetchmany(
         self, size: Optional[int] = None
     ) -> List[turu.core.async_cursor.GenericRowType]:
-        return [
-            _map_row(self._row_type, row)
-            for row in (
-                await self._raw_cursor.fetchmany(
-                    size if size is not None else self.arraysize
-                )
-            )
-        ]
+        if size is None:
+            size = self.arraysize
+
+        if self._row_type is None:
+            return await self._fetchmany(size)
+
+        return self._map_rows(await self._fetchmany_raw(size))
 
     @override
     async def fetchall(self) -> List[turu.core.async_cursor.GenericRowType]:
-        return [
-            _map_row(self._row_type, row) for row in await self._raw_cursor.fetchall()
-        ]
+        if self._row_type is None:
+            return await self._fetchall()
+
+        with self._raw_rows():
+            rows = await self._fetchall()
+
+        return self._map_rows(rows)
+
+    @override
+    async def aiter_batches(
+        self, size: Optional[int] = None
+    ) -> AsyncIterator[List[turu.core.async_cursor.GenericRowType]]:
+        with self._raw_rows():
+            async for rows in super().aiter_batches(size):
+                yield rows
+
+    @override
+    async def fetch_columns(self, size: Optional[int] = None) -> Dict[str, Any]:
+        with self._raw_rows():
+            return await super().fetch_columns(size)
+
+    @override
+    async def fetch_arrow_all(self, size: Optional[int] = None) -> "PyArrowTable":
+        with self._raw_rows():
+            return await super().fetch_arrow_all(size)
+
+    @override
+    async def fetch_arrow_batches(
+        self, size: Optional[int] = None
+    ) -> AsyncIterator["PyArrowRecordBatch"]:
+        with self._raw_rows():
+            async for batch in super().fetch_arrow_batches(size):
+                yield batch
+
+    @override
+    async def _fetchmany_raw(self, size: int) -> List[Any]:
+        with self._raw_rows():
+            return await self._fetchmany(size)
+
+    async def _fetchmany(self, size: int) -> List[Any]:
+        rows = await self._raw_cursor.fetchmany(size)
+        while len(rows) < size and self._nextset():
+            rows.extend(await self._raw_cursor.fetchmany(size - len(rows)))
+
+        return rows
+
+    async def _fetchall(self) -> List[Any]:
+        rows = await self._raw_cursor.fetchall()
+        while self._nextset():
+            rows.extend(await self._raw_cursor.fetchall())
+
+        return rows
+
+    def _nextset(self) -> bool:
+        """Move to the next result if the results of the last operation are chained."""
+
+        return self._chain_results and bool(self._raw_cursor.nextset())
+
+    @contextlib.contextmanager
+    def _raw_rows(self) -> Iterator[None]:
+        """Fetch with the raw row factory, so that the rows are mapped in batches
+        rather than one by one.
+
+        The row factory is swapped once for the whole block, and nested blocks keep it.
+        """
+
+        row_factory = self._raw_cursor.row_factory
+        if row_factory is self._raw_row_factory:
+            yield
+            return
+
+        self._raw_cursor.row_factory = self._raw_row_factory
+        try:
+            yield
+
+        finally:
+            self._raw_cursor.row_factory = row_factory
+
+    def _map_rows(self, rows: List[Any]) -> List[turu.core.async_cursor.GenericRowType]:
+        return map_rows(
+            cast(Type[turu.core.async_cursor.GenericRowType], self._row_type),
+            rows,
+            **resolve_map_options(self._map_options, self._raw_cursor.description),
+        )
 
     @override
     def __aiter__(self) -> "AsyncCursor[turu.core.async_cursor.GenericRowType]":
@@ -158,5 +456,12 @@ class AsyncCursor(
         if self._aiter is None:
             self._aiter = self._raw_cursor.__aiter__()
 
-        next_row = await self._aiter.__anext__()
-        return _map_row(self._row_type, next_row)
+        while True:
+            try:
+                return await self._aiter.__anext__()
+
+            except StopAsyncIteration:
+                if not self._nextset():
+                    raise
+
+                self._aiter = self._raw_cursor.__aiter__()
@@ -1,15 +1,141 @@
-from typing import Any, List, Mapping, Optional, Sequence, Type, Union, cast
+import contextlib
+import functools
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypedDict,
+    Union,
+    cast,
+)
 
 import psycopg
 import psycopg.cursor
+import psycopg.rows
 import turu.core.cursor
 import turu.core.mock
 import turu.core.tag
-from typing_extensions import LiteralString, Never, override
+from turu.core._row_mapper import get_row_mapper
+from typing_extensions import LiteralString, Never, Unpack, override
+
+from ._copy import (
+    CopyColumns,
+    CopyFormat,
+    CopyInFormat,
+    CopySink,
+    get_binary_types,
+    get_chunk_writer,
+    render_copy_in,
+    render_copy_out,
+    render_describe,
+    resolve_copy_columns,
+)
+from ._prepare import get_prepare_options
+
+if TYPE_CHECKING:
+    from turu.core.features import PyArrowRecordBatch, PyArrowTable
 
 Parameters = Union[Sequence[Any], Mapping[str, Any]]
 
 
+class CursorOptions(TypedDict, total=False):
+    server_side: bool
+    """Whether to use a server-side (named) cursor,
+    which fetches the rows from the server in chunks instead of buffering the whole result.
+
+    Server-side cursors must be used in a transaction, unless `withhold` is set.
+    """
+
+    name: str
+    """The name of the server-side cursor, which is generated if not given."""
+
+    itersize: int
+    """The number of rows to fetch from the server at a time while iterating."""
+
+    scrollable: bool
+    """Whether the server-side cursor can be scrolled backwards."""
+
+    withhold: bool
+    """Whether the server-side cursor can be used after the transaction is committed."""
+
+
+class ExecuteMapOptions(CursorOptions, turu.core.cursor.MapOptions, total=False):
+    pass
+
+
+_SERVER_CURSOR_IDS = itertools.count()
+
+
+def pop_cursor_options(options: Any) -> CursorOptions:
+    """Pop the cursor options out of `options`, leaving the map options."""
+
+    return cast(
+        CursorOptions,
+        {
+            key: options.pop(key)
+            for key in CursorOptions.__annotations__
+            if key in options
+        },
+    )
+
+
+def new_raw_cursor(
+    connection: Union[psycopg.Connection, psycopg.AsyncConnection],
+    options: CursorOptions,
+) -> Any:
+    """Create a client-side cursor, or a server-side cursor if `options` request it."""
+
+    if not options.get("server_side", "name" in options):
+        return connection.cursor()
+
+    raw_cursor = connection.cursor(
+        options.get("name") or f"turu_cursor_{next(_SERVER_CURSOR_IDS)}",
+        scrollable=options.get("scrollable"),
+        withhold=options.get("withhold", False),
+    )
+    if (itersize := options.get("itersize")) is not None:
+        raw_cursor.itersize = itersize
+
+    return raw_cursor
+
+
+def get_row_factory(
+    row_type: Type[Any], options: turu.core.cursor.MapOptions
+) -> "psycopg.rows.RowFactory[Any]":
+    """Return a psycopg row factory that maps each row to `row_type`,
+    so that psycopg builds the row objects directly while loading the results.
+
+    The cursors use it for `.fetchone()`, the iteration and `.stream_map()`,
+    and fetch raw rows for `.fetchmany()` and `.fetchall()` to map them in batches.
+
+    The mapper of `row_type` is compiled once and cached by `turu.core`,
+    and the options are resolved against the description of each result.
+    """
+
+    return functools.partial(_make_row_maker, row_type, options)
+
+
+def _make_row_maker(
+    row_type: Type[Any],
+    options: turu.core.cursor.MapOptions,
+    cursor: "psycopg.cursor.BaseCursor[Any, Any]",
+) -> "psycopg.rows.RowMaker[Any]":
+    mapper = get_row_mapper(
+        row_type, **turu.core.cursor.resolve_map_options(options, cursor.description)
+    )
+
+    return functools.partial(mapper.map_row, row_type)
+
+
 class Cursor(
     turu.core.cursor.Cursor[turu.core.cursor.GenericRowType, Parameters],
 ):
@@ -20,8 +146,13 @@ class Cursor(
         row_type: Optional[Type[turu.core.cursor.GenericRowType]] = None,
     ):
         self._raw_cursor = cursor
+        self._raw_row_factory = cursor.row_factory
         self._row_type: Optional[Type[turu.core.cursor.GenericRowType]] = row_type
+        self._map_options: turu.core.cursor.MapOptions = {}
+        self._chain_results = False
         self._iter = None
+        if row_type is not None:
+            cursor.row_factory = get_row_factory(row_type, {})
 
     @property
     def rowcount(self) -> int:
@@ -35,6 +166,11 @@ class Cursor(
     def arraysize(self, size: int) -> None:
         self._raw_cursor.arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     def close(self) -> None:
         self._raw_cursor.close()
@@ -46,8 +182,14 @@ class Cursor(
         parameters: Optional[Parameters] = None,
         /,
     ) -> "Cursor[turu.core.cursor.GenericRowType]":
-        self._raw_cursor.execute(cast(LiteralString, operation), parameters)
+        self._raw_cursor.row_factory = self._raw_row_factory
+        self._raw_cursor.execute(
+            cast(LiteralString, operation),
+            parameters,
+            **get_prepare_options(self._raw_cursor, operation),
+        )
         self._row_type = None
+        self._chain_results = False
 
         return self
 
@@ -58,8 +200,10 @@ class Cursor(
         seq_of_parameters: Sequence[Parameters],
         /,
     ) -> "Cursor[turu.core.cursor.GenericRowType]":
+        self._raw_cursor.row_factory = self._raw_row_factory
         self._raw_cursor.executemany(cast(LiteralString, operation), seq_of_parameters)
         self._row_type = None
+        self._chain_results = False
 
         return self
 
@@ -70,9 +214,17 @@ class Cursor(
         operation: str,
         parameters: Optional[Parameters] = None,
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "Cursor[turu.core.cursor.GenericNewRowType]":
-        self._raw_cursor.execute(cast(LiteralString, operation), parameters)
+        self._raw_cursor.row_factory = get_row_factory(row_type, options)
+        self._raw_cursor.execute(
+            cast(LiteralString, operation),
+            parameters,
+            **get_prepare_options(self._raw_cursor, operation),
+        )
         self._row_type = cast(Type[turu.core.cursor.GenericRowType], row_type)
+        self._map_options = options
+        self._chain_results = False
 
         return cast(Cursor, self)
 
@@ -83,9 +235,16 @@ class Cursor(
         operation: str,
         seq_of_parameters: Sequence[Parameters],
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "Cursor[turu.core.cursor.GenericNewRowType]":
-        self._raw_cursor.executemany(cast(LiteralString, operation), seq_of_parameters)
+        self._raw_cursor.row_factory = get_row_factory(row_type, options)
+        self._raw_cursor.executemany(
+            cast(LiteralString, operation), seq_of_parameters, returning=True
+        )
         self._row_type = cast(Type[turu.core.cursor.GenericRowType], row_type)
+        self._map_options = options
+        # NOTE: psycopg keeps the RETURNING rows of each parameter set as a separate result.
+        self._chain_results = True
 
         return cast(Cursor, self)
 
@@ -107,35 +266,273 @@ class Cursor(
     ) -> "Cursor[Never]":
         return cast(Cursor, self.executemany(operation, seq_of_parameters))
 
+    def copy_in(
+        self,
+        table: str,
+        rows: Iterable[Any],
+        columns: CopyColumns = None,
+        /,
+        *,
+        format: CopyInFormat = "text",
+    ) -> "Cursor[Never]":
+        """Load `rows` into `table` with `COPY ... FROM STDIN`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is much faster than `.executemany()` with `INSERT` for bulk loads.
+        The rows are streamed, so `rows` can be a generator.
+
+        The column list follows the field order of the dataclass, NamedTuple or pydantic rows,
+        like `.execute_map()`.
+
+        The binary format skips the text conversion on the server, but is strict:
+        the values are dumped with the binary format of the column types,
+        so every value must have the Python type of its column,
+        such as `Decimal` for `numeric` and `float` for `float8`.
+        Otherwise the copy fails partway through, where the text format would load them.
+
+        Parameters:
+            table: The name of the table, which may be qualified by the schema.
+            rows: The rows to load, which are row objects or sequences of the column values.
+            columns: The column names or the row type to derive them from.
+                If this parameter is not used, the fields of the rows are used,
+                or all the columns of the table for the sequences.
+            format: The format of the copy, which is `"text"` or `"binary"`.
+
+        Returns:
+            A cursor whose `.rowcount` is the number of the loaded rows.
+        """
+
+        self._raw_cursor.row_factory = self._raw_row_factory
+        self._row_type = None
+        self._chain_results = False
+
+        rows_iter = iter(rows)
+        first_row = next(rows_iter, None)
+        if first_row is None:
+            return cast(Cursor, self)
+
+        names, to_values = resolve_copy_columns(first_row, columns)
+        first_values = to_values(first_row) if to_values is not None else first_row
+
+        operation = render_copy_in(table, names, format)
+
+        types: Optional[List[int]] = None
+        if format == "binary":
+            self._raw_cursor.execute(render_describe(table, names))
+            types = get_binary_types(self._raw_cursor, self._raw_cursor.description)
+
+        with self._raw_cursor.copy(operation) as copy:
+            if types is not None:
+                copy.set_types(types)
+
+            copy.write_row(first_values)
+            if to_values is None:
+                for row in rows_iter:
+                    copy.write_row(row)
+
+            else:
+                for row in rows_iter:
+                    copy.write_row(to_values(row))
+
+        return cast(Cursor, self)
+
+    def copy_out(
+        self,
+        query: str,
+        sink: CopySink,
+        /,
+        parameters: Optional[Parameters] = None,
+        *,
+        format: CopyFormat = "csv",
+        header: bool = True,
+    ) -> "Cursor[Never]":
+        """Export the result of `query` to `sink` with `COPY (...) TO STDOUT`.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but streams the chunks of the server straight into `sink`,
+        without fetching or mapping the rows.
+
+        Parameters:
+            query: The query to export.
+            sink: The file-like object to write the chunks to.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the query.
+            format: The format of the export, which is `"csv"`, `"text"` or `"binary"`.
+                The `"binary"` format needs a sink opened in binary mode.
+            header: Whether to write the header line in the `"csv"` format.
+
+        Returns:
+            A cursor whose `.rowcount` is the number of the exported rows.
+        """
+
+        self._raw_cursor.row_factory = self._raw_row_factory
+        self._row_type = None
+        self._chain_results = False
+
+        write = get_chunk_writer(
+            sink, format, self._raw_cursor.connection.info.encoding
+        )
+
+        with self._raw_cursor.copy(
+            render_copy_out(query, format, header), parameters
+        ) as copy:
+            for chunk in copy:
+                write(chunk)
+
+        return cast(Cursor, self)
+
+    def stream_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        *,
+        size: int = 1,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> Generator[turu.core.cursor.GenericNewRowType, None, None]:
+        """Execute a query and map each row to a `row_type` while the rows arrive.
+
+        This is not defined in [PEP 249](https://peps.python.org/pep-0249/),
+        but is built on psycopg's `stream()`, so the first rows are yielded
+        before the query finishes, and the memory is bounded.
+        Closing the iterator early cancels the query on the server.
+
+        Parameters:
+            row_type: The type of the row that will be returned.
+            operation: A database query.
+            parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
+            size: The number of rows to receive from the server at a time, which requires libpq 17 if larger than 1.
+            options: Options for mapping rows to `row_type`.
+
+        Returns:
+            An iterator of the mapped rows.
+        """
+
+        self._raw_cursor.row_factory = get_row_factory(row_type, options)
+        self._row_type = None
+        self._chain_results = False
+
+        # NOTE: `size` is only supported by psycopg 3.2 or later.
+        kwargs = {"size": size} if size != 1 else {}
+
+        stream = cast(
+            Generator[Any, None, None],
+            self._raw_cursor.stream(
+                cast(LiteralString, operation), parameters, **kwargs
+            ),
+        )
+        try:
+            yield from stream
+
+        finally:
+            stream.close()
+
     @override
     def fetchone(self) -> Optional[turu.core.cursor.GenericRowType]:
         row = self._raw_cursor.fetchone()
-        if row is None:
-            return None
-
-        elif self._row_type is not None:
-            return turu.core.cursor.map_row(self._row_type, row)
+        while row is None and self._nextset():
+            row = self._raw_cursor.fetchone()
 
-        else:
-            return row  # type: ignore
+        return row
 
     @override
     def fetchmany(
         self, size: Optional[int] = None
     ) -> List[turu.core.cursor.GenericRowType]:
-        return [
-            turu.core.cursor.map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchmany(
-                size if size is not None else self.arraysize
-            )
-        ]
+        if size is None:
+            size = self.arraysize
+
+        if self._row_type is None:
+            return self._fetchmany(size)
+
+        return self._map_rows(self._fetchmany_raw(size))
 
     @override
     def fetchall(self) -> List[turu.core.cursor.GenericRowType]:
-        return [
-            turu.core.cursor.map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchall()
-        ]
+        if self._row_type is None:
+            return self._fetchall()
+
+        with self._raw_rows():
+            rows = self._fetchall()
+
+        return self._map_rows(rows)
+
+    @override
+    def iter_batches(
+        self, size: Optional[int] = None
+    ) -> Iterator[List[turu.core.cursor.GenericRowType]]:
+        with self._raw_rows():
+            yield from super().iter_batches(size)
+
+    @override
+    def fetch_columns(self, size: Optional[int] = None) -> Dict[str, Any]:
+        with self._raw_rows():
+            return super().fetch_columns(size)
+
+    @override
+    def fetch_arrow_all(self, size: Optional[int] = None) -> "PyArrowTable":
+        with self._raw_rows():
+            return super().fetch_arrow_all(size)
+
+    @override
+    def fetch_arrow_batches(
+        self, size: Optional[int] = None
+    ) -> Iterator["PyArrowRecordBatch"]:
+        with self._raw_rows():
+            yield from super().fetch_arrow_batches(size)
+
+    @override
+    def _fetchmany_raw(self, size: int) -> List[Any]:
+        with self._raw_rows():
+            return self._fetchmany(size)
+
+    def _fetchmany(self, size: int) -> List[Any]:
+        rows = self._raw_cursor.fetchmany(size)
+        while len(rows) < size and self._nextset():
+            rows.extend(self._raw_cursor.fetchmany(size - len(rows)))
+
+        return rows
+
+    def _fetchall(self) -> List[Any]:
+        rows = self._raw_cursor.fetchall()
+        while self._nextset():
+            rows.extend(self._raw_cursor.fetchall())
+
+        return rows
+
+    def _nextset(self) -> bool:
+        """Move to the next result if the results of the last operation are chained."""
+
+        return self._chain_results and bool(self._raw_cursor.nextset())
+
+    @contextlib.contextmanager
+    def _raw_rows(self) -> Iterator[None]:
+        """Fetch with the raw row factory, so that the rows are mapped in batches
+        rather than one by one.
+
+        The row factory is swapped once for the whole block, and nested blocks keep it.
+        """
+
+        row_factory = self._raw_cursor.row_factory
+        if row_factory is self._raw_row_factory:
+            yield
+            return
+
+        self._raw_cursor.row_factory = self._raw_row_factory
+        try:
+            yield
+
+        finally:
+            self._raw_cursor.row_factory = row_factory
+
+    def _map_rows(self, rows: List[Any]) -> List[turu.core.cursor.GenericRowType]:
+        return turu.core.cursor.map_rows(
+            cast(Type[turu.core.cursor.GenericRowType], self._row_type),
+            rows,
+            **turu.core.cursor.resolve_map_options(
+                self._map_options, self._raw_cursor.description
+            ),
+        )
 
     @override
     def __iter__(self) -> "Cursor[turu.core.cursor.GenericRowType]":
@@ -147,9 +544,12 @@ class Cursor(
         if self._iter is None:
             self._iter = self._raw_cursor.__iter__()
 
-        next_row = next(self._iter)
-        if self._row_type is not None and next_row is not None:
-            return turu.core.cursor.map_row(self._row_type, next_row)
+        while True:
+            try:
+                return next(self._iter)
+
+            except StopIteration:
+                if not self._nextset():
+                    raise
 
-        else:
-            return next_row  # type: ignore
+                self._iter = self._raw_cursor.__iter__()
@@ -1,10 +1,15 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
 import turu.core.async_connection
 import turu.core.mock
 import turu.postgres.cursor
 import turu.postgres.mock_async_cursor
-from typing_extensions import Never, override
+from typing_extensions import Never, Unpack, override
 
+from ._prepare import PreparedStatement, PrepareStats
 from .async_connection import AsyncConnection
+from .cursor import CursorOptions
 
 
 class MockAsyncConnection(turu.core.mock.MockAsyncConnection, AsyncConnection):
@@ -12,5 +17,21 @@ class MockAsyncConnection(turu.core.mock.MockAsyncConnection, AsyncConnection):
         turu.core.mock.MockAsyncConnection.__init__(self)
 
     @override
-    async def cursor(self) -> "turu.postgres.mock_async_cursor.MockAsyncCursor[Never]":
+    async def cursor(
+        self, **options: Unpack[CursorOptions]
+    ) -> "turu.postgres.mock_async_cursor.MockAsyncCursor[Never]":
         return turu.postgres.mock_async_cursor.MockAsyncCursor(self._turu_mock_store)
+
+    @override
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[Any]:  # type: ignore[override]
+        yield None
+
+    @override
+    def prepare(self, operation: str) -> PreparedStatement:
+        return PreparedStatement(operation)
+
+    @property
+    @override
+    def prepare_stats(self) -> PrepareStats:
+        return PrepareStats()
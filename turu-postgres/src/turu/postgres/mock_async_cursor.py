@@ -1,6 +1,10 @@
+from typing import Any, AsyncGenerator, Iterable, Optional, Type, cast
+
 import turu.core.async_cursor
 import turu.core.mock
+from typing_extensions import Never, Unpack, override
 
+from ._copy import CopyColumns, CopyFormat, CopyInFormat, CopySink
 from .async_cursor import AsyncCursor
 from .cursor import Parameters
 
@@ -9,4 +13,41 @@ class MockAsyncCursor(  # type: ignore
     turu.core.mock.MockAsyncCursor[turu.core.async_cursor.GenericRowType, Parameters],
     AsyncCursor[turu.core.async_cursor.GenericRowType],
 ):
-    pass
+    @override
+    async def copy_in(
+        self,
+        table: str,
+        rows: Iterable[Any],
+        columns: CopyColumns = None,
+        /,
+        *,
+        format: CopyInFormat = "text",
+    ) -> "MockAsyncCursor[Never]":
+        return cast(MockAsyncCursor, self._make_new_mock_cursor(None))
+
+    @override
+    async def copy_out(
+        self,
+        query: str,
+        sink: CopySink,
+        /,
+        parameters: Optional[Parameters] = None,
+        *,
+        format: CopyFormat = "csv",
+        header: bool = True,
+    ) -> "MockAsyncCursor[Never]":
+        return cast(MockAsyncCursor, self._make_new_mock_cursor(None))
+
+    @override
+    async def stream_map(
+        self,
+        row_type: Type[turu.core.async_cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        *,
+        size: int = 1,
+        **options: Unpack[turu.core.async_cursor.MapOptions],
+    ) -> AsyncGenerator[turu.core.async_cursor.GenericNewRowType, None]:
+        async for row in self._make_new_mock_cursor(row_type):
+            yield row
@@ -1,9 +1,14 @@
+from contextlib import contextmanager
+from typing import Any, Iterator
+
 import turu.core.connection
 import turu.core.cursor
 import turu.core.mock
-from typing_extensions import Never, override
+from typing_extensions import Never, Unpack, override
 
+from ._prepare import PreparedStatement, PrepareStats
 from .connection import Connection
+from .cursor import CursorOptions
 from .mock_cursor import MockCursor
 
 
@@ -12,5 +17,19 @@ class MockConnection(turu.core.mock.MockConnection, Connection):
         turu.core.mock.MockConnection.__init__(self)
 
     @override
-    def cursor(self) -> "MockCursor[Never]":
+    def cursor(self, **options: Unpack[CursorOptions]) -> "MockCursor[Never]":
         return MockCursor(self._turu_mock_store)
+
+    @override
+    @contextmanager
+    def pipeline(self) -> Iterator[Any]:  # type: ignore[override]
+        yield None
+
+    @override
+    def prepare(self, operation: str) -> PreparedStatement:
+        return PreparedStatement(operation)
+
+    @property
+    @override
+    def prepare_stats(self) -> PrepareStats:
+        return PrepareStats()
@@ -1,6 +1,10 @@
+from typing import Any, Generator, Iterable, Optional, Type, cast
+
 import turu.core.cursor
 import turu.core.mock
+from typing_extensions import Never, Unpack, override
 
+from ._copy import CopyColumns, CopyFormat, CopyInFormat, CopySink
 from .cursor import Cursor, Parameters
 
 
@@ -8,4 +12,40 @@ class MockCursor(  # type: ignore
     turu.core.mock.MockCursor[turu.core.cursor.GenericRowType, Parameters],
     Cursor[turu.core.cursor.GenericRowType],
 ):
-    pass
+    @override
+    def copy_in(
+        self,
+        table: str,
+        rows: Iterable[Any],
+        columns: CopyColumns = None,
+        /,
+        *,
+        format: CopyInFormat = "text",
+    ) -> "MockCursor[Never]":
+        return cast(MockCursor, self._make_new_mock_cursor(None))
+
+    @override
+    def copy_out(
+        self,
+        query: str,
+        sink: CopySink,
+        /,
+        parameters: Optional[Parameters] = None,
+        *,
+        format: CopyFormat = "csv",
+        header: bool = True,
+    ) -> "MockCursor[Never]":
+        return cast(MockCursor, self._make_new_mock_cursor(None))
+
+    @override
+    def stream_map(
+        self,
+        row_type: Type[turu.core.cursor.GenericNewRowType],
+        operation: str,
+        parameters: Optional[Parameters] = None,
+        /,
+        *,
+        size: int = 1,
+        **options: Unpack[turu.core.cursor.MapOptions],
+    ) -> Generator[turu.core.cursor.GenericNewRowType, None, None]:
+        yield from self._make_new_mock_cursor(row_type)
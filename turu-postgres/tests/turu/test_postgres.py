@@ -1,10 +1,25 @@
+import decimal
+import io
 import os
+from types import SimpleNamespace
 
+import psycopg
+import psycopg.rows
 import pytest
+import turu.core.cursor
 import turu.postgres
+import turu.postgres._prepare
 from psycopg import ProgrammingError
+from psycopg._preparing import PrepareManager
 from pydantic import BaseModel
-from turu.postgres import Connection
+from turu.postgres import Connection, PreparedStatement, PrepareStats
+from turu.postgres._copy import get_binary_types, get_chunk_writer, render_copy_in
+from turu.postgres._prepare import (
+    get_prepare_stats,
+    new_prepared_statement,
+    track_prepare_stats,
+)
+from turu.postgres.cursor import get_row_factory
 
 
 class Row(BaseModel):
@@ -15,6 +30,327 @@ def test_version():
     assert turu.postgres.__version__
 
 
+class TestRowFactory:
+    def test_get_row_factory(self):
+        make_row = get_row_factory(Row, {})(SimpleNamespace(description=None))
+
+        assert make_row([1]) == Row(id=1)
+
+    def test_get_row_factory_by_name(self):
+        description = [("name",), ("id",)]
+        make_row = get_row_factory(Row, {"by_name": True})(
+            SimpleNamespace(description=description)
+        )
+
+        assert make_row(("a", 1)) == Row(id=1)
+
+
+class TestPrepareStats:
+    def test_prepare_stats(self):
+        raw_connection = SimpleNamespace(_prepared=PrepareManager())
+        track_prepare_stats(raw_connection)  # type: ignore[arg-type]
+        manager = raw_connection._prepared
+        query = SimpleNamespace(query=b"select 1", types=())
+
+        prep, name = manager.get(query)
+        manager.maybe_add_to_cache(query, prep, name)
+        prep, name = manager.get(query, prepare=True)
+        manager.maybe_add_to_cache(query, prep, name)
+        manager.get(query)
+        manager.clear()
+
+        assert get_prepare_stats(raw_connection) == PrepareStats(  # type: ignore[arg-type]
+            prepared=1, hits=1, misses=2, evictions=1
+        )
+
+    def test_prepare_stats_with_failed_prepare(self):
+        raw_connection = SimpleNamespace(_prepared=PrepareManager())
+        track_prepare_stats(raw_connection)  # type: ignore[arg-type]
+        manager = raw_connection._prepared
+        query = SimpleNamespace(query=b"select 1", types=())
+
+        # NOTE: psycopg does not add the statement to the cache if the PREPARE fails.
+        manager.get(query, prepare=True)
+
+        assert get_prepare_stats(raw_connection) == PrepareStats(misses=1)  # type: ignore[arg-type]
+
+    def test_prepare_stats_without_cache(self):
+        raw_connection = SimpleNamespace(_prepared=PrepareManager())
+        track_prepare_stats(raw_connection)  # type: ignore[arg-type]
+        manager = raw_connection._prepared
+        manager.prepare_threshold = None
+        query = SimpleNamespace(query=b"select 1", types=())
+
+        manager.get(query)
+        manager.get(query, prepare=True)
+
+        assert get_prepare_stats(raw_connection) == PrepareStats()  # type: ignore[arg-type]
+
+    def test_prepare_stats_unsupported_version(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(turu.postgres._prepare, "_USE_PREPARE_MANAGER", False)
+        manager = PrepareManager()
+        raw_connection = SimpleNamespace(_prepared=manager)
+        track_prepare_stats(raw_connection)  # type: ignore[arg-type]
+
+        assert raw_connection._prepared is manager
+        assert get_prepare_stats(raw_connection) == PrepareStats()  # type: ignore[arg-type]
+
+
+class TestPreparedStatement:
+    def test_new_prepared_statement(self):
+        raw_connection = SimpleNamespace(prepare_threshold=5)
+
+        assert new_prepared_statement(raw_connection, "select 1") == "select 1"  # type: ignore[arg-type]
+
+    def test_new_prepared_statement_without_prepare_threshold(self):
+        raw_connection = SimpleNamespace(prepare_threshold=None)
+
+        with pytest.raises(ValueError):
+            new_prepared_statement(raw_connection, "select 1")  # type: ignore[arg-type]
+
+
+class FakeServerCursor(psycopg.ServerCursor):
+    """A psycopg server-side cursor that records the executed operations."""
+
+    def __init__(self) -> None:
+        self._row_factory = psycopg.rows.tuple_row
+        self.pgresult = None
+        self.executed: list = []
+
+    def __del__(self) -> None:
+        pass
+
+    def execute(self, query, params=None, *, binary=None, **kwargs):
+        if kwargs:
+            raise TypeError(f"keyword not supported: {list(kwargs)[0]}")
+
+        self.executed.append(query)
+        return self
+
+
+class TestServerSideCursor:
+    def test_execute(self):
+        raw_cursor = FakeServerCursor()
+        turu.postgres.Cursor(raw_cursor).execute("select 1")  # type: ignore[arg-type]
+
+        assert raw_cursor.executed == ["select 1"]
+
+    def test_execute_map_prepared_statement(self):
+        raw_cursor = FakeServerCursor()
+        operation = PreparedStatement("select 1")
+        turu.postgres.Cursor(raw_cursor).execute_map(Row, operation)  # type: ignore[arg-type]
+
+        assert raw_cursor.executed == [operation]
+
+
+class FakeRawCursor:
+    """A psycopg cursor with multiple result sets, like after `executemany(returning=True)`."""
+
+    row_factory = None
+    arraysize = 1
+
+    def __init__(self, *results):
+        self._results = [list(result) for result in results]
+
+    def execute(self, query, params=None, **kwargs):
+        pass
+
+    def executemany(self, query, params_seq, **kwargs):
+        pass
+
+    def fetchone(self):
+        return self._results[0].pop(0) if self._results[0] else None
+
+    def fetchmany(self, size):
+        rows, self._results[0] = self._results[0][:size], self._results[0][size:]
+        return rows
+
+    def fetchall(self):
+        return self.fetchmany(len(self._results[0]))
+
+    def nextset(self):
+        if len(self._results) == 1:
+            return None
+
+        self._results.pop(0)
+        return True
+
+    def __iter__(self):
+        while (row := self.fetchone()) is not None:
+            yield row
+
+
+class FakeRowFactoryRawCursor(FakeRawCursor):
+    """A psycopg cursor that makes the rows with its `row_factory`."""
+
+    description = [("id",)]
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is None or self.row_factory is None:
+            return row
+
+        return self.row_factory(self)(row)
+
+    def fetchmany(self, size):
+        rows = super().fetchmany(size)
+        if self.row_factory is None:
+            return rows
+
+        make_row = self.row_factory(self)
+        return [make_row(row) for row in rows]
+
+
+class SwapCountingRawCursor(FakeRowFactoryRawCursor):
+    """A `FakeRowFactoryRawCursor` that counts the assignments of its `row_factory`."""
+
+    swaps = 0
+
+    def __setattr__(self, name, value):
+        if name == "row_factory":
+            self.swaps += 1
+
+        super().__setattr__(name, value)
+
+
+class TestRowFactoryFetch:
+    def test_fetchone_uses_row_factory(self):
+        cursor = turu.postgres.Cursor(FakeRowFactoryRawCursor([(1,)]), row_type=Row)  # type: ignore[arg-type]
+
+        assert cursor.fetchone() == Row(id=1)
+
+    def test_fetchall_maps_in_batch(self, monkeypatch: pytest.MonkeyPatch):
+        batches = []
+        map_rows = turu.core.cursor.map_rows
+
+        def spy_map_rows(row_type, rows, **options):
+            batches.append(list(rows))
+            return map_rows(row_type, rows, **options)
+
+        monkeypatch.setattr(turu.core.cursor, "map_rows", spy_map_rows)
+        raw_cursor = FakeRowFactoryRawCursor([(1,), (2,), (3,)])
+        cursor = turu.postgres.Cursor(raw_cursor, row_type=Row)  # type: ignore[arg-type]
+
+        assert cursor.fetchmany(2) == [Row(id=1), Row(id=2)]
+        assert cursor.fetchall() == [Row(id=3)]
+        assert batches == [[(1,), (2,)], [(3,)]]
+        assert raw_cursor.row_factory is not None
+
+    def test_iter_batches_swaps_row_factory_once(self):
+        raw_cursor = SwapCountingRawCursor([(1,), (2,), (3,)])
+        cursor = turu.postgres.Cursor(raw_cursor, row_type=Row)  # type: ignore[arg-type]
+        row_factory = raw_cursor.row_factory
+        raw_cursor.swaps = 0
+
+        assert list(cursor.iter_batches(1)) == [[Row(id=1)], [Row(id=2)], [Row(id=3)]]
+        assert raw_cursor.swaps == 2
+        assert raw_cursor.row_factory is row_factory
+
+    def test_fetch_columns_swaps_row_factory_once(self):
+        raw_cursor = SwapCountingRawCursor([(1,), (2,), (3,)])
+        cursor = turu.postgres.Cursor(raw_cursor, row_type=Row)  # type: ignore[arg-type]
+        row_factory = raw_cursor.row_factory
+        raw_cursor.swaps = 0
+
+        assert list(cursor.fetch_columns(1)["id"]) == [1, 2, 3]
+        assert raw_cursor.swaps == 2
+        assert raw_cursor.row_factory is row_factory
+
+
+def executemany_returning(*results) -> turu.postgres.Cursor:
+    cursor = turu.postgres.Cursor(FakeRowFactoryRawCursor(*results))  # type: ignore[arg-type]
+
+    return cursor.executemany_map(Row, "INSERT INTO t VALUES (%s) RETURNING id", [])
+
+
+class TestMultipleResultSets:
+    def test_fetchone(self):
+        cursor = executemany_returning([(1,)], [], [(2,)])
+
+        assert [cursor.fetchone(), cursor.fetchone(), cursor.fetchone()] == [
+            Row(id=1),
+            Row(id=2),
+            None,
+        ]
+
+    def test_fetchmany(self):
+        cursor = executemany_returning([(1,), (2,)], [(3,)], [(4,)])
+
+        assert cursor.fetchmany(3) == [Row(id=1), Row(id=2), Row(id=3)]
+        assert cursor.fetchmany(3) == [Row(id=4)]
+
+    def test_fetchall(self):
+        cursor = executemany_returning([(1,)], [(2,), (3,)])
+
+        assert cursor.fetchall() == [Row(id=1), Row(id=2), Row(id=3)]
+
+    def test_iter(self):
+        cursor = executemany_returning([(1,)], [], [(2,)])
+
+        assert list(cursor) == [Row(id=1), Row(id=2)]
+
+    def test_fetch_columns(self):
+        cursor = executemany_returning([(1,)], [(2,)])
+
+        columns = cursor.fetch_columns()
+
+        assert list(columns["id"]) == [1, 2]
+
+    def test_execute_does_not_chain(self):
+        raw_cursor = FakeRawCursor([1], [2])
+        cursor = turu.postgres.Cursor(raw_cursor).execute("SELECT 1")  # type: ignore[arg-type]
+
+        assert cursor.fetchall() == [1]
+        assert list(cursor) == []
+        assert raw_cursor.nextset() is True
+
+
+class TestCopy:
+    def test_render_copy_in(self):
+        query = render_copy_in("copy_rows", ("id",), "binary")
+
+        assert (
+            query.as_string(None)
+            == 'COPY "copy_rows" ("id") FROM STDIN (FORMAT BINARY)'
+        )
+
+    def test_render_copy_in_with_unsupported_format(self):
+        with pytest.raises(ValueError):
+            render_copy_in("copy_rows", None, "csv")  # type: ignore[arg-type]
+
+    def test_get_binary_types(self):
+        description = [SimpleNamespace(name="id", type_code=1700)]
+
+        assert get_binary_types(psycopg.adapters, description) == [1700]
+
+    def test_get_binary_types_with_unsupported_type(self):
+        description = [SimpleNamespace(name="id", type_code=0)]
+
+        with pytest.raises(ValueError):
+            get_binary_types(psycopg.adapters, description)
+
+    def test_get_chunk_writer_decodes_split_characters(self):
+        sink = io.StringIO()
+        write = get_chunk_writer(sink, "csv", "utf-8")
+
+        data = "あ\n".encode()
+        write(data[:1])
+        write(memoryview(data[1:]))
+
+        assert sink.getvalue() == "あ\n"
+
+    def test_get_chunk_writer_with_binary_format_and_text_sink(self):
+        with pytest.raises(ValueError):
+            get_chunk_writer(io.StringIO(), "binary", "utf-8")
+
+    def test_get_chunk_writer_with_binary_sink(self):
+        sink = io.BytesIO()
+
+        get_chunk_writer(sink, "binary", "utf-8")(b"PGCOPY")
+
+        assert sink.getvalue() == b"PGCOPY"
+
+
 @pytest.mark.skipif(
     condition="USE_REAL_CONNECTION" not in os.environ
     or os.environ["USE_REAL_CONNECTION"].lower() != "true",
@@ -77,6 +413,127 @@ class TestTuruPostgres:
 
         assert list(cursor) == [Row(id=1), Row(id=2)]
 
+    def test_copy_in(self, connection: Connection):
+        connection.execute("create temp table copy_rows (name text, id integer)")
+
+        cursor = connection.copy_in("copy_rows", (Row(id=i) for i in range(3)))
+
+        assert cursor.rowcount == 3
+        assert connection.execute_map(Row, "select id from copy_rows").fetchall() == [
+            Row(id=0),
+            Row(id=1),
+            Row(id=2),
+        ]
+
+    def test_copy_in_mixed_value_types(self, connection: Connection):
+        connection.execute("create temp table copy_rows (id numeric, score float8)")
+
+        cursor = connection.copy_in(
+            "copy_rows", [(decimal.Decimal("1.5"), 1.5), (2, 2), (None, None)]
+        )
+
+        assert cursor.rowcount == 3
+
+    def test_copy_in_binary_format(self, connection: Connection):
+        connection.execute("create temp table copy_rows (id integer, name text)")
+
+        cursor = connection.copy_in(
+            "copy_rows", [(1, "a"), (2, None)], ("id", "name"), format="binary"
+        )
+
+        assert cursor.rowcount == 2
+        assert connection.execute("select * from copy_rows").fetchall() == [
+            (1, "a"),
+            (2, None),
+        ]
+
+    def test_copy_in_text_format(self, connection: Connection):
+        connection.execute("create temp table copy_rows (id integer, name text)")
+
+        cursor = connection.copy_in("copy_rows", [("1", "a")], ("id", "name"))
+
+        assert cursor.rowcount == 1
+        assert connection.execute("select * from copy_rows").fetchall() == [(1, "a")]
+
+    def test_copy_out(self, connection: Connection):
+        sink = io.BytesIO()
+
+        cursor = connection.copy_out("select 1 as id union all select 2", sink)
+
+        assert cursor.rowcount == 2
+        assert sink.getvalue() == b"id\n1\n2\n"
+
+    def test_copy_out_to_text_file(self, connection: Connection):
+        sink = io.StringIO()
+
+        connection.copy_out("select %s as name", sink, ("a",), header=False)
+
+        assert sink.getvalue() == "a\n"
+
+    def test_execute_map_server_side(self, connection: Connection):
+        cursor = connection.execute_map(
+            Row,
+            "select * from generate_series(1, 5)",
+            server_side=True,
+            itersize=2,
+        )
+
+        assert cursor.fetchmany(2) == [Row(id=1), Row(id=2)]
+        assert list(cursor) == [Row(id=3), Row(id=4), Row(id=5)]
+
+    def test_prepare_server_side(self, connection: Connection):
+        operation = connection.prepare("select 1")
+
+        with connection.cursor(server_side=True) as cursor:
+            assert cursor.execute_map(Row, operation).fetchall() == [Row(id=1)]
+
+    def test_cursor_server_side(self, connection: Connection):
+        with connection.cursor(server_side=True, name="turu_test") as cursor:
+            cursor.execute_map(Row, "select 1 union all select 2")
+
+            assert cursor.fetchall() == [Row(id=1), Row(id=2)]
+
+    def test_stream_map(self, connection: Connection):
+        rows = connection.stream_map(Row, "select * from generate_series(1, 3)")
+
+        assert list(rows) == [Row(id=1), Row(id=2), Row(id=3)]
+
+    def test_stream_map_early_exit(self, connection: Connection):
+        cursor = connection.cursor()
+        rows = cursor.stream_map(Row, "select * from generate_series(1, 1000000)")
+
+        assert next(rows) == Row(id=1)
+        rows.close()
+
+        assert cursor.execute("select 1").fetchone() == (1,)
+
+    def test_pipeline(self, connection: Connection):
+        with connection.pipeline():
+            first = connection.execute_map(Row, "select 1")
+            second = connection.execute_map(Row, "select 2")
+
+        assert first.fetchall() == [Row(id=1)]
+        assert second.fetchall() == [Row(id=2)]
+
+    def test_prepare(self, connection: Connection):
+        operation = connection.prepare("select %s::int")
+
+        assert connection.execute_map(Row, operation, (1,)).fetchall() == [Row(id=1)]
+        assert connection.execute_map(Row, operation, (2,)).fetchall() == [Row(id=2)]
+        assert connection.prepare_stats.prepared == 1
+        assert connection.prepare_stats.hits == 1
+
+    def test_executemany_map_returning(self, connection: Connection):
+        connection.execute("create temp table returning_rows (id serial, name text)")
+
+        cursor = connection.executemany_map(
+            Row,
+            "insert into returning_rows (name) values (%s) returning id",
+            [("a",), ("b",), ("c",)],
+        )
+
+        assert cursor.fetchall() == [Row(id=1), Row(id=2), Row(id=3)]
+
     def test_connection_close(self, connection: Connection):
         connection.close()
 
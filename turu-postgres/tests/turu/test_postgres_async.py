@@ -1,3 +1,4 @@
+import io
 import os
 
 import pytest
@@ -88,6 +89,77 @@ class TestTuruPostgresAsync:
         ) as cursor:
             assert [row async for row in cursor] == [Row(id=1), Row(id=2)]
 
+    @pytest.mark.asyncio
+    async def test_copy_in(self, async_connection: AsyncConnection):
+        await async_connection.execute("create temp table copy_rows (id integer)")
+
+        cursor = await async_connection.copy_in("copy_rows", [Row(id=1), Row(id=2)])
+
+        assert cursor.rowcount == 2
+
+    @pytest.mark.asyncio
+    async def test_copy_out(self, async_connection: AsyncConnection):
+        sink = io.BytesIO()
+
+        cursor = await async_connection.copy_out(
+            "select 1 as id union all select 2", sink, format="text"
+        )
+
+        assert cursor.rowcount == 2
+        assert sink.getvalue() == b"1\n2\n"
+
+    @pytest.mark.asyncio
+    async def test_execute_map_server_side(self, async_connection: AsyncConnection):
+        async with await async_connection.execute_map(
+            Row,
+            "select * from generate_series(1, 3)",
+            server_side=True,
+            itersize=2,
+        ) as cursor:
+            assert [row async for row in cursor] == [Row(id=1), Row(id=2), Row(id=3)]
+
+    @pytest.mark.asyncio
+    async def test_stream_map(self, async_connection: AsyncConnection):
+        rows = async_connection.stream_map(Row, "select * from generate_series(1, 3)")
+
+        assert [row async for row in rows] == [Row(id=1), Row(id=2), Row(id=3)]
+
+    @pytest.mark.asyncio
+    async def test_stream_map_early_exit(self, async_connection: AsyncConnection):
+        cursor = await async_connection.cursor()
+        rows = cursor.stream_map(Row, "select * from generate_series(1, 1000000)")
+
+        async for row in rows:
+            assert row == Row(id=1)
+            break
+
+        await rows.aclose()
+
+        assert await (await cursor.execute("select 1")).fetchone() == (1,)
+
+    @pytest.mark.asyncio
+    async def test_pipeline(self, async_connection: AsyncConnection):
+        async with async_connection.pipeline():
+            first = await async_connection.execute_map(Row, "select 1")
+            second = await async_connection.execute_map(Row, "select 2")
+
+        assert await first.fetchall() == [Row(id=1)]
+        assert await second.fetchall() == [Row(id=2)]
+
+    @pytest.mark.asyncio
+    async def test_executemany_map_returning(self, async_connection: AsyncConnection):
+        await async_connection.execute(
+            "create temp table returning_rows (id serial, name text)"
+        )
+
+        cursor = await async_connection.executemany_map(
+            Row,
+            "insert into returning_rows (name) values (%s) returning id",
+            [("a",), ("b",)],
+        )
+
+        assert [row async for row in cursor] == [Row(id=1), Row(id=2)]
+
     @pytest.mark.asyncio
     async def test_connection_close(self, async_connection: AsyncConnection):
         await async_connection.close()
@@ -1,10 +1,11 @@
+import io
 from dataclasses import dataclass
 
 import pytest
 from pydantic import BaseModel
 from turu.core import tag
 from turu.core.mock.exception import TuruMockResponseTypeMismatchError
-from turu.postgres import MockConnection
+from turu.postgres import MockConnection, PrepareStats
 
 
 class Row(BaseModel):
@@ -68,6 +69,49 @@ class TestTuruPostgresMock:
         with mock_connection.cursor().executemany("select 1", []) as cursor:
             assert cursor.fetchall() == expected
 
+    def test_copy_in(self, mock_connection: MockConnection):
+        mock_connection.inject_response(None, None)
+
+        mock_connection.copy_in("rows", [Row(id=1), Row(id=2)])
+
+    def test_copy_out(self, mock_connection: MockConnection):
+        mock_connection.inject_response(None, None)
+
+        mock_connection.copy_out("select 1", io.BytesIO())
+
+    def test_execute_map_server_side(self, mock_connection: MockConnection):
+        expected = [Row(id=1), Row(id=2)]
+        mock_connection.inject_response(Row, expected)
+
+        with mock_connection.execute_map(
+            Row, "select 1 union all select 2", server_side=True, itersize=1
+        ) as cursor:
+            assert list(cursor) == expected
+
+    def test_stream_map(self, mock_connection: MockConnection):
+        expected = [Row(id=1), Row(id=2)]
+        mock_connection.inject_response(Row, expected)
+
+        assert list(mock_connection.stream_map(Row, "select 1 union all select 2")) == (
+            expected
+        )
+
+    def test_pipeline(self, mock_connection: MockConnection):
+        mock_connection.inject_response(Row, [Row(id=1)])
+
+        with mock_connection.pipeline():
+            cursor = mock_connection.execute_map(Row, "select 1")
+
+        assert cursor.fetchall() == [Row(id=1)]
+
+    def test_prepare(self, mock_connection: MockConnection):
+        mock_connection.inject_response(Row, [Row(id=1)])
+
+        operation = mock_connection.prepare("select 1")
+
+        assert mock_connection.execute_map(Row, operation).fetchall() == [Row(id=1)]
+        assert mock_connection.prepare_stats == PrepareStats()
+
     def test_executemany_map(self, mock_connection: MockConnection):
         expected = [Row(id=1), Row(id=2)]
         mock_connection.inject_response(Row, expected)
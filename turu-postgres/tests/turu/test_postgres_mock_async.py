@@ -1,3 +1,4 @@
+import io
 from dataclasses import dataclass
 
 import pytest
@@ -96,6 +97,36 @@ class TestTuruPostgresMockAsync:
         ) as cursor:
             assert await cursor.fetchall() == expected
 
+    @pytest.mark.asyncio
+    async def test_copy_in(self, mock_async_connection: MockAsyncConnection):
+        mock_async_connection.inject_response(None, None)
+
+        await mock_async_connection.copy_in("rows", [Row(id=1), Row(id=2)])
+
+    @pytest.mark.asyncio
+    async def test_copy_out(self, mock_async_connection: MockAsyncConnection):
+        mock_async_connection.inject_response(None, None)
+
+        await mock_async_connection.copy_out("select 1", io.BytesIO())
+
+    @pytest.mark.asyncio
+    async def test_stream_map(self, mock_async_connection: MockAsyncConnection):
+        expected = [Row(id=1), Row(id=2)]
+        mock_async_connection.inject_response(Row, expected)
+
+        rows = mock_async_connection.stream_map(Row, "select 1 union all select 2")
+
+        assert [row async for row in rows] == expected
+
+    @pytest.mark.asyncio
+    async def test_pipeline(self, mock_async_connection: MockAsyncConnection):
+        mock_async_connection.inject_response(Row, [Row(id=1)])
+
+        async with mock_async_connection.pipeline():
+            cursor = await mock_async_connection.execute_map(Row, "select 1")
+
+        assert await cursor.fetchall() == [Row(id=1)]
+
     @pytest.mark.asyncio
     async def test_execute_iter(self, mock_async_connection: MockAsyncConnection):
         expected = [(1,), (2,)]
@@ -7,9 +7,12 @@ References:
 
 import importlib.metadata
 
+from ._session import SessionContext as SessionContext
 from .async_connection import AsyncConnection as AsyncConnection
+from .async_connection_pool import AsyncConnectionPool as AsyncConnectionPool
 from .async_cursor import AsyncCursor as AsyncCursor
 from .connection import Connection as Connection
+from .connection_pool import ConnectionPool as ConnectionPool
 from .cursor import Cursor as Cursor
 from .mock_async_connection import MockAsyncConnection as MockAsyncConnection
 from .mock_async_cursor import MockAsyncCursor as MockAsyncCursor
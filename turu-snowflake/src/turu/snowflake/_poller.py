@@ -0,0 +1,190 @@
+import asyncio
+import weakref
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import snowflake.connector
+
+INITIAL_POLL_INTERVAL = 0.01
+"""The seconds to wait before checking the status of a query for the first time."""
+
+MAX_POLL_INTERVAL = 1.0
+"""The maximum seconds between the status checks of a query."""
+
+POLL_BACKOFF = 1.5
+"""The factor to lengthen the interval by after each status check of a running query."""
+
+
+@dataclass
+class _PendingQuery:
+    future: "asyncio.Future[None]"
+    interval: float
+    next_check: float
+
+
+class QueryStatusPoller:
+    """Waits for the async queries of a connection in a single background task.
+
+    Each query is checked with an exponential backoff from `initial_interval` up to `max_interval`,
+    and the queries due at the same time are checked together in `executor`,
+    so that the event loop never blocks on the status requests.
+    """
+
+    def __init__(
+        self,
+        connection: snowflake.connector.SnowflakeConnection,
+        *,
+        executor: Optional[Executor] = None,
+        initial_interval: float = INITIAL_POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+        backoff: float = POLL_BACKOFF,
+    ) -> None:
+        self._connection = weakref.ref(connection)
+        self.executor = executor
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._queries: Dict[str, _PendingQuery] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    async def wait(self, query_id: str) -> None:
+        """Wait until the query is no longer running.
+
+        Raises:
+            snowflake.connector.errors.Error: Checking the status of the query failed.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        query = self._queries.get(query_id)
+        if query is None:
+            query = self._queries[query_id] = _PendingQuery(
+                loop.create_future(),
+                self._initial_interval,
+                loop.time() + self._initial_interval,
+            )
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
+        await asyncio.shield(query.future)
+
+    async def _run(self) -> None:
+        """Poll until no query is pending, failing the pending queries if polling fails."""
+
+        try:
+            await self._poll()
+
+        except Exception as error:
+            self._fail(error)
+
+        except BaseException:
+            self._fail(None)
+            raise
+
+        finally:
+            self._task = None
+            self._wakeup = None
+
+    def _fail(self, error: Optional[Exception]) -> None:
+        """Set `error` on the pending queries, or cancel them without it."""
+
+        queries, self._queries = self._queries, {}
+        for query in queries.values():
+            if query.future.done():
+                continue
+
+            if error is None:
+                query.future.cancel()
+
+            else:
+                query.future.set_exception(error)
+
+    async def _poll(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while self._queries:
+            now = loop.time()
+            next_check = min(query.next_check for query in self._queries.values())
+            if next_check > now:
+                self._wakeup = asyncio.Event()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), next_check - now)
+
+                except asyncio.TimeoutError:
+                    pass
+
+                continue
+
+            query_ids = [
+                query_id
+                for query_id, query in self._queries.items()
+                if query.next_check <= now
+            ]
+            results = await loop.run_in_executor(self.executor, self._check, query_ids)
+
+            now = loop.time()
+            for query_id, result in zip(query_ids, results):
+                query = self._queries[query_id]
+                if result is True:
+                    query.interval = min(
+                        query.interval * self._backoff, self._max_interval
+                    )
+                    query.next_check = now + query.interval
+
+                    continue
+
+                del self._queries[query_id]
+                if query.future.done():
+                    continue
+
+                if isinstance(result, BaseException):
+                    query.future.set_exception(result)
+
+                else:
+                    query.future.set_result(None)
+
+    def _check(self, query_ids: List[str]) -> List[Union[bool, BaseException]]:
+        """Return whether each query is still running, or the error to check it."""
+
+        connection = self._connection()
+        results: List[Union[bool, BaseException]] = []
+        for query_id in query_ids:
+            try:
+                if connection is None:
+                    raise ReferenceError("the connection is already closed")
+
+                results.append(
+                    connection.is_still_running(connection.get_query_status(query_id))
+                )
+
+            except Exception as error:
+                results.append(error)
+
+        return results
+
+
+_POLLERS: "weakref.WeakKeyDictionary[snowflake.connector.SnowflakeConnection, QueryStatusPoller]" = weakref.WeakKeyDictionary()
+
+
+def get_query_status_poller(
+    connection: snowflake.connector.SnowflakeConnection,
+    executor: Optional[Executor] = None,
+) -> QueryStatusPoller:
+    """Return the poller shared by the async queries of `connection`,
+    which checks their status in `executor`.
+    """
+
+    poller = _POLLERS.get(connection)
+    if poller is None:
+        poller = _POLLERS[connection] = QueryStatusPoller(connection, executor=executor)
+
+    else:
+        poller.executor = executor
+
+    return poller
@@ -0,0 +1,124 @@
+from typing import Optional, Tuple, TypedDict
+
+from typing_extensions import Literal
+
+import snowflake.connector
+
+SessionContextKey = Literal["role", "warehouse", "database", "schema"]
+
+
+class SessionContext(TypedDict, total=False):
+    """The context of a Snowflake session, which is switched by `use` statements."""
+
+    role: str
+    warehouse: str
+    database: str
+    schema: str
+
+
+SESSION_CONTEXT_KEYS: Tuple[SessionContextKey, ...] = (
+    "role",
+    "warehouse",
+    "database",
+    "schema",
+)
+"""The order to switch the session context in, since `use database` resets the schema."""
+
+
+def normalize_identifier(name: str) -> str:
+    """Normalize an identifier the way Snowflake resolves it.
+
+    Unquoted identifiers are case-insensitive and stored in upper case.
+    """
+
+    if len(name) >= 2 and name.startswith('"') and name.endswith('"'):
+        return name[1:-1].replace('""', '"')
+
+    return name.upper()
+
+
+def quote_identifier(name: str) -> str:
+    """Quote `name` as the Snowflake identifier it names.
+
+    Lower case names are upper-cased first, since they name the columns
+    that are created with unquoted, case-insensitive identifiers.
+    """
+
+    if name.islower():
+        name = name.upper()
+
+    return '"' + name.replace('"', '""') + '"'
+
+
+def get_session_context(
+    connection: snowflake.connector.SnowflakeConnection,
+) -> SessionContext:
+    """Return the session context of `connection`.
+
+    The connector keeps it in sync with the server after the login and each query,
+    so the names are the resolved ones, such as upper case for unquoted identifiers.
+    """
+
+    context = SessionContext()
+    for key in SESSION_CONTEXT_KEYS:
+        value: Optional[str] = getattr(connection, key, None)
+        if value is not None:
+            context[key] = value
+
+    return context
+
+
+def get_session_changes(
+    current: SessionContext, context: SessionContext
+) -> SessionContext:
+    """Return the fields of `context` that differ from `current`, in the order to switch them.
+
+    The names of `current` are the resolved ones, and the names of `context` are identifiers.
+    The schema of `context` is always included when the database changes,
+    since `use database` resets the schema.
+    """
+
+    changes = SessionContext()
+    for key in SESSION_CONTEXT_KEYS:
+        value = context.get(key)
+        if value is None:
+            continue
+
+        if normalize_identifier(value) != current.get(key) or (
+            key == "schema" and "database" in changes
+        ):
+            changes[key] = value
+
+    return changes
+
+
+def fill_session_context(
+    context: SessionContext, login_context: SessionContext
+) -> SessionContext:
+    """Return `context` with the fields it leaves out taken from `login_context`.
+
+    The names of `login_context` are the resolved ones, so they are quoted as they are.
+    Its schema is left out when `context` switches to another database,
+    since the schema belongs to the login database.
+    """
+
+    switches_database = "database" in context and normalize_identifier(
+        context["database"]
+    ) != login_context.get("database")
+
+    filled = SessionContext()
+    for key in SESSION_CONTEXT_KEYS:
+        value = context.get(key)
+        if value is not None:
+            filled[key] = value
+
+        elif key in login_context and not (key == "schema" and switches_database):
+            filled[key] = '"' + login_context[key].replace('"', '""') + '"'
+
+    return filled
+
+
+def render_use_statements(context: SessionContext) -> str:
+    """Render the `use` statements to switch to `context`, as a multi-statement request."""
+
+    return "; ".join(f"use {key} {name}" for key, name in context.items())
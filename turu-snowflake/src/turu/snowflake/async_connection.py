@@ -1,8 +1,11 @@
+import asyncio
 import os
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    List,
     Optional,
     Sequence,
     Tuple,
@@ -19,6 +22,11 @@ import turu.core.async_connection
 import turu.core.cursor
 import turu.core.mock
 from turu.core.cursor import GenericNewRowType
+from turu.snowflake._session import (
+    SessionContext,
+    get_session_changes,
+    get_session_context,
+)
 from turu.snowflake.cursor import GenericNewPandasDataFrame, GenericNewPyArrowTable
 from turu.snowflake.features import (
     GenericNewPanderaDataFrameModel,
@@ -30,12 +38,30 @@ from turu.snowflake.features import (
 if TYPE_CHECKING:
     from asn1crypto.keys import RSAPrivateKey
 
-from .async_cursor import AsyncCursor, ExecuteOptions
+from .async_cursor import AsyncCursor, ExecuteMapOptions, ExecuteOptions
+
+
+MapQuery = Union[Tuple[Type[Any], str], Tuple[Type[Any], str, Optional[Any]]]
+"""A query of `gather_map`, which is a `row_type` and an operation with optional parameters."""
 
 
 class AsyncConnection(turu.core.async_connection.AsyncConnection):
-    def __init__(self, connection: snowflake.connector.SnowflakeConnection):
+    """
+    An async connection to a Snowflake database.
+
+    The blocking calls of the connector run in `executor`,
+    which defaults to the default executor of the event loop.
+    """
+
+    def __init__(
+        self,
+        connection: snowflake.connector.SnowflakeConnection,
+        *,
+        executor: Optional[Executor] = None,
+    ):
         self._raw_connection = connection
+        self._executor = executor
+        self._login_session_context = get_session_context(connection)
 
     @classmethod
     @override
@@ -53,6 +79,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         private_key: "Union[str ,bytes ,RSAPrivateKey, None]" = None,
         private_key_file: Union[str, Path, None] = None,
         private_key_passphrase: Union[str, bytes, None] = None,
+        executor: Optional[Executor] = None,
         **kwargs,
     ) -> Self:
         if isinstance(private_key_file, (str, Path)):
@@ -82,7 +109,8 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
                 role=role,
                 private_key=private_key,
                 **kwargs,
-            )
+            ),
+            executor=executor,
         )
 
     @classmethod
@@ -146,7 +174,33 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
 
     @override
     async def cursor(self) -> AsyncCursor[Never, Never, Never]:
-        return AsyncCursor(self._raw_connection.cursor())
+        return AsyncCursor(self._raw_connection.cursor(), executor=self._executor)
+
+    @property
+    def session_context(self) -> SessionContext:
+        """The current role, warehouse, database and schema of the session."""
+
+        return get_session_context(self._raw_connection)
+
+    @property
+    def login_session_context(self) -> SessionContext:
+        """The role, warehouse, database and schema that the session started with."""
+
+        return SessionContext(self._login_session_context)
+
+    async def use_session(self, **context: Unpack[SessionContext]) -> Self:
+        """Switch the session context in a single request,
+        skipping the fields the session already uses.
+
+        Parameters:
+            context: The role, warehouse, database and schema to use.
+        """
+
+        if get_session_changes(self.session_context, context):
+            async with await self.cursor() as cursor:
+                cursor.use_session(**context)
+
+        return self
 
     @override
     async def execute(
@@ -206,7 +260,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[GenericNewRowType, Never, Never]": ...
 
     @overload
@@ -216,7 +270,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[Never, GenericNewPandasDataFrame, Never]": ...
 
     @overload
@@ -226,7 +280,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[Never, Never, GenericNewPyArrowTable]": ...
 
     @overload
@@ -236,7 +290,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> (
         "AsyncCursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]"
     ): ...
@@ -253,7 +307,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         parameters: Optional[Any] = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor":
         """
         Execute a database operation (query or command) and map each row to a `row_type`.
@@ -265,7 +319,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
-            options: snowflake connector options
+            options: snowflake connector options and options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
@@ -288,7 +342,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> AsyncCursor[GenericNewRowType, Never, Never]: ...
 
     @overload
@@ -298,7 +352,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> AsyncCursor[Never, GenericNewPandasDataFrame, Never]: ...
 
     @overload
@@ -308,7 +362,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> AsyncCursor[Never, Never, GenericNewPyArrowTable]: ...
 
     @overload
@@ -318,7 +372,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> (
         "AsyncCursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]"
     ): ...
@@ -335,7 +389,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor":
         """Execute a database operation (query or command) against all parameter sequences or mappings.
 
@@ -345,7 +399,7 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
         Parameters:
             operation: A database operation (query or command).
             seq_of_parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
-            options: snowflake connector options
+            options: snowflake connector options and options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
@@ -360,3 +414,56 @@ class AsyncConnection(turu.core.async_connection.AsyncConnection):
                 **options,
             ),
         )
+
+    async def gather_map(
+        self,
+        queries: Sequence[MapQuery],
+        /,
+        **options: Unpack[ExecuteMapOptions],
+    ) -> List["AsyncCursor"]:
+        """Execute the queries concurrently on this connection, and map each row to its `row_type`.
+
+        The queries are submitted at once as Snowflake async queries,
+        and their completion is awaited together by the status poller of the connection.
+        When one of them fails, the others are aborted before the error is raised.
+
+        ```python
+        users, orders = await connection.gather_map(
+            [
+                (User, "SELECT * FROM users"),
+                (Order, "SELECT * FROM orders WHERE user_id = %s", (1,)),
+            ]
+        )
+        ```
+
+        Parameters:
+            queries: The pairs of a `row_type` and an operation,
+                or the triples with the parameters of the operation.
+            options: snowflake connector options and options for mapping rows,
+                which are applied to all the queries.
+
+        Returns:
+            The cursors that hold a reference to each operation, in the order of `queries`.
+        """
+
+        cursors = [await self.cursor() for _ in queries]
+        tasks = [
+            asyncio.ensure_future(cursor._execute_map_async(*query, **options))
+            for cursor, query in zip(cursors, queries)
+        ]
+
+        try:
+            results = await asyncio.gather(*tasks)
+
+        except BaseException:
+            # NOTE: The cancelled queries are aborted on the warehouse by their cursors.
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for cursor in cursors:
+                await cursor.close()
+
+            raise
+
+        return cast(List[AsyncCursor], results)
@@ -0,0 +1,104 @@
+from typing import AsyncContextManager, Optional, TypeVar
+
+from typing_extensions import Unpack, override
+
+import turu.core.pool
+import turu.core.pool.connection_pool
+from turu.snowflake._session import (
+    SessionContext,
+    fill_session_context,
+    get_session_changes,
+)
+
+from .async_connection import AsyncConnection
+
+GenericAsyncConnection = TypeVar("GenericAsyncConnection", bound=AsyncConnection)
+
+
+class AsyncConnectionPool(turu.core.pool.AsyncConnectionPool[GenericAsyncConnection]):
+    """An asyncio pool of Snowflake connections,
+    which hands out the idle sessions already in the requested context.
+
+    ```python
+    async with turu.snowflake.AsyncConnectionPool(
+        lambda: turu.snowflake.connect_async_from_env(), max_size=10
+    ) as pool:
+        async with pool.connection(role="ANALYST") as connection:
+            cursor = await connection.execute_map(Row, "SELECT * FROM users")
+            rows = await cursor.fetchall()
+    ```
+
+    When no idle session is in the context, the least recently used one is switched
+    with `use` statements, which is cheaper than opening a new session.
+    The context fields that are not given are switched back to the ones the session
+    logged in with, so that no borrower inherits the context of the previous one.
+    The tasks waiting for a connection are still served in the FIFO order,
+    so a released session is handed to the first of them whatever its context.
+
+    See `turu.core.pool.AsyncConnectionPool` for the parameters.
+    """
+
+    @override
+    async def acquire(
+        self, timeout: Optional[float] = None, /, **context: Unpack[SessionContext]
+    ) -> GenericAsyncConnection:
+        """Check out a connection in the session context,
+        waiting for one to be released if the pool is full.
+
+        The connection must be returned by `.release()`.
+        Prefer `.connection()`, which does it automatically.
+
+        Parameters:
+            timeout: The seconds to wait, which defaults to the timeout of the pool.
+            context: The role, warehouse, database and schema to use.
+
+        Raises:
+            TuruPoolTimeoutError: No connection became available in time.
+            TuruPoolClosedError: The pool is closed.
+        """
+
+        connection = await self._acquire(timeout, context)
+        try:
+            await connection.use_session(
+                **fill_session_context(context, connection.login_session_context)
+            )
+
+        except BaseException:
+            await self.discard(connection)
+            raise
+
+        return connection
+
+    @override
+    def connection(
+        self, timeout: Optional[float] = None, /, **context: Unpack[SessionContext]
+    ) -> AsyncContextManager[GenericAsyncConnection]:
+        """Check out a connection in the session context for the `async with` block.
+
+        The connection is rolled back when it is returned after the block,
+        and it is closed instead if the rollback fails.
+
+        Parameters:
+            timeout: The seconds to wait, which defaults to the timeout of the pool.
+            context: The role, warehouse, database and schema to use.
+        """
+
+        return self._lend(lambda: self.acquire(timeout, **context))
+
+    @override
+    def _take_idle(
+        self, affinity: Optional[SessionContext]
+    ) -> turu.core.pool.connection_pool.PoolEntry[GenericAsyncConnection]:
+        for entry in reversed(self._idle):
+            connection = entry.connection
+            if not get_session_changes(
+                connection.session_context,
+                fill_session_context(
+                    affinity or SessionContext(), connection.login_session_context
+                ),
+            ):
+                self._idle.remove(entry)
+
+                return entry
+
+        return self._idle.popleft() if affinity else self._idle.pop()
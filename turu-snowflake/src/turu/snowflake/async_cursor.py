@@ -1,14 +1,19 @@
 import asyncio
+import functools
+from concurrent.futures import Executor
 from typing import (
     Any,
     AsyncIterator,
+    Callable,
     Generic,
+    Iterator,
     List,
     Optional,
     Sequence,
     Tuple,
     Type,
     TypedDict,
+    TypeVar,
     Union,
     cast,
     overload,
@@ -18,10 +23,19 @@ import turu.core.async_cursor
 import turu.core.cursor
 import turu.core.mock
 import turu.core.tag
-from turu.core.cursor import map_row
+from turu.core.cursor import map_row, map_rows
 from turu.snowflake.cursor import (
     GenericNewRowType,
     GenericRowType,
+    _pop_map_options,
+)
+from turu.snowflake._poller import get_query_status_poller
+from turu.snowflake._session import (
+    SessionContext,
+    get_session_changes,
+    get_session_context,
+    quote_identifier,
+    render_use_statements,
 )
 from turu.snowflake.features import (
     GenericNewPandasDataFrame,
@@ -38,6 +52,10 @@ from typing_extensions import Never, Self, Unpack, override
 
 import snowflake.connector
 
+GenericResult = TypeVar("GenericResult")
+
+_END: Any = object()
+
 
 class ExecuteOptions(TypedDict, total=False):
     timeout: int
@@ -46,18 +64,27 @@ class ExecuteOptions(TypedDict, total=False):
     num_statements: int
 
 
+class ExecuteMapOptions(ExecuteOptions, turu.core.cursor.MapOptions, total=False):
+    pass
+
+
 class AsyncCursor(
     Generic[GenericRowType, GenericPandasDataFrame, GenericPyArrowTable],
     turu.core.async_cursor.AsyncCursor[GenericRowType, Any],
 ):
+    _quote_identifier = staticmethod(quote_identifier)
+
     def __init__(
         self,
         cursor: snowflake.connector.cursor.SnowflakeCursor,
         *,
         row_type: Optional[Type[GenericRowType]] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
         self._raw_cursor = cursor
+        self._executor = executor
         self._row_type: Optional[Type[GenericRowType]] = row_type
+        self._map_options: turu.core.cursor.ResolvedMapOptions = {}
 
     @property
     def rowcount(self) -> int:
@@ -71,6 +98,11 @@ class AsyncCursor(
     def arraysize(self, size: int) -> None:
         self._raw_cursor.arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     async def close(self) -> None:
         self._raw_cursor.close()
@@ -96,6 +128,7 @@ class AsyncCursor(
 
         await self._execute_async(operation, parameters, **options)
         self._row_type = None
+        self._map_options = {}
 
         return cast(AsyncCursor, self)
 
@@ -124,6 +157,7 @@ class AsyncCursor(
 
         self._raw_cursor.executemany(operation, seq_of_parameters, **options)
         self._row_type = None
+        self._map_options = {}
 
         return cast(AsyncCursor, self)
 
@@ -134,7 +168,7 @@ class AsyncCursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[GenericNewRowType, Never, Never]": ...
 
     @overload
@@ -144,7 +178,7 @@ class AsyncCursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[Never, GenericNewPandasDataFrame, Never]": ...
 
     @overload
@@ -154,7 +188,7 @@ class AsyncCursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[Never, Never, GenericNewPyArrowTable]": ...
 
     @overload
@@ -164,7 +198,7 @@ class AsyncCursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> (
         "AsyncCursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]"
     ): ...
@@ -181,7 +215,7 @@ class AsyncCursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor":
         """
         Execute a database operation (query or command) and map each row to a `row_type`.
@@ -190,14 +224,18 @@ class AsyncCursor(
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
-            options: snowflake connector options
+            options: snowflake connector options and options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
 
+        map_options = _pop_map_options(options)
         self._raw_cursor.execute(operation, parameters, **options)
         self._row_type = cast(Type[GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            map_options, self._raw_cursor.description
+        )
 
         return cast(AsyncCursor, self)
 
@@ -208,7 +246,7 @@ class AsyncCursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[GenericNewRowType, Never, Never]": ...
 
     @overload
@@ -218,7 +256,7 @@ class AsyncCursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[Never, GenericNewPandasDataFrame, Never]": ...
 
     @overload
@@ -228,7 +266,7 @@ class AsyncCursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor[Never, Never, GenericNewPyArrowTable]": ...
 
     @overload
@@ -238,7 +276,7 @@ class AsyncCursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> (
         "AsyncCursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]"
     ): ...
@@ -255,7 +293,7 @@ class AsyncCursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "AsyncCursor":
         """Execute a database operation (query or command) against all parameter sequences or mappings.
 
@@ -265,14 +303,18 @@ class AsyncCursor(
         Parameters:
             operation: A database operation (query or command).
             seq_of_parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
-            options: snowflake connector options
+            options: snowflake connector options and options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
 
+        map_options = _pop_map_options(options)
         self._raw_cursor.executemany(operation, seq_of_parameters, **options)
         self._row_type = cast(Type[GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            map_options, self._raw_cursor.description
+        )
 
         return cast(AsyncCursor, self)
 
@@ -302,47 +344,61 @@ class AsyncCursor(
 
     @override
     async def fetchone(self) -> Optional[GenericRowType]:
-        row = self._raw_cursor.fetchone()
+        row = await self._run_in_executor(self._raw_cursor.fetchone)
         if row is None:
             return None
 
         elif self._row_type is not None:
-            return map_row(self._row_type, row)
+            return map_row(self._row_type, row, **self._map_options)
 
         else:
             return row  # type: ignore[return-value]
 
     @override
     async def fetchmany(self, size: Optional[int] = None) -> List[GenericRowType]:
-        return [
-            map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchmany(
-                size if size is not None else self.arraysize
-            )
-        ]
+        return map_rows(
+            self._row_type,
+            await self._run_in_executor(
+                self._raw_cursor.fetchmany,
+                size if size is not None else self.arraysize,
+            ),
+            **self._map_options,
+        )
 
     @override
     async def fetchall(self) -> List[GenericRowType]:
-        return [map_row(self._row_type, row) for row in self._raw_cursor.fetchall()]
+        return map_rows(
+            self._row_type,
+            await self._run_in_executor(self._raw_cursor.fetchall),
+            **self._map_options,
+        )
+
+    @override
+    async def _fetchmany_raw(self, size: int) -> List[Any]:
+        return await self._run_in_executor(self._raw_cursor.fetchmany, size)
 
-    async def fetch_arrow_all(self) -> GenericPyArrowTable:
+    async def fetch_arrow_all(self) -> GenericPyArrowTable:  # type: ignore[override]
         """Fetches a single Arrow Table."""
 
         return cast(
             GenericPyArrowTable,
-            self._raw_cursor.fetch_arrow_all(force_return_table=True),
+            await self._run_in_executor(
+                self._raw_cursor.fetch_arrow_all, force_return_table=True
+            ),
         )
 
-    async def fetch_arrow_batches(self) -> AsyncIterator[GenericPyArrowTable]:
+    async def fetch_arrow_batches(self) -> AsyncIterator[GenericPyArrowTable]:  # type: ignore[override]
         """Fetches Arrow Tables in batches, where 'batch' refers to Snowflake Chunk."""
 
-        for batch in self._raw_cursor.fetch_arrow_batches():
+        async for batch in self._iterate_in_executor(
+            self._raw_cursor.fetch_arrow_batches()
+        ):
             yield cast(GenericPyArrowTable, batch)
 
     async def fetch_pandas_all(self, **kwargs: Any) -> GenericPandasDataFrame:
         """Fetch Pandas dataframes."""
 
-        df = self._raw_cursor.fetch_pandas_all(**kwargs)
+        df = await self._run_in_executor(self._raw_cursor.fetch_pandas_all, **kwargs)
 
         if self._row_type and issubclass(self._row_type, PanderaDataFrameModel):
             df = self._row_type.validate(df, inplace=True)  # type: ignore[union-attr]
@@ -354,7 +410,9 @@ class AsyncCursor(
     ) -> AsyncIterator[GenericPandasDataFrame]:
         """Fetch Pandas dataframes in batches, where 'batch' refers to Snowflake Chunk."""
 
-        for batch in self._raw_cursor.fetch_pandas_batches(**kwargs):
+        async for batch in self._iterate_in_executor(
+            self._raw_cursor.fetch_pandas_batches(**kwargs)
+        ):
             yield cast(
                 GenericPandasDataFrame,
                 batch,
@@ -362,42 +420,52 @@ class AsyncCursor(
 
     @override
     async def __anext__(self) -> GenericRowType:
-        next_row = self._raw_cursor.fetchone()
+        next_row = await self._run_in_executor(self._raw_cursor.fetchone)
 
         if next_row is None:
             raise StopAsyncIteration()
 
         if self._row_type is not None:
-            return map_row(self._row_type, next_row)
+            return map_row(self._row_type, next_row, **self._map_options)
 
         else:
             return next_row  # type: ignore[return-value]
 
     def use_warehouse(self, warehouse: str, /) -> Self:
-        """Use a warehouse in cursor."""
-
-        self._raw_cursor.execute(f"use warehouse {warehouse}")
+        """Use a warehouse in cursor, unless the session already uses it."""
 
-        return self
+        return self.use_session(warehouse=warehouse)
 
     def use_database(self, database: str, /) -> Self:
-        """Use a database in cursor."""
-
-        self._raw_cursor.execute(f"use database {database}")
+        """Use a database in cursor, unless the session already uses it."""
 
-        return self
+        return self.use_session(database=database)
 
     def use_schema(self, schema: str, /) -> Self:
-        """Use a schema in cursor."""
-
-        self._raw_cursor.execute(f"use schema {schema}")
+        """Use a schema in cursor, unless the session already uses it."""
 
-        return self
+        return self.use_session(schema=schema)
 
     def use_role(self, role: str, /) -> Self:
-        """Use a role in cursor."""
+        """Use a role in cursor, unless the session already uses it."""
+
+        return self.use_session(role=role)
+
+    def use_session(self, **context: Unpack[SessionContext]) -> Self:
+        """Switch the session context in a single request,
+        skipping the fields the session already uses.
 
-        self._raw_cursor.execute(f"use role {role}")
+        Parameters:
+            context: The role, warehouse, database and schema to use.
+        """
+
+        changes = get_session_changes(
+            get_session_context(self._raw_cursor.connection), context
+        )
+        if changes:
+            self._raw_cursor.execute(
+                render_use_statements(changes), num_statements=len(changes)
+            )
 
         return self
 
@@ -409,15 +477,77 @@ class AsyncCursor(
         **options: Unpack[ExecuteOptions],
     ) -> None:
         cur = self._raw_cursor
-        cur.execute_async(operation, parameters, **options)
-        conn = cur.connection
-        query_id = cur.sfqid
+        submission = asyncio.ensure_future(
+            self._run_in_executor(cur.execute_async, operation, parameters, **options)
+        )
 
-        if query_id:
-            while conn.is_still_running(conn.get_query_status(query_id)):
-                await asyncio.sleep(0.01)
+        try:
+            # NOTE: The submission goes on when cancelled, so that the query can be aborted.
+            await asyncio.shield(submission)
+            if cur.sfqid:
+                await get_query_status_poller(cur.connection, self._executor).wait(
+                    cur.sfqid
+                )
+
+        except BaseException:
+            await asyncio.wait({submission})
+            if submission.exception() is None and cur.sfqid:
+                await self._abort_query(cur.sfqid)
+
+            raise
+
+        if cur.sfqid:
+            await self._run_in_executor(cur.get_results_from_sfqid, cur.sfqid)
+
+    async def _abort_query(self, query_id: str) -> None:
+        """Abort the async query on the warehouse, such as after its waiter was cancelled."""
+
+        try:
+            await self._run_in_executor(self._raw_cursor.abort_query, query_id)
+
+        except Exception:
+            # NOTE: The query may have finished meanwhile, and the original error matters more.
+            pass
+
+    async def _execute_map_async(
+        self,
+        row_type: Type[Any],
+        operation: str,
+        parameters: Optional[Any] = None,
+        /,
+        **options: Unpack[ExecuteMapOptions],
+    ) -> "AsyncCursor":
+        """Like `.execute_map()`, but run the operation as a Snowflake async query,
+        so that the event loop and the queries of the other cursors go on meanwhile.
+        """
+
+        map_options = _pop_map_options(options)
+        await self._execute_async(operation, parameters, **options)
+        self._row_type = cast(Type[GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            map_options, self._raw_cursor.description
+        )
+
+        return cast(AsyncCursor, self)
+
+    async def _run_in_executor(
+        self, func: Callable[..., GenericResult], /, *args: Any, **kwargs: Any
+    ) -> GenericResult:
+        """Run a blocking call of the connector in the executor of the cursor."""
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _iterate_in_executor(
+        self, iterator: Iterator[GenericResult]
+    ) -> AsyncIterator[GenericResult]:
+        """Iterate a blocking iterator of the connector,
+        such as the one downloading a result chunk on each step, in the executor.
+        """
 
-            cur.get_results_from_sfqid(query_id)
+        while (item := await self._run_in_executor(next, iterator, _END)) is not _END:
+            yield cast(GenericResult, item)
 
     @property
     def _AsyncRecordCursor(
@@ -20,6 +20,11 @@ import turu.core.cursor
 import turu.core.mock
 import turu.snowflake.cursor
 from turu.core.cursor import GenericNewRowType
+from turu.snowflake._session import (
+    SessionContext,
+    get_session_changes,
+    get_session_context,
+)
 from turu.snowflake.features import (
     GenericNewPanderaDataFrameModel,
     PandasDataFrame,
@@ -29,6 +34,7 @@ from turu.snowflake.features import (
 
 from .cursor import (
     Cursor,
+    ExecuteMapOptions,
     ExecuteOptions,
     GenericNewPandasDataFrame,
     GenericNewPyArrowTable,
@@ -48,6 +54,7 @@ class Connection(turu.core.connection.Connection):
 
     def __init__(self, connection: snowflake.connector.SnowflakeConnection):
         self._raw_connection = connection
+        self._login_session_context = get_session_context(connection)
 
     @override
     @classmethod
@@ -160,6 +167,32 @@ class Connection(turu.core.connection.Connection):
     def cursor(self) -> Cursor[Never, Never, Never]:
         return Cursor(self._raw_connection.cursor())
 
+    @property
+    def session_context(self) -> SessionContext:
+        """The current role, warehouse, database and schema of the session."""
+
+        return get_session_context(self._raw_connection)
+
+    @property
+    def login_session_context(self) -> SessionContext:
+        """The role, warehouse, database and schema that the session started with."""
+
+        return SessionContext(self._login_session_context)
+
+    def use_session(self, **context: Unpack[SessionContext]) -> Self:
+        """Switch the session context in a single request,
+        skipping the fields the session already uses.
+
+        Parameters:
+            context: The role, warehouse, database and schema to use.
+        """
+
+        if get_session_changes(self.session_context, context):
+            with self.cursor() as cursor:
+                cursor.use_session(**context)
+
+        return self
+
     @override
     def execute(
         self,
@@ -216,7 +249,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor[GenericNewRowType, Never, Never]: ...
 
     @overload
@@ -226,7 +259,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor[Never, GenericNewPandasDataFrame, Never]: ...
 
     @overload
@@ -236,7 +269,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor[Never, Never, GenericNewPyArrowTable]: ...
 
     @overload
@@ -246,7 +279,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]: ...
 
     @override
@@ -261,7 +294,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor:
         """
         Execute a database operation (query or command) and map each row to a `row_type`.
@@ -273,7 +306,7 @@ class Connection(turu.core.connection.Connection):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
-            options: snowflake connector options
+            options: snowflake connector options and options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
@@ -296,7 +329,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor[GenericNewRowType, Never, Never]: ...
 
     @overload
@@ -306,7 +339,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor[Never, GenericNewPandasDataFrame, Never]: ...
 
     @overload
@@ -316,7 +349,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor[Never, Never, GenericNewPyArrowTable]: ...
 
     @overload
@@ -326,7 +359,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]: ...
 
     @override
@@ -341,7 +374,7 @@ class Connection(turu.core.connection.Connection):
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> Cursor:
         """Execute a database operation (query or command) against all parameter sequences or mappings.
 
@@ -352,7 +385,7 @@ class Connection(turu.core.connection.Connection):
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             seq_of_parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
-            options: snowflake connector options
+            options: snowflake connector options and options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
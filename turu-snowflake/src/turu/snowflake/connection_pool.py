@@ -0,0 +1,102 @@
+from typing import ContextManager, Optional, TypeVar
+
+from typing_extensions import Unpack, override
+
+import turu.core.pool
+import turu.core.pool.connection_pool
+from turu.snowflake._session import (
+    SessionContext,
+    fill_session_context,
+    get_session_changes,
+)
+
+from .connection import Connection
+
+GenericConnection = TypeVar("GenericConnection", bound=Connection)
+
+
+class ConnectionPool(turu.core.pool.ConnectionPool[GenericConnection]):
+    """A thread-safe pool of Snowflake connections,
+    which hands out the idle sessions already in the requested context.
+
+    ```python
+    pool = turu.snowflake.ConnectionPool(
+        lambda: turu.snowflake.connect_from_env(), max_size=10
+    )
+
+    with pool.connection(role="ANALYST", warehouse="COMPUTE_WH") as connection:
+        rows = connection.execute_map(Row, "SELECT * FROM users").fetchall()
+    ```
+
+    When no idle session is in the context, the least recently used one is switched
+    with `use` statements, which is cheaper than opening a new session.
+    The context fields that are not given are switched back to the ones the session
+    logged in with, so that no borrower inherits the context of the previous one.
+
+    See `turu.core.pool.ConnectionPool` for the parameters.
+    """
+
+    @override
+    def acquire(
+        self, timeout: Optional[float] = None, /, **context: Unpack[SessionContext]
+    ) -> GenericConnection:
+        """Check out a connection in the session context,
+        waiting for one to be released if the pool is full.
+
+        The connection must be returned by `.release()`.
+        Prefer `.connection()`, which does it automatically.
+
+        Parameters:
+            timeout: The seconds to wait, which defaults to the timeout of the pool.
+            context: The role, warehouse, database and schema to use.
+
+        Raises:
+            TuruPoolTimeoutError: No connection became available in time.
+            TuruPoolClosedError: The pool is closed.
+        """
+
+        connection = self._acquire(timeout, context)
+        try:
+            connection.use_session(
+                **fill_session_context(context, connection.login_session_context)
+            )
+
+        except BaseException:
+            self.discard(connection)
+            raise
+
+        return connection
+
+    @override
+    def connection(
+        self, timeout: Optional[float] = None, /, **context: Unpack[SessionContext]
+    ) -> ContextManager[GenericConnection]:
+        """Check out a connection in the session context for the `with` block.
+
+        The connection is rolled back when it is returned after the block,
+        and it is closed instead if the rollback fails.
+
+        Parameters:
+            timeout: The seconds to wait, which defaults to the timeout of the pool.
+            context: The role, warehouse, database and schema to use.
+        """
+
+        return self._lend(lambda: self.acquire(timeout, **context))
+
+    @override
+    def _take_idle(
+        self, affinity: Optional[SessionContext]
+    ) -> turu.core.pool.connection_pool.PoolEntry[GenericConnection]:
+        for entry in reversed(self._idle):
+            connection = entry.connection
+            if not get_session_changes(
+                connection.session_context,
+                fill_session_context(
+                    affinity or SessionContext(), connection.login_session_context
+                ),
+            ):
+                self._idle.remove(entry)
+
+                return entry
+
+        return self._idle.popleft() if affinity else self._idle.pop()
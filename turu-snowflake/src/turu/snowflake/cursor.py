@@ -17,6 +17,13 @@ import turu.core.cursor
 import turu.core.mock
 import turu.core.tag
 from turu.core.cursor import GenericNewRowType, GenericRowType
+from turu.snowflake._session import (
+    SessionContext,
+    get_session_changes,
+    get_session_context,
+    quote_identifier,
+    render_use_statements,
+)
 from turu.snowflake.features import (
     GenericNewPandasDataFrame,
     GenericNewPanderaDataFrameModel,
@@ -41,6 +48,10 @@ class ExecuteOptions(TypedDict, total=False):
     """number of statements"""
 
 
+class ExecuteMapOptions(ExecuteOptions, turu.core.cursor.MapOptions, total=False):
+    pass
+
+
 class Cursor(
     Generic[GenericRowType, GenericPandasDataFrame, GenericPyArrowTable],
     turu.core.cursor.Cursor[GenericRowType, Any],
@@ -51,6 +62,8 @@ class Cursor(
     This class is a wrapper around the `snowflake.connector.cursor.SnowflakeCursor` class.
     """
 
+    _quote_identifier = staticmethod(quote_identifier)
+
     def __init__(
         self,
         cursor: snowflake.connector.cursor.SnowflakeCursor,
@@ -59,6 +72,7 @@ class Cursor(
     ) -> None:
         self._raw_cursor = cursor
         self._row_type: Optional[Type[GenericRowType]] = row_type
+        self._map_options: turu.core.cursor.ResolvedMapOptions = {}
 
     @property
     def rowcount(self) -> int:
@@ -72,6 +86,11 @@ class Cursor(
     def arraysize(self, size: int) -> None:
         self._raw_cursor.arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     def close(self) -> None:
         self._raw_cursor.close()
@@ -97,6 +116,7 @@ class Cursor(
 
         self._raw_cursor.execute(operation, parameters, **options)
         self._row_type = None
+        self._map_options = {}
 
         return cast(Cursor, self)
 
@@ -122,6 +142,7 @@ class Cursor(
 
         self._raw_cursor.executemany(operation, seq_of_parameters, **options)
         self._row_type = None
+        self._map_options = {}
 
         return cast(Cursor, self)
 
@@ -132,7 +153,7 @@ class Cursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor[GenericNewRowType, Never, Never]": ...
 
     @overload
@@ -142,7 +163,7 @@ class Cursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor[Never, GenericNewPandasDataFrame, Never]": ...
 
     @overload
@@ -152,7 +173,7 @@ class Cursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor[Never,  Never, GenericNewPyArrowTable]": ...
 
     @overload
@@ -162,7 +183,7 @@ class Cursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]": ...
 
     @override
@@ -177,7 +198,7 @@ class Cursor(
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor":
         """
         Execute a database operation (query or command) and map each row to a `row_type`.
@@ -186,14 +207,18 @@ class Cursor(
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
-            options: snowflake connector options
+            options: snowflake connector options and options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
 
+        map_options = _pop_map_options(options)
         self._raw_cursor.execute(operation, parameters, **options)
         self._row_type = cast(Type[GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            map_options, self._raw_cursor.description
+        )
 
         return cast(Cursor, self)
 
@@ -204,7 +229,7 @@ class Cursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor[GenericNewRowType, Never, Never]":
         pass
 
@@ -215,7 +240,7 @@ class Cursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor[Never, GenericNewPandasDataFrame, Never]":
         pass
 
@@ -226,7 +251,7 @@ class Cursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor[Never, Never, GenericNewPyArrowTable]":
         pass
 
@@ -237,7 +262,7 @@ class Cursor(
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]": ...
 
     @override
@@ -252,7 +277,7 @@ class Cursor(
         operation: str,
         seq_of_parameters: "Sequence[Any]",
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "Cursor":
         """Execute a database operation (query or command) against all parameter sequences or mappings.
 
@@ -260,14 +285,18 @@ class Cursor(
             row_type: The type of the row that will be returned.
             operation: A database operation (query or command).
             seq_of_parameters: Parameters may be provided as sequence or mapping and will be bound to variables in the operation.
-            options: snowflake connector options
+            options: snowflake connector options and options for mapping rows to `row_type`.
 
         Returns:
             A cursor that holds a reference to an operation.
         """
 
+        map_options = _pop_map_options(options)
         self._raw_cursor.executemany(operation, seq_of_parameters, **options)
         self._row_type = cast(Type[GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            map_options, self._raw_cursor.description
+        )
 
         return cast(Cursor, self)
 
@@ -296,26 +325,28 @@ class Cursor(
             return None
 
         elif self._row_type is not None:
-            return turu.core.cursor.map_row(self._row_type, row)
+            return turu.core.cursor.map_row(self._row_type, row, **self._map_options)
 
         else:
             return row  # type: ignore[return-value]
 
     @override
     def fetchmany(self, size: Optional[int] = None) -> List[GenericRowType]:
-        return [
-            turu.core.cursor.map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchmany(
-                size if size is not None else self.arraysize
-            )
-        ]
+        return turu.core.cursor.map_rows(
+            self._row_type,
+            self._raw_cursor.fetchmany(size if size is not None else self.arraysize),
+            **self._map_options,
+        )
 
     @override
     def fetchall(self) -> List[GenericRowType]:
-        return [
-            turu.core.cursor.map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchall()
-        ]
+        return turu.core.cursor.map_rows(
+            self._row_type, self._raw_cursor.fetchall(), **self._map_options
+        )
+
+    @override
+    def _fetchmany_raw(self, size: int) -> List[Any]:
+        return self._raw_cursor.fetchmany(size)
 
     @override
     def __next__(self) -> GenericRowType:
@@ -325,12 +356,14 @@ class Cursor(
             raise StopIteration()
 
         if self._row_type is not None:
-            return turu.core.cursor.map_row(self._row_type, next_row)
+            return turu.core.cursor.map_row(
+                self._row_type, next_row, **self._map_options
+            )
 
         else:
             return next_row  # type: ignore[return-value]
 
-    def fetch_arrow_all(self) -> GenericPyArrowTable:
+    def fetch_arrow_all(self) -> GenericPyArrowTable:  # type: ignore[override]
         """Fetches a single Arrow Table."""
 
         return cast(
@@ -338,7 +371,7 @@ class Cursor(
             self._raw_cursor.fetch_arrow_all(force_return_table=True),
         )
 
-    def fetch_arrow_batches(self) -> "Iterator[GenericPyArrowTable]":
+    def fetch_arrow_batches(self) -> "Iterator[GenericPyArrowTable]":  # type: ignore[override]
         """Fetches Arrow Tables in batches, where 'batch' refers to Snowflake Chunk."""
 
         return cast(
@@ -363,30 +396,40 @@ class Cursor(
         )
 
     def use_warehouse(self, warehouse: str, /) -> Self:
-        """Use a warehouse in cursor."""
+        """Use a warehouse in cursor, unless the session already uses it."""
 
-        self._raw_cursor.execute(f"use warehouse {warehouse}")
-
-        return self
+        return self.use_session(warehouse=warehouse)
 
     def use_database(self, database: str, /) -> Self:
-        """Use a database in cursor."""
-
-        self._raw_cursor.execute(f"use database {database}")
+        """Use a database in cursor, unless the session already uses it."""
 
-        return self
+        return self.use_session(database=database)
 
     def use_schema(self, schema: str, /) -> Self:
-        """Use a schema in cursor."""
+        """Use a schema in cursor, unless the session already uses it."""
 
-        self._raw_cursor.execute(f"use schema {schema}")
-
-        return self
+        return self.use_session(schema=schema)
 
     def use_role(self, role: str, /) -> Self:
-        """Use a role in cursor."""
+        """Use a role in cursor, unless the session already uses it."""
 
-        self._raw_cursor.execute(f"use role {role}")
+        return self.use_session(role=role)
+
+    def use_session(self, **context: Unpack[SessionContext]) -> Self:
+        """Switch the session context in a single request,
+        skipping the fields the session already uses.
+
+        Parameters:
+            context: The role, warehouse, database and schema to use.
+        """
+
+        changes = get_session_changes(
+            get_session_context(self._raw_cursor.connection), context
+        )
+        if changes:
+            self._raw_cursor.execute(
+                render_use_statements(changes), num_statements=len(changes)
+            )
 
         return self
 
@@ -395,3 +438,16 @@ class Cursor(
         import turu.snowflake.record.record_cursor
 
         return turu.snowflake.record.record_cursor.RecordCursor
+
+
+def _pop_map_options(options: ExecuteMapOptions) -> turu.core.cursor.MapOptions:
+    """Split the options for mapping rows from the snowflake connector options."""
+
+    return cast(
+        turu.core.cursor.MapOptions,
+        {
+            key: options.pop(key)  # type: ignore[misc]
+            for key in turu.core.cursor.MapOptions.__annotations__
+            if key in options
+        },
+    )
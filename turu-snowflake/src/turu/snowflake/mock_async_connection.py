@@ -10,6 +10,12 @@ import turu.snowflake.mock_cursor
 from turu.core.cursor import GenericRowType
 from turu.core.mock.connection import CSVOptions
 from turu.core.mock.exception import TuruCsvHeaderOptionRequiredError
+from turu.snowflake._session import (
+    SESSION_CONTEXT_KEYS,
+    SessionContext,
+    get_session_changes,
+    normalize_identifier,
+)
 from turu.snowflake.features import (
     USE_PANDAS,
     USE_PYARROW,
@@ -37,11 +43,29 @@ class MockAsyncConnection(turu.core.mock.MockAsyncConnection, AsyncConnection):
 
     def __init__(self, *args, **kwargs):
         turu.core.mock.MockAsyncConnection.__init__(self)
+        self._session_context = SessionContext()
+        for key in SESSION_CONTEXT_KEYS:
+            if (name := kwargs.get(key)) is not None:
+                self._session_context[key] = normalize_identifier(name)
+
+        self._login_session_context = SessionContext(self._session_context)
 
     @override
     async def cursor(self) -> "MockAsyncCursor[Never, Never, Never]":
         return MockAsyncCursor(self._turu_mock_store)
 
+    @property
+    @override
+    def session_context(self) -> SessionContext:
+        return SessionContext(self._session_context)
+
+    @override
+    async def use_session(self, **context: Unpack[SessionContext]) -> Self:
+        for key, name in get_session_changes(self._session_context, context).items():
+            self._session_context[key] = normalize_identifier(name)  # type: ignore[literal-required]
+
+        return self
+
     @overload
     def inject_response(
         self,
@@ -13,6 +13,7 @@ from typing import (
 import turu.core.async_cursor
 import turu.core.mock
 from turu.core.cursor import GenericNewRowType, GenericRowType
+from turu.snowflake._session import SessionContext
 from turu.snowflake.features import (
     GenericNewPandasDataFrame,
     GenericNewPanderaDataFrameModel,
@@ -26,7 +27,7 @@ from turu.snowflake.features import (
 )
 from typing_extensions import Never, Self, Unpack, override
 
-from .async_cursor import AsyncCursor, ExecuteOptions
+from .async_cursor import AsyncCursor, ExecuteMapOptions, ExecuteOptions
 
 
 class MockAsyncCursor(  # type: ignore
@@ -66,7 +67,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor[GenericNewRowType, Never, Never]": ...
 
     @overload
@@ -76,7 +77,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor[Never, GenericNewPandasDataFrame, Never]": ...
 
     @overload
@@ -86,7 +87,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]": ...
 
     @overload
@@ -96,7 +97,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor[Never, Never, GenericNewPyArrowTable]": ...
 
     @override
@@ -111,7 +112,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         parameters: Optional[Any] = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor":
         return cast(
             MockAsyncCursor,
@@ -127,7 +128,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor[GenericNewRowType, Never, Never]": ...
 
     @overload
@@ -137,7 +138,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor[Never, GenericNewPandasDataFrame, Never]": ...
 
     @overload
@@ -147,7 +148,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]": ...
 
     @overload
@@ -157,7 +158,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor[Never, Never, GenericNewPyArrowTable]": ...
 
     @override
@@ -172,7 +173,7 @@ class MockAsyncCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockAsyncCursor":
         return cast(
             MockAsyncCursor,
@@ -183,6 +184,17 @@ class MockAsyncCursor(  # type: ignore
             ),
         )
 
+    @override
+    async def _execute_map_async(
+        self,
+        row_type: Type[Any],
+        operation: str,
+        parameters: Optional[Any] = None,
+        /,
+        **options: Unpack[ExecuteMapOptions],
+    ) -> "MockAsyncCursor":
+        return await self.execute_map(row_type, operation, parameters, **options)
+
     def use_warehouse(self, warehouse: str, /) -> Self:
         return self
 
@@ -195,10 +207,13 @@ class MockAsyncCursor(  # type: ignore
     def use_role(self, role: str, /) -> Self:
         return self
 
-    async def fetch_arrow_all(self) -> GenericPyArrowTable:
+    def use_session(self, **context: Unpack[SessionContext]) -> Self:
+        return self
+
+    async def fetch_arrow_all(self) -> GenericPyArrowTable:  # type: ignore[override]
         return cast(GenericPyArrowTable, await self.fetchone())
 
-    async def fetch_arrow_batches(self) -> AsyncIterator[GenericPyArrowTable]:
+    async def fetch_arrow_batches(self) -> AsyncIterator[GenericPyArrowTable]:  # type: ignore[override]
         yield await self.fetch_arrow_all()
 
     async def fetch_pandas_all(self, **kwargs) -> GenericPandasDataFrame:
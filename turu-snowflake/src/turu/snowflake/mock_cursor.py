@@ -13,6 +13,7 @@ from typing import (
 import turu.core.cursor
 import turu.core.mock
 from turu.core.cursor import GenericNewRowType
+from turu.snowflake._session import SessionContext
 from turu.snowflake.features import (
     GenericNewPandasDataFrame,
     GenericNewPanderaDataFrameModel,
@@ -28,6 +29,7 @@ from typing_extensions import Never, Self, Unpack, override
 
 from .cursor import (
     Cursor,
+    ExecuteMapOptions,
     ExecuteOptions,
 )
 
@@ -65,7 +67,7 @@ class MockCursor(  # type: ignore
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockCursor[GenericNewRowType, Never, Never]": ...
 
     @overload
@@ -75,7 +77,7 @@ class MockCursor(  # type: ignore
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockCursor[Never, GenericNewPandasDataFrame, Never]": ...
 
     @overload
@@ -85,7 +87,7 @@ class MockCursor(  # type: ignore
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> (
         "MockCursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]"
     ): ...
@@ -97,7 +99,7 @@ class MockCursor(  # type: ignore
         operation: str,
         parameters: "Optional[Any]" = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockCursor[Never, Never, GenericNewPyArrowTable]": ...
 
     @override
@@ -112,7 +114,7 @@ class MockCursor(  # type: ignore
         operation: str,
         parameters: Optional[Any] = None,
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockCursor":
         return cast(
             MockCursor,
@@ -128,7 +130,7 @@ class MockCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockCursor[GenericNewRowType, Never, Never]": ...
 
     @overload
@@ -138,7 +140,7 @@ class MockCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockCursor[Never, GenericNewPandasDataFrame, Never]": ...
 
     @overload
@@ -148,7 +150,7 @@ class MockCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> (
         "MockCursor[Never, PanderaDataFrame[GenericNewPanderaDataFrameModel], Never]"
     ): ...
@@ -160,7 +162,7 @@ class MockCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ) -> "MockCursor[Never, Never, GenericNewPyArrowTable]": ...
 
     @override
@@ -175,7 +177,7 @@ class MockCursor(  # type: ignore
         operation: str,
         seq_of_parameters: Sequence[Any],
         /,
-        **options: Unpack[ExecuteOptions],
+        **options: Unpack[ExecuteMapOptions],
     ):
         return cast(
             MockCursor,
@@ -198,10 +200,13 @@ class MockCursor(  # type: ignore
     def use_role(self, role: str, /) -> Self:
         return self
 
-    def fetch_arrow_all(self) -> GenericPyArrowTable:
+    def use_session(self, **context: Unpack[SessionContext]) -> Self:
+        return self
+
+    def fetch_arrow_all(self) -> GenericPyArrowTable:  # type: ignore[override]
         return cast(GenericPyArrowTable, self.fetchone())
 
-    def fetch_arrow_batches(self) -> Iterator[GenericPyArrowTable]:
+    def fetch_arrow_batches(self) -> Iterator[GenericPyArrowTable]:  # type: ignore[override]
         return iter([self.fetch_arrow_all()])
 
     def fetch_pandas_all(self, **kwargs) -> GenericPandasDataFrame:
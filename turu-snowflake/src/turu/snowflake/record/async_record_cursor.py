@@ -49,7 +49,7 @@ class AsyncRecordCursor(  # type: ignore[override]
         async for batch in batches:
             yield batch
 
-    async def fetch_arrow_all(self) -> GenericPyArrowTable:
+    async def fetch_arrow_all(self) -> GenericPyArrowTable:  # type: ignore[override]
         table = await self.__sf_cursor.fetch_arrow_all()
 
         if isinstance(self._recorder, turu.core.record.CsvRecorder):
@@ -64,7 +64,7 @@ class AsyncRecordCursor(  # type: ignore[override]
 
         return table
 
-    async def fetch_arrow_batches(self) -> AsyncIterator[GenericPyArrowTable]:
+    async def fetch_arrow_batches(self) -> AsyncIterator[GenericPyArrowTable]:  # type: ignore[override]
         batches = self.__sf_cursor.fetch_arrow_batches()
 
         if isinstance(self._recorder, turu.core.record.CsvRecorder):
@@ -42,7 +42,7 @@ class RecordCursor(  # type: ignore[override]
 
         return batches
 
-    def fetch_arrow_all(self) -> GenericPyArrowTable:
+    def fetch_arrow_all(self) -> GenericPyArrowTable:  # type: ignore[override]
         table = self.__sf_cursor.fetch_arrow_all()
 
         if isinstance(self._recorder, turu.core.record.CsvRecorder):
@@ -57,7 +57,7 @@ class RecordCursor(  # type: ignore[override]
 
         return table
 
-    def fetch_arrow_batches(self) -> Iterator[GenericPyArrowTable]:
+    def fetch_arrow_batches(self) -> Iterator[GenericPyArrowTable]:  # type: ignore[override]
         batches = self.__sf_cursor.fetch_arrow_batches()
 
         if isinstance(self._recorder, turu.core.record.CsvRecorder):
@@ -2,7 +2,7 @@ import os
 import tempfile
 from pathlib import Path
 from textwrap import dedent
-from typing import NamedTuple, cast
+from typing import Any, NamedTuple, cast
 
 import pytest
 from typing_extensions import Never
@@ -357,3 +357,82 @@ class TestTuruSnowflake:
         ) as cursor:
             with pytest.raises(pandera.errors.SchemaError):
                 cursor.fetch_pandas_all()
+
+
+class FakeSnowflakeConnection:
+    def __init__(self, **context: str) -> None:
+        self.role = context.get("role")
+        self.warehouse = context.get("warehouse")
+        self.database = context.get("database")
+        self.schema = context.get("schema")
+
+
+class FakeSnowflakeCursor:
+    def __init__(self, connection: FakeSnowflakeConnection) -> None:
+        self.connection = connection
+        self.description = None
+        self.executed: list = []
+
+    def execute(self, operation: str, *args, **kwargs) -> None:
+        self.executed.append((operation, kwargs))
+
+
+class TestSessionContext:
+    def test_use_session_skips_current_context(self):
+        raw_cursor = FakeSnowflakeCursor(
+            FakeSnowflakeConnection(role="ANALYST", warehouse="COMPUTE_WH")
+        )
+        cursor = turu.snowflake.Cursor(cast(Any, raw_cursor))
+
+        cursor.use_role("analyst").use_warehouse("compute_wh")
+
+        assert raw_cursor.executed == []
+
+    def test_use_session_batches_changes(self):
+        raw_cursor = FakeSnowflakeCursor(FakeSnowflakeConnection(role="ANALYST"))
+        cursor = turu.snowflake.Cursor(cast(Any, raw_cursor))
+
+        cursor.use_session(
+            schema="public", database="db", warehouse="wh", role="analyst"
+        )
+
+        assert raw_cursor.executed == [
+            (
+                "use warehouse wh; use database db; use schema public",
+                {"num_statements": 3},
+            )
+        ]
+
+    def test_use_session_reissues_schema_after_database(self):
+        raw_cursor = FakeSnowflakeCursor(
+            FakeSnowflakeConnection(database="OTHER_DB", schema="PUBLIC")
+        )
+        cursor = turu.snowflake.Cursor(cast(Any, raw_cursor))
+
+        cursor.use_session(database="db", schema="public")
+
+        assert raw_cursor.executed == [
+            ("use database db; use schema public", {"num_statements": 2})
+        ]
+
+    def test_use_session_with_quoted_identifier(self):
+        raw_cursor = FakeSnowflakeCursor(FakeSnowflakeConnection(database="my db"))
+        cursor = turu.snowflake.Cursor(cast(Any, raw_cursor))
+
+        cursor.use_database('"my db"').use_database("my_db")
+
+        assert raw_cursor.executed == [("use database my_db", {"num_statements": 1})]
+
+
+class TestSelectMap:
+    def test_select_map_quotes_identifiers(self):
+        class Keyword(NamedTuple):
+            order: int
+            userName: str
+
+        raw_cursor = FakeSnowflakeCursor(FakeSnowflakeConnection())
+        cursor = turu.snowflake.Cursor(cast(Any, raw_cursor))
+
+        cursor.select_map(Keyword, "t")
+
+        assert raw_cursor.executed[0][0] == 'SELECT "ORDER", "userName" FROM t'
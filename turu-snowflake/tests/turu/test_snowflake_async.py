@@ -1,8 +1,12 @@
+import asyncio
 import os
+import threading
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import dedent
-from typing import NamedTuple, cast
+from typing import Any, NamedTuple, cast
 
 import pytest
 from typing_extensions import Never
@@ -10,6 +14,7 @@ from typing_extensions import Never
 import turu.snowflake
 from turu.core.record import record_to_csv
 from turu.snowflake import AsyncConnection
+from turu.snowflake._poller import QueryStatusPoller, get_query_status_poller
 from turu.snowflake.features import USE_PANDAS, USE_PANDERA, USE_PYARROW
 
 
@@ -438,3 +443,240 @@ class TestTuruSnowflakeAsyncConnection:
         ) as cursor:
             with pytest.raises(pandera.errors.SchemaError):
                 await cursor.fetch_pandas_all()
+
+
+class FakeSnowflakeConnection:
+    def __init__(self, **checks: int) -> None:
+        self.checks = checks
+        self.status_calls: list = []
+
+    def get_query_status(self, query_id: str) -> int:
+        self.status_calls.append(query_id)
+        if query_id == "error":
+            raise RuntimeError(query_id)
+
+        self.checks[query_id] -= 1
+
+        return self.checks[query_id]
+
+    def is_still_running(self, status: int) -> bool:
+        return status > 0
+
+
+class TestQueryStatusPoller:
+    @pytest.mark.asyncio
+    async def test_wait_many_queries(self):
+        connection = FakeSnowflakeConnection(fast=1, slow=4)
+        poller = QueryStatusPoller(
+            cast(Any, connection), initial_interval=0.001, max_interval=0.004
+        )
+
+        await asyncio.gather(poller.wait("fast"), poller.wait("slow"))
+
+        assert connection.status_calls.count("fast") == 1
+        assert connection.status_calls.count("slow") == 4
+
+    @pytest.mark.asyncio
+    async def test_wait_with_error(self):
+        connection = FakeSnowflakeConnection()
+        poller = QueryStatusPoller(cast(Any, connection), initial_interval=0.001)
+
+        with pytest.raises(RuntimeError):
+            await poller.wait("error")
+
+    @pytest.mark.asyncio
+    async def test_wait_in_executor(self):
+        connection = FakeSnowflakeConnection(query=2)
+        with ThreadPoolExecutor(thread_name_prefix="poller") as executor:
+            poller = get_query_status_poller(cast(Any, connection), executor)
+            threads = []
+            check = poller._check
+
+            def record_check(query_ids):
+                threads.append(threading.current_thread().name)
+                return check(query_ids)
+
+            poller._check = record_check  # type: ignore[method-assign]
+
+            await poller.wait("query")
+
+        assert threads and all(name.startswith("poller") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_wait_when_polling_fails(self):
+        connection = FakeSnowflakeConnection(query=1)
+        poller = QueryStatusPoller(cast(Any, connection), initial_interval=0.001)
+
+        class BrokenExecutor(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                raise RuntimeError("executor is shut down")
+
+        poller.executor = BrokenExecutor()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(
+                asyncio.gather(poller.wait("query"), poller.wait("other")), 1.0
+            )
+
+        assert poller._task is None
+
+        poller.executor = None
+        await asyncio.wait_for(poller.wait("query"), 1.0)
+
+    def test_get_query_status_poller_is_shared(self):
+        connection = cast(Any, FakeSnowflakeConnection())
+
+        assert get_query_status_poller(connection) is get_query_status_poller(
+            connection
+        )
+
+
+class FakeSnowflakeCursor:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.threads: set = set()
+
+    def _record_thread(self) -> None:
+        self.threads.add(threading.current_thread().name)
+
+    def fetchone(self):
+        self._record_thread()
+
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+        self._record_thread()
+        rows, self.rows = self.rows, []
+
+        return rows
+
+    def fetch_arrow_batches(self):
+        for row in self.rows:
+            self._record_thread()
+            yield row
+
+
+class TestAsyncCursorExecutor:
+    @pytest.mark.asyncio
+    async def test_fetch_in_executor(self):
+        raw_cursor = FakeSnowflakeCursor([(1,), (2,), (3,)])
+        with ThreadPoolExecutor(thread_name_prefix="turu-fetch") as executor:
+            cursor = turu.snowflake.AsyncCursor(
+                cast(Any, raw_cursor), executor=executor
+            )
+
+            assert await cursor.fetchone() == (1,)
+            assert [row async for row in cursor] == [(2,), (3,)]
+
+        assert raw_cursor.threads
+        assert all(name.startswith("turu-fetch") for name in raw_cursor.threads)
+
+    @pytest.mark.asyncio
+    async def test_fetch_arrow_batches_in_executor(self):
+        raw_cursor = FakeSnowflakeCursor(["batch1", "batch2"])
+        with ThreadPoolExecutor(thread_name_prefix="turu-fetch") as executor:
+            cursor = turu.snowflake.AsyncCursor(
+                cast(Any, raw_cursor), executor=executor
+            )
+
+            assert [batch async for batch in cursor.fetch_arrow_batches()] == [
+                "batch1",
+                "batch2",
+            ]
+
+        assert all(name.startswith("turu-fetch") for name in raw_cursor.threads)
+
+
+class FakeAsyncQueryConnection:
+    """A Snowflake connection whose async queries each run for `latency` seconds."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.started: dict = {}
+        self.finished: dict = {}
+        self.aborted: list = []
+
+    def cursor(self) -> "FakeAsyncQueryCursor":
+        return FakeAsyncQueryCursor(self)
+
+    def get_query_status(self, query_id: str) -> str:
+        if query_id.endswith("fail"):
+            raise RuntimeError(query_id)
+
+        return query_id
+
+    def is_still_running(self, query_id: str) -> bool:
+        return time.monotonic() - self.started[query_id] < self.latency
+
+
+class FakeAsyncQueryCursor:
+    def __init__(self, connection: FakeAsyncQueryConnection) -> None:
+        self.connection = connection
+        self.sfqid = None
+        self.description = None
+        self.rows: list = []
+
+    def execute_async(self, operation: str, parameters=None, **kwargs) -> None:
+        self.sfqid = operation
+        self.connection.started[operation] = time.monotonic()
+
+    def get_results_from_sfqid(self, query_id: str) -> None:
+        self.connection.finished[query_id] = time.monotonic()
+        self.description = [("id",)]
+        self.rows = [(int(query_id.split()[-1]),)]
+
+    def abort_query(self, query_id: str) -> bool:
+        self.connection.aborted.append(query_id)
+
+        return True
+
+    def fetchall(self) -> list:
+        rows, self.rows = self.rows, []
+
+        return rows
+
+    def close(self) -> None:
+        pass
+
+
+class TestGatherMap:
+    @pytest.mark.asyncio
+    async def test_gather_map_runs_queries_concurrently(self):
+        latency = 0.2
+        raw_connection = FakeAsyncQueryConnection(latency)
+        connection = turu.snowflake.AsyncConnection(cast(Any, raw_connection))
+
+        start = time.monotonic()
+        cursors = await connection.gather_map(
+            [(Row, "SELECT 1"), (Row, "SELECT 2"), (Row, "SELECT 3")]
+        )
+        elapsed = time.monotonic() - start
+
+        assert [await cursor.fetchall() for cursor in cursors] == [
+            [Row(1)],
+            [Row(2)],
+            [Row(3)],
+        ]
+        assert max(raw_connection.started.values()) < min(
+            raw_connection.finished.values()
+        )
+        assert elapsed < 3 * latency
+
+    @pytest.mark.asyncio
+    async def test_gather_map_aborts_queries_on_error(self):
+        raw_connection = FakeAsyncQueryConnection(60.0)
+        connection = turu.snowflake.AsyncConnection(cast(Any, raw_connection))
+
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(
+                connection.gather_map(
+                    [(Row, "SELECT 1"), (Row, "SELECT fail"), (Row, "SELECT 3")]
+                ),
+                5.0,
+            )
+
+        assert sorted(raw_connection.aborted) == [
+            "SELECT 1",
+            "SELECT 3",
+            "SELECT fail",
+        ]
+        assert raw_connection.finished == {}
@@ -12,6 +12,7 @@ from turu.core import tag
 from turu.core.mock.exception import TuruMockResponseTypeMismatchError
 from turu.core.record import record_to_csv
 from turu.snowflake import MockConnection
+from turu.snowflake._session import SessionContext, fill_session_context
 from turu.snowflake.features import (
     USE_PANDAS,
     USE_PANDERA,
@@ -574,3 +575,70 @@ class TestTuruSnowflakeMockConnection:
         with pytest.raises(TuruMockResponseTypeMismatchError):
             with mock_connection.cursor() as cursor:
                 cursor.executemany_with_tag(tag.Update[Table], "UPDATE table", [])
+
+    def test_use_session(self, mock_connection: MockConnection):
+        mock_connection.use_session(role="analyst", warehouse='"compute_wh"')
+
+        assert mock_connection.session_context == {
+            "role": "ANALYST",
+            "warehouse": "compute_wh",
+        }
+
+
+class TestTuruSnowflakeConnectionPool:
+    def test_connection_with_session_context(self):
+        with turu.snowflake.ConnectionPool(MockConnection) as pool:
+            with pool.connection(role="analyst") as connection:
+                assert connection.session_context == {"role": "ANALYST"}
+
+    def test_connection_affinity(self):
+        with turu.snowflake.ConnectionPool(MockConnection) as pool:
+            analyst = pool.acquire(role="analyst")
+            loader = pool.acquire(role="loader")
+            pool.release(analyst)
+            pool.release(loader)
+
+            with pool.connection(role="ANALYST") as connection:
+                assert connection is analyst
+
+            with pool.connection(role="loader") as connection:
+                assert connection is loader
+
+    def test_connection_switches_least_recently_used(self):
+        with turu.snowflake.ConnectionPool(MockConnection) as pool:
+            analyst = pool.acquire(role="analyst")
+            loader = pool.acquire(role="loader")
+            pool.release(analyst)
+            pool.release(loader)
+
+            with pool.connection(role="admin") as connection:
+                assert connection is analyst
+                assert connection.session_context == {"role": "ADMIN"}
+
+            assert pool.size == 2
+
+    def test_connection_restores_login_session_context(self):
+        with turu.snowflake.ConnectionPool(
+            lambda: MockConnection(role="public", database="app", schema="main")
+        ) as pool:
+            with pool.connection() as connection:
+                connection.use_session(role="admin", database="other", schema="secret")
+
+            with pool.connection() as connection:
+                assert connection.session_context == {
+                    "role": "PUBLIC",
+                    "database": "APP",
+                    "schema": "MAIN",
+                }
+
+    def test_fill_session_context(self):
+        login_context = SessionContext(role="PUBLIC", database="APP", schema="MAIN")
+
+        assert fill_session_context(SessionContext(role="admin"), login_context) == {
+            "role": "admin",
+            "database": '"APP"',
+            "schema": '"MAIN"',
+        }
+        assert fill_session_context(
+            SessionContext(database="other"), login_context
+        ) == {"role": '"PUBLIC"', "database": "other"}
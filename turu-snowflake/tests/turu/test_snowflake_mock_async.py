@@ -680,3 +680,75 @@ class TestTuruSnowflakeMockAsyncConnection:
         with pytest.raises(TuruMockResponseTypeMismatchError):
             async with await mock_async_connection.cursor() as cursor:
                 await cursor.executemany_with_tag(tag.Update[Table], "UPDATE table", [])
+
+    @pytest.mark.asyncio
+    async def test_gather_map(self, mock_async_connection: MockAsyncConnection):
+        @dataclass
+        class Other:
+            name: str
+
+        mock_async_connection.inject_response(Row, [Row(1)]).inject_response(
+            Other, [Other("a"), Other("b")]
+        )
+
+        rows, others = await mock_async_connection.gather_map(
+            [(Row, "select 1"), (Other, "select name from other where id = %s", (1,))]
+        )
+
+        assert await rows.fetchall() == [Row(1)]
+        assert await others.fetchall() == [Other("a"), Other("b")]
+
+    @pytest.mark.asyncio
+    async def test_gather_map_with_error(
+        self, mock_async_connection: MockAsyncConnection
+    ):
+        mock_async_connection.inject_response(Row, [Row(1)]).inject_response(
+            Row, ValueError("error")
+        )
+
+        with pytest.raises(ValueError):
+            await mock_async_connection.gather_map(
+                [(Row, "select 1"), (Row, "select 2")]
+            )
+
+
+class TestTuruSnowflakeAsyncConnectionPool:
+    @pytest.mark.asyncio
+    async def test_connection_affinity(self):
+        async def connect() -> MockAsyncConnection:
+            return MockAsyncConnection()
+
+        async with turu.snowflake.AsyncConnectionPool(
+            connect, health_check_interval=None
+        ) as pool:
+            analyst = await pool.acquire(role="analyst")
+            loader = await pool.acquire(role="loader")
+            await pool.release(analyst)
+            await pool.release(loader)
+
+            async with pool.connection(role="ANALYST") as connection:
+                assert connection is analyst
+
+            async with pool.connection(warehouse="compute_wh") as connection:
+                assert connection is loader
+                assert connection.session_context == {
+                    "role": "LOADER",
+                    "warehouse": "COMPUTE_WH",
+                }
+
+    @pytest.mark.asyncio
+    async def test_connection_restores_login_session_context(self):
+        async def connect() -> MockAsyncConnection:
+            return MockAsyncConnection(role="public", warehouse="compute_wh")
+
+        async with turu.snowflake.AsyncConnectionPool(
+            connect, health_check_interval=None
+        ) as pool:
+            async with pool.connection() as connection:
+                await connection.use_session(role="admin", warehouse="loader_wh")
+
+            async with pool.connection() as connection:
+                assert connection.session_context == {
+                    "role": "PUBLIC",
+                    "warehouse": "COMPUTE_WH",
+                }
@@ -1,11 +1,17 @@
-from typing import Any, Iterator, List, Optional, Sequence, Tuple, Type, cast
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, cast
 
 import aiosqlite
 import turu.core.async_cursor
 import turu.core.mock
 import turu.core.tag
-from turu.core.cursor import map_row
-from typing_extensions import Never, override
+from turu.core.cursor import (
+    MapOptions,
+    ResolvedMapOptions,
+    map_row,
+    map_rows,
+    resolve_map_options,
+)
+from typing_extensions import Never, Unpack, override
 
 
 class AsyncCursor(
@@ -21,6 +27,7 @@ class AsyncCursor(
     ):
         self._raw_cursor = cursor
         self._row_type: Optional[Type[turu.core.async_cursor.GenericRowType]] = row_type
+        self._map_options: ResolvedMapOptions = {}
         self._aiter = None
 
     @property
@@ -35,6 +42,11 @@ class AsyncCursor(
     def arraysize(self, size: int) -> None:
         self._raw_cursor.arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     async def close(self) -> None:
         await self._raw_cursor.close()
@@ -45,6 +57,7 @@ class AsyncCursor(
     ) -> "AsyncCursor[Tuple[Any]]":
         await self._raw_cursor.execute(operation, parameters)
         self._row_type = None
+        self._map_options = {}
 
         return cast(AsyncCursor, self)
 
@@ -54,6 +67,7 @@ class AsyncCursor(
     ) -> "AsyncCursor[Tuple[Any]]":
         await self._raw_cursor.executemany(operation, seq_of_parameters)
         self._row_type = None
+        self._map_options = {}
 
         return cast(AsyncCursor, self)
 
@@ -64,9 +78,11 @@ class AsyncCursor(
         operation: str,
         parameters: "Optional[Iterator[Any]]" = None,
         /,
+        **options: Unpack[MapOptions],
     ) -> "AsyncCursor[turu.core.async_cursor.GenericNewRowType]":
         await self._raw_cursor.execute(operation, parameters)
         self._row_type = cast(Type[turu.core.async_cursor.GenericRowType], row_type)
+        self._map_options = resolve_map_options(options, self._raw_cursor.description)
 
         return cast(AsyncCursor, self)
 
@@ -77,9 +93,11 @@ class AsyncCursor(
         operation: str,
         seq_of_parameters: "Sequence[Iterator[Any]]",
         /,
+        **options: Unpack[MapOptions],
     ) -> "AsyncCursor[turu.core.async_cursor.GenericNewRowType]":
         await self._raw_cursor.executemany(operation, seq_of_parameters)
         self._row_type = cast(Type[turu.core.async_cursor.GenericRowType], row_type)
+        self._map_options = resolve_map_options(options, self._raw_cursor.description)
 
         return cast(AsyncCursor, self)
 
@@ -113,26 +131,29 @@ class AsyncCursor(
         if row is None:
             return None
 
-        return _map_row(self._row_type, row)
+        return _map_row(self._row_type, row, **self._map_options)
 
     @override
     async def fetchmany(
         self, size: Optional[int] = None
     ) -> List[turu.core.async_cursor.GenericRowType]:
-        return [
-            _map_row(self._row_type, row)
-            for row in (
-                await self._raw_cursor.fetchmany(
-                    size if size is not None else self.arraysize
-                )
-            )
-        ]
+        return _map_rows(
+            self._row_type,
+            await self._raw_cursor.fetchmany(
+                size if size is not None else self.arraysize
+            ),
+            **self._map_options,
+        )
 
     @override
     async def fetchall(self) -> List[turu.core.async_cursor.GenericRowType]:
-        return [
-            _map_row(self._row_type, row) for row in await self._raw_cursor.fetchall()
-        ]
+        return _map_rows(
+            self._row_type, await self._raw_cursor.fetchall(), **self._map_options
+        )
+
+    @override
+    async def _fetchmany_raw(self, size: int) -> List[Any]:
+        return await self._raw_cursor.fetchmany(size)
 
     @override
     def __aiter__(self) -> "AsyncCursor[turu.core.async_cursor.GenericRowType]":
@@ -145,15 +166,28 @@ class AsyncCursor(
             self._aiter = self._raw_cursor.__aiter__()
 
         next_row = await self._aiter.__anext__()
-        return _map_row(self._row_type, next_row)
+        return _map_row(self._row_type, next_row, **self._map_options)
 
 
 def _map_row(
     row_type: Optional[Type[turu.core.async_cursor.GenericRowType]],
     row: Any,
+    **options: Unpack[ResolvedMapOptions],
 ) -> turu.core.async_cursor.GenericRowType:
     if row_type is None:
         return tuple(row)  # type: ignore
 
     else:
-        return map_row(row_type, row)
+        return map_row(row_type, row, **options)
+
+
+def _map_rows(
+    row_type: Optional[Type[turu.core.async_cursor.GenericRowType]],
+    rows: Iterable[Any],
+    **options: Unpack[ResolvedMapOptions],
+) -> List[turu.core.async_cursor.GenericRowType]:
+    if row_type is None:
+        return [tuple(row) for row in rows]  # type: ignore
+
+    else:
+        return map_rows(row_type, list(rows), **options)
@@ -13,7 +13,7 @@ from typing import (
 import turu.core.cursor
 import turu.core.mock
 import turu.core.tag
-from typing_extensions import Never, override
+from typing_extensions import Never, Unpack, override
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import _Parameters
@@ -30,6 +30,7 @@ class Cursor(
     ):
         self._raw_cursor = cursor
         self._row_type: Optional[Type[turu.core.cursor.GenericRowType]] = row_type
+        self._map_options: turu.core.cursor.ResolvedMapOptions = {}
 
     @property
     def rowcount(self) -> int:
@@ -43,6 +44,11 @@ class Cursor(
     def arraysize(self, size: int) -> None:
         self._raw_cursor.arraysize = size
 
+    @property
+    @override
+    def description(self) -> Optional[Sequence[Sequence[Any]]]:
+        return self._raw_cursor.description
+
     @override
     def close(self) -> None:
         self._raw_cursor.close()
@@ -53,6 +59,7 @@ class Cursor(
     ) -> "Cursor[Tuple[Any]]":
         self._raw_cursor.execute(operation, parameters or ())
         self._row_type = None
+        self._map_options = {}
 
         return cast(Cursor, self)
 
@@ -62,6 +69,7 @@ class Cursor(
     ) -> "Cursor[Tuple[Any]]":
         self._raw_cursor.executemany(operation, seq_of_parameters)
         self._row_type = None
+        self._map_options = {}
 
         return cast(Cursor, self)
 
@@ -72,9 +80,13 @@ class Cursor(
         operation: str,
         parameters: "Optional[_Parameters]" = None,
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "Cursor[turu.core.cursor.GenericNewRowType]":
         self._raw_cursor.execute(operation, parameters or ())
         self._row_type = cast(Type[turu.core.cursor.GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            options, self._raw_cursor.description
+        )
 
         return cast(Cursor, self)
 
@@ -85,9 +97,13 @@ class Cursor(
         operation: str,
         seq_of_parameters: "Sequence[_Parameters]",
         /,
+        **options: Unpack[turu.core.cursor.MapOptions],
     ) -> "Cursor[turu.core.cursor.GenericNewRowType]":
         self._raw_cursor.executemany(operation, seq_of_parameters)
         self._row_type = cast(Type[turu.core.cursor.GenericRowType], row_type)
+        self._map_options = turu.core.cursor.resolve_map_options(
+            options, self._raw_cursor.description
+        )
 
         return cast(Cursor, self)
 
@@ -116,7 +132,7 @@ class Cursor(
             return None
 
         elif self._row_type is not None:
-            return turu.core.cursor.map_row(self._row_type, row)
+            return turu.core.cursor.map_row(self._row_type, row, **self._map_options)
 
         else:
             return row
@@ -125,25 +141,29 @@ class Cursor(
     def fetchmany(
         self, size: Optional[int] = None
     ) -> List[turu.core.cursor.GenericRowType]:
-        return [
-            turu.core.cursor.map_row(self._row_type, row)
-            for row in (
-                self._raw_cursor.fetchmany(size if size is not None else self.arraysize)
-            )
-        ]
+        return turu.core.cursor.map_rows(
+            self._row_type,
+            self._raw_cursor.fetchmany(size if size is not None else self.arraysize),
+            **self._map_options,
+        )
 
     @override
     def fetchall(self) -> List[turu.core.cursor.GenericRowType]:
-        return [
-            turu.core.cursor.map_row(self._row_type, row)
-            for row in self._raw_cursor.fetchall()
-        ]
+        return turu.core.cursor.map_rows(
+            self._row_type, self._raw_cursor.fetchall(), **self._map_options
+        )
+
+    @override
+    def _fetchmany_raw(self, size: int) -> List[Any]:
+        return self._raw_cursor.fetchmany(size)
 
     @override
     def __next__(self) -> turu.core.cursor.GenericRowType:
         next_row = next(self._raw_cursor)
         if self._row_type is not None and next_row is not None:
-            return turu.core.cursor.map_row(self._row_type, next_row)
+            return turu.core.cursor.map_row(
+                self._row_type, next_row, **self._map_options
+            )
 
         else:
             return next_row
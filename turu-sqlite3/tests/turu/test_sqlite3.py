@@ -1,5 +1,7 @@
+import pytest
 import turu.sqlite3
 from pydantic import BaseModel
+from turu.core.features import USE_PYARROW
 from turu.core.record import record_to_csv
 from turu.sqlite3 import Connection
 
@@ -70,6 +72,87 @@ class TestTuruSqlite3:
         assert cursor.fetchall() == [Row(id=1, name="a"), Row(id=2, name="b")]
         assert cursor.fetchall() == []
 
+    def test_execute_map_without_validation(self, connection: Connection):
+        cursor = connection.execute_map(
+            Row, "select 1, 'a' union all select 2, 'b'", validate=False
+        )
+
+        assert cursor.fetchone() == Row(id=1, name="a")
+        assert cursor.fetchall() == [Row(id=2, name="b")]
+
+    def test_execute_resets_map_options(self, connection: Connection):
+        cursor = connection.execute_map(Row, "select 1, 'a'", validate=False)
+        cursor.execute_map(Row, "select '1', 'a'")
+
+        assert cursor.fetchone() == Row(id=1, name="a")
+
+    def test_execute_map_by_name(self, connection: Connection):
+        cursor = connection.execute_map(
+            Row,
+            "select 'a' as name, 0 as extra, 1 as id union all select 'b', 0, 2",
+            by_name=True,
+        )
+
+        assert cursor.fetchone() == Row(id=1, name="a")
+        assert cursor.fetchall() == [Row(id=2, name="b")]
+
+    def test_execute_map_lazy(self, connection: Connection):
+        cursor = connection.execute_map(
+            Row, "select 1, 'a' union all select 2, 'b'", lazy=True
+        )
+
+        assert [row.name for row in cursor.fetchall()] == ["a", "b"]
+
+    def test_select_map(self, connection: Connection):
+        connection.execute(
+            "create temp table users (name text, age integer, id integer)"
+        )
+        connection.executemany(
+            "insert into users values (?, ?, ?)", [("a", 20, 1), ("b", 30, 2)]
+        )
+
+        cursor = connection.select_map(Row, "users where age > ?", (25,))
+
+        assert cursor.fetchall() == [Row(id=2, name="b")]
+
+    def test_iter_batches(self, connection: Connection):
+        cursor = connection.execute_map(
+            Row, "select 1, 'a' union all select 2, 'b' union all select 3, 'c'"
+        )
+
+        assert list(cursor.iter_batches(2)) == [
+            [Row(id=1, name="a"), Row(id=2, name="b")],
+            [Row(id=3, name="c")],
+        ]
+
+    def test_fetch_columns(self, connection: Connection):
+        cursor = connection.execute_map(
+            Row, "select 1 as id, 'a' as name union all select 2, 'b'"
+        )
+
+        columns = cursor.fetch_columns()
+
+        assert list(columns["id"]) == [1, 2]
+        assert columns["name"] == ["a", "b"]
+
+    @pytest.mark.skipif(not USE_PYARROW, reason="pyarrow is not found")
+    def test_fetch_arrow_all(self, connection: Connection):
+        cursor = connection.execute_map(
+            Row, "select 1 as id, 'a' as name union all select 2, 'b'"
+        )
+
+        table = cursor.fetch_arrow_all()
+
+        assert table.to_pydict() == {"id": [1, 2], "name": ["a", "b"]}
+
+    @pytest.mark.skipif(not USE_PYARROW, reason="pyarrow is not found")
+    def test_fetch_arrow_batches(self, connection: Connection):
+        cursor = connection.execute(
+            "select 1 as id union all select 2 union all select 3"
+        )
+
+        assert [batch.num_rows for batch in cursor.fetch_arrow_batches(2)] == [2, 1]
+
     def test_connection_close(self, connection: Connection):
         connection.close()
 
@@ -113,3 +196,16 @@ class TestTuruSqlite3:
         # NOTE: testing code
         mock_connection.inject_response_from_csv(Row, csv_file)
         do_something(mock_connection)
+
+    def test_record_to_csv_lazy(self, connection: Connection):
+        csv_file = TEST_RECORD_DIR / "test_record_to_csv_lazy.csv"
+
+        with record_to_csv(
+            csv_file,
+            connection.execute_map(
+                Row, "select 1, 'taro' union all select 2, 'jiro'", lazy=True
+            ),
+        ) as cursor:
+            assert [row.name for row in cursor.fetchall()] == ["taro", "jiro"]
+
+        assert csv_file.read_text().splitlines() == ["id,name", "1,taro", "2,jiro"]
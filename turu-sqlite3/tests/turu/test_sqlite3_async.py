@@ -84,6 +84,28 @@ class TestTuruSqlite3Async:
         assert await cursor.fetchall() == [Row(1, "a"), Row(2, "b")]
         assert await cursor.fetchall() == []
 
+    @pytest.mark.asyncio
+    async def test_aiter_batches(self, async_connection: AsyncConnection):
+        cursor = await async_connection.execute_map(
+            Row, "select 1, 'a' union all select 2, 'b' union all select 3, 'c'"
+        )
+
+        assert [batch async for batch in cursor.aiter_batches(2)] == [
+            [Row(1, "a"), Row(2, "b")],
+            [Row(3, "c")],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fetch_columns(self, async_connection: AsyncConnection):
+        cursor = await async_connection.execute(
+            "select 1 as id, 'a' as name union all select 2, 'b'"
+        )
+
+        columns = await cursor.fetch_columns()
+
+        assert list(columns["id"]) == [1, 2]
+        assert columns["name"] == ["a", "b"]
+
     @pytest.mark.asyncio
     async def test_connection_commit(self, async_connection: AsyncConnection):
         await async_connection.commit()